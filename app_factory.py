@@ -47,18 +47,18 @@ from routes.models import model_bp
 from routes.api_v1 import api_v1_bp
 from routes.config import FLASK_SECRET_KEY
 from routes.plugins import plugins_bp
-from services.plugin_discovery import (
-    get_all_plugin_csp_domains,
-    discover_plugin_blueprints,
-)
+from services.plugin_discovery import discover_plugin_blueprints
+from services.csp_policy import CompiledCSP
 from routes.plugin_proxies import plugin_proxies_bp
 from routes.i18n import i18n_bp
 
 
-def create_app():
+def create_app(profile_only=False):
     """
     AEGIS Flask Application Factory
     앱 인스턴스를 생성하고 블루프린트 및 설정을 초기화합니다.
+    [v4.3.0] profile_only=True: 플러그인 discovery까지만 수행하고 백그라운드 서비스
+    (로그 싱크, 플러그인 감시, 컨텍스트 푸시, 봇)는 시작하지 않음 (--startup-profile용)
     """
     app = Flask(__name__, template_folder="templates", static_folder="static")
 
@@ -75,6 +75,12 @@ def create_app():
 
     settings = get_settings()
     setup_logging(settings)
+
+    # [v4.3.0] web_debug.log 비동기 싱크 (QueueHandler -> 백그라운드 배치 기록)
+    if not profile_only:
+        from services.log_sink import configure_log_sink
+
+        configure_log_sink(settings.get("debug_log"))
     network_config = settings.get("network", {})
     if not isinstance(network_config, dict):
         network_config = {}
@@ -111,13 +117,28 @@ def create_app():
     app.register_blueprint(i18n_bp)
 
     # [Plugin-X] 동적 백엔드 리포지토리 등록 (Option B)
-    plugin_blueprints = discover_plugin_blueprints()
+    # [v4.3.0] plugin_loading.mode == "lazy" 이면 무거운 플러그인은 최초 요청 시 로드
+    plugin_blueprints = discover_plugin_blueprints(settings.get("plugin_loading"))
     for bp in plugin_blueprints:
         app.register_blueprint(bp)
 
-    # [보안] 플러그인별 선언된 CSP 도메인 수집
-    plugin_csp = get_all_plugin_csp_domains()
-    user_csp = network_config.get("csp_allow_list", {})
+    if profile_only:
+        return app
+
+    # [v4.3.0] 플러그인 자산 변경 감시 -> 변경된 init_pack 세그먼트만 재빌드
+    from services.plugin_watcher import start_plugin_watcher
+
+    start_plugin_watcher(settings.get("plugin_watch"))
+
+    # [v4.3.0] 플러그인 컨텍스트 서버 푸시 (위젯별 폴링 대체)
+    from services.context_publisher import start_context_publisher
+
+    start_context_publisher(settings.get("context_push"))
+
+    # [보안] 코어 + 사용자 설정 + 플러그인 CSP를 미리 컴파일
+    # [v4.3.0] manifest 인덱스 버전 또는 settings.json 변경 시에만 재컴파일
+    compiled_csp = CompiledCSP(os.path.join(app.root_path, "settings.json"))
+    compiled_csp.header()
 
     # 템플릿 제어용 글로벌 함수 등록
     @app.context_processor
@@ -129,50 +150,15 @@ def create_app():
     @app.after_request
     def add_security_headers(response):
         """브라우저 수준의 보안 강화 (v3.4.5 동적 CSP 및 로컬 자산 우선 정책)"""
-
-        def merge_csp(key, core_list):
-            plugin_list = plugin_csp.get(key, [])
-            custom_list = user_csp.get(key, [])
-            # 중복 제거 및 공백 병합
-            return " ".join(set(core_list + plugin_list + custom_list))
-
-        # [v4.1.5] Dynamic CSP generation (Zero Bug Campaign)
-        # Consolidate rules into a dictionary and merge with settings/plugins
-        csp_rules = {
-            "default-src": ["'self'"],
-            "script-src": ["'self'", "'unsafe-inline'", "'unsafe-eval'", "blob:", "https://www.youtube.com", "https://s.ytimg.com"],
-            "style-src": ["'self'", "'unsafe-inline'", "https://fonts.googleapis.com", "https://cdnjs.cloudflare.com"],
-            "img-src": ["'self'", "data:", "blob:"],
-            "font-src": ["'self'", "https://fonts.gstatic.com", "data:", "https://cdnjs.cloudflare.com"],
-            "media-src": ["'self'", "data:", "blob:"],
-            "frame-src": ["'self'", "blob:", "data:", "https://www.youtube.com", "https://www.youtube-nocookie.com"],
-            "connect-src": ["'self'", "ws:", "wss:"]
-        }
-
-        # 1. Merge User Config (settings.json)
-        for key, values in user_csp.items():
-            if key in csp_rules:
-                csp_rules[key] = list(set(csp_rules[key] + values))
-            else:
-                csp_rules[key] = values
-
-        # 2. Merge Plugin Requirements
-        for key, values in plugin_csp.items():
-            if key in csp_rules:
-                csp_rules[key] = list(set(csp_rules[key] + values))
-            else:
-                csp_rules[key] = values
-
-        # [v4.1.5] Build final CSP string accurately
-        csp_string = "; ".join([f"{k} {' '.join(v)}" for k, v in csp_rules.items()])
-        response.headers["Content-Security-Policy"] = csp_string
+        response.headers["Content-Security-Policy"] = compiled_csp.header()
         return response
 
     @app.before_request
     def log_request_info():
         if request.path.startswith("/api/"):
-            with open("web_debug.log", "a", encoding="utf-8") as f:
-                f.write(f"[{request.method}] {request.path}\n")
+            from services.log_sink import debug_log
+
+            debug_log(f"[{request.method}] {request.path}")
 
     # [Safe API Response] API 경로에서 에러 발생 시 HTML 대신 JSON 반환
     from flask import jsonify
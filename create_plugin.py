@@ -227,7 +227,8 @@ import os
 from flask import Blueprint, jsonify, request
 
 # ✅ {c_imports}
-from utils import load_json_config, save_json_config, get_plugin_i18n
+from utils import load_json_config, save_json_config
+from services.i18n_catalog import get_plugin_i18n
 
 # ✅ {c_security}
 from routes.decorators import login_required, standardized_plugin_response
@@ -2,10 +2,15 @@
 AEGIS Tactical Intelligence Dashboard - Entry Point
 """
 
+import sys
+
 from app_factory import create_app
 
+# [v4.3.0] --startup-profile: 백그라운드 서비스를 띄우지 않고 플러그인 부팅 프로파일만 측정
+PROFILE_ONLY = __name__ == "__main__" and "--startup-profile" in sys.argv
+
 # 애플리케이션 인스턴스 생성
-app = create_app()
+app = create_app(profile_only=PROFILE_ONLY)
 
 
 def is_port_in_use(port):
@@ -20,6 +25,14 @@ if __name__ == "__main__":
 
     PORT = 8001
 
+    # [v4.3.0] --startup-profile: 플러그인 부팅 프로파일(JSON)만 출력하고 종료
+    if PROFILE_ONLY:
+        import json
+        from services.plugin_discovery import get_startup_report
+
+        print(json.dumps(get_startup_report(), indent=2, ensure_ascii=False))
+        sys.exit(0)
+
     # [v2.3.2] Flask 리로더(Werkzeug)에 의해 실행되는 자식 프로세스인지 확인
     # 리로더가 실행 중일 때는 이미 부모 프로세스가 포트를 점유하려 하거나
     # 포트 감시 상태이므로 자식 프로세스에서의 중복 체크를 건너뜜.
@@ -28,8 +41,6 @@ if __name__ == "__main__":
             print(
                 f"Error: Port {PORT} is already in use. Please close the other process."
             )
-            import sys
-
             sys.exit(1)
 
     # [v3.4.2] 홈 서버 및 클라우드 환경에서 debug=False 실행 시 발생하는
@@ -2,7 +2,7 @@ import os
 from flask import Blueprint
 from services.bot_gateway import bot_manager
 from .adapter import DiscordAdapter
-from utils import load_json_config
+from services.config_cache import load_json_config
 
 # Flask Blueprint (필요 시 API 확장을 위해 생성)
 discord_adapter_bp = Blueprint("adapter_discord", __name__)
@@ -3,7 +3,7 @@ import logging
 import os
 from datetime import datetime
 import pytz
-from utils import load_settings
+from services.config_cache import load_settings
 
 logger = logging.getLogger(__name__)
 
@@ -146,13 +146,13 @@ class AlarmService:
 
     def _save_to_disk(self):
         """파일에 알람 목록 저장"""
-        from utils import save_json_config
+        from services.config_cache import save_json_config
 
         save_json_config(self.ALARM_FILE, self.alarms, merge=False)
 
     def _load_from_disk(self):
         """파일에서 알람 목록 로드"""
-        from utils import load_json_config
+        from services.config_cache import load_json_config
 
         if os.path.exists(self.ALARM_FILE):
             self.alarms = load_json_config(self.ALARM_FILE)
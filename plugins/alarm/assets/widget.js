@@ -14,8 +14,13 @@ export default {
             this.updateList();
         });
 
-        // 30초마다 자동 갱신
-        setInterval(() => this.updateList(), 30000);
+        // [v4.3.0] 서버 컨텍스트 푸시 구독 (변경 시에만 수신), 푸시 불가 시 30초 폴링 유지
+        this.stopContextUpdates = await context.onContextUpdate((data) => {
+            if (data && Array.isArray(data.active_alarms)) this.render(data.active_alarms);
+        });
+        if (!this.stopContextUpdates.active) {
+            this.updateTimer = setInterval(() => this.updateList(), 30000);
+        }
 
         // Capability: Briefing 등록 (가끔 알람 상태 브리핑)
         context.registerSchedule('alarm-checker', 600, () => {
@@ -63,5 +68,11 @@ export default {
                 <span class="title">${alarm.title}</span>
             </li>
         `).join('');
+    },
+
+    destroy: function () {
+        if (this.updateTimer) clearInterval(this.updateTimer);
+        if (this.stopContextUpdates) this.stopContextUpdates();
+        console.log("[AlarmWidget] Destroyed.");
     }
 }
@@ -1,7 +1,7 @@
 from flask import Blueprint, jsonify
 from services.bot_gateway import bot_manager
 from .alarm_core import alarm_service
-from utils import load_json_config, get_plugin_i18n
+from services.i18n_catalog import get_plugin_i18n
 
 # Flask Blueprint
 alarm_bp = Blueprint("alarm", __name__)
@@ -100,11 +100,9 @@ def initialize_plugin():
         }
 
     # [v3.0.2] manifest.json에서 알리아스 동적 로드 (하드코딩 배제)
-    import os
+    from services.manifest_index import manifest_index
 
-    manifest_path = os.path.join(os.path.dirname(__file__), "manifest.json")
-    manifest = load_json_config(manifest_path)
-    aliases = manifest.get("aliases", [])
+    aliases = manifest_index.get_plugin_aliases("alarm")
 
     register_context_provider(
         plugin_id="alarm", provider_func=alarm_context_provider, aliases=aliases
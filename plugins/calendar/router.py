@@ -2,8 +2,11 @@ import os
 from flask import Blueprint, jsonify
 from routes.decorators import login_required
 from .calendar_service import get_today_events
-from utils import load_json_config, get_plugin_i18n
+from services.config_cache import load_json_config
+from services.i18n_catalog import get_plugin_i18n
 from services.plugin_registry import register_context_provider
+from services.manifest_index import manifest_index
+from services.prompt_encoder import compact_processor
 from services import require_permission
 
 PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -89,7 +92,11 @@ def initialize_plugin():
 
 
 register_context_provider(
-    "calendar", get_calendar_context, aliases=["일정", "달력", "스케줄", "계획"]
+    "calendar",
+    get_calendar_context,
+    ai_processor=compact_processor(get_calendar_context),
+    aliases=manifest_index.get_plugin_aliases("calendar"),
+    freshness={"ttl": 60, "max_stale": 600},
 )
 
 # 플러그인 로드 시 초기화 실행
@@ -22,37 +22,43 @@ export default {
         context.registerCommand('/ac', (cmd) => this.handleCommand(cmd));
         context.registerCommand('/climate-control', (cmd) => this.handleCommand(cmd));
 
-        // 3. 주기적 갱신 (1분)
+        // 3. 갱신: [v4.3.0] 서버 컨텍스트 푸시 구독 (변경 시에만 수신), 푸시 불가 시 1분 폴링 유지
         const refresh = () => this.fetchStatus();
         await refresh();
-        this.updateTimer = setInterval(refresh, 60000);
+        this.stopContextUpdates = await context.onContextUpdate((data) => this.renderStatus(data));
+        if (!this.stopContextUpdates.active) {
+            this.updateTimer = setInterval(refresh, 60000);
+        }
     },
 
     fetchStatus: async function () {
         try {
             const res = await fetch('/api/plugins/climate-control/status');
             const data = await res.json();
+            this.renderStatus(data);
+        } catch (e) {
+            this.context.log("Status fetch failed: " + e.message);
+        }
+    },
 
-            const tempEl = this.root.getElementById('cc-temp');
-            const statusEl = this.root.getElementById('cc-status');
-            const lastUpdateEl = this.root.getElementById('cc-last-update');
-
-            if (tempEl && data.temp !== undefined) {
-                tempEl.textContent = data.temp.toFixed(1);
-            }
+    renderStatus: function (data) {
+        if (!data) return;
+        const tempEl = this.root.getElementById('cc-temp');
+        const statusEl = this.root.getElementById('cc-status');
+        const lastUpdateEl = this.root.getElementById('cc-last-update');
 
-            if (statusEl) {
-                const isOn = data.is_ac_on;
-                statusEl.textContent = isOn ? this.context._t('climate.on') : this.context._t('climate.off');
-                statusEl.className = 'status-text ' + (isOn ? 'on' : 'off');
-            }
+        if (tempEl && data.temp !== undefined) {
+            tempEl.textContent = data.temp.toFixed(1);
+        }
 
-            if (lastUpdateEl) {
-                lastUpdateEl.textContent = new Date().toLocaleTimeString();
-            }
+        if (statusEl) {
+            const isOn = data.is_ac_on;
+            statusEl.textContent = isOn ? this.context._t('climate.on') : this.context._t('climate.off');
+            statusEl.className = 'status-text ' + (isOn ? 'on' : 'off');
+        }
 
-        } catch (e) {
-            this.context.log("Status fetch failed: " + e.message);
+        if (lastUpdateEl) {
+            lastUpdateEl.textContent = new Date().toLocaleTimeString();
         }
     },
 
@@ -101,6 +107,7 @@ export default {
 
     destroy: function () {
         if (this.updateTimer) clearInterval(this.updateTimer);
+        if (this.stopContextUpdates) this.stopContextUpdates();
         this.context.log("Climate Control destroyed.");
     }
 };
@@ -2,7 +2,7 @@ import tinytuya
 import time
 import json
 import os
-from utils import load_json_config, save_json_config
+from services.config_cache import load_json_config, save_json_config
 
 
 class ClimateService:
@@ -2,8 +2,9 @@ import os
 from flask import Blueprint, jsonify, request
 from routes.decorators import login_required
 from .climate_service import ClimateService
-from utils import load_json_config, save_json_config, get_plugin_i18n
-from services.plugin_registry import register_context_provider
+from services.config_cache import load_json_config, save_json_config
+from services.i18n_catalog import get_plugin_i18n
+from services.plugin_registry import register_context_provider, invalidate_context_cache
 
 PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(PLUGIN_DIR, "config.json")
@@ -32,8 +33,12 @@ def get_climate_context():
 aliases = get_plugin_i18n("climate-control", "aliases", lang="ko") + get_plugin_i18n(
     "climate-control", "aliases", lang="en"
 )
+# [v4.3.0] 기본 공급자는 위젯 푸시용 상태 dict, AI에는 기존 문장형 요약 제공
 register_context_provider(
-    "climate-control", get_climate_context, aliases=list(set(aliases))
+    "climate-control",
+    climate_service.get_status,
+    ai_processor=get_climate_context,
+    aliases=list(set(aliases)),
 )
 
 
@@ -56,6 +61,7 @@ def control_ac():
     wind = data.get("wind")
 
     result = climate_service.set_ac(power=power, temp=temp, mode=mode, wind=wind)
+    invalidate_context_cache("climate-control")
     return jsonify(result)
 
 
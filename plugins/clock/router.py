@@ -1,7 +1,7 @@
 import os
 from flask import Blueprint, jsonify
 from routes.decorators import login_required
-from utils import load_json_config
+from services.config_cache import load_json_config
 
 PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(PLUGIN_DIR, "config.json")
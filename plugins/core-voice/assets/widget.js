@@ -51,6 +51,11 @@ export default {
             if (window.AEGIS_TEST_MODE) console.log("[CoreVoice:TRACE] Received SPEAK event from broker:", data);
             this.speak(data);
         });
+        // [v4.3.0] AI 토큰 스트리밍 중간 결과를 말풍선에 표시 (음성 재생 중에는 방해하지 않음)
+        context.on('AI_CHAT_DELTA', (data) => {
+            if (!data || !data.text || this.isSpeaking) return;
+            this.renderer.show(data.text, 'ai');
+        });
         context.on('VOICE_STOP', () => {
             if (window.AEGIS_TEST_MODE) console.log("[CoreVoice:TRACE] Received VOICE_STOP event.");
             this.stop();
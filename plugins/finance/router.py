@@ -2,8 +2,10 @@ import os
 from flask import Blueprint, jsonify
 from routes.decorators import login_required
 from .finance_service import get_market_indices
-from utils import load_json_config, get_plugin_i18n
+from services.config_cache import load_json_config
+from services.i18n_catalog import get_plugin_i18n
 from services.plugin_registry import register_context_provider
+from services.prompt_encoder import compact_processor
 
 PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(PLUGIN_DIR, "config.json")
@@ -23,7 +25,16 @@ def get_finance_context():
 aliases = get_plugin_i18n("finance", "aliases", lang="ko") + get_plugin_i18n(
     "finance", "aliases", lang="en"
 )
-register_context_provider("finance", get_finance_context, aliases=list(set(aliases)))
+register_context_provider(
+    "finance",
+    get_finance_context,
+    # AI에게는 위젯 렌더링용 중복 필드(change_pct_raw, direction)를 뺀 표 형태로 제공
+    ai_processor=compact_processor(
+        get_finance_context, drop_keys=("change_pct_raw", "direction")
+    ),
+    aliases=list(set(aliases)),
+    freshness={"ttl": 60, "max_stale": 600},
+)
 
 
 @finance_plugin_bp.route("/api/plugins/finance/indices")
@@ -2,8 +2,11 @@ import os
 from flask import Blueprint, jsonify
 from routes.decorators import login_required
 from .gmail_service import get_recent_emails
-from utils import load_json_config, get_plugin_i18n
+from services.config_cache import load_json_config
+from services.i18n_catalog import get_plugin_i18n
 from services.plugin_registry import register_context_provider
+from services.manifest_index import manifest_index
+from services.prompt_encoder import compact_processor
 from services import require_permission
 
 PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -70,18 +73,20 @@ def initialize_plugin():
 
 
 # Aliases는 최대한 다양하게 지원 (한/영 통합)
+aliases = manifest_index.get_plugin_aliases("gmail")
 try:
-    aliases = get_plugin_i18n("gmail", "aliases", lang="ko") + get_plugin_i18n(
+    aliases += get_plugin_i18n("gmail", "aliases", lang="ko") + get_plugin_i18n(
         "gmail", "aliases", lang="en"
     )
 except:
-    aliases = ["메일", "gmail"]
+    pass
 
 register_context_provider(
     "gmail",
     get_emails_context,
-    ai_processor=get_emails_ai_context,
+    ai_processor=compact_processor(get_emails_ai_context),
     aliases=list(set(aliases)),
+    freshness={"ttl": 120, "max_stale": 900},
 )
 
 # 초기화 실행
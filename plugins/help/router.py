@@ -54,7 +54,8 @@ def get_help_data():
         if alias not in plugins_info[pid]["aliases"]:
             plugins_info[pid]["aliases"].append(alias)
 
-    from utils import get_i18n, load_settings
+    from services.config_cache import load_settings
+    from services.i18n_catalog import get_i18n
 
     lang = load_settings().get("lang", "ko")
 
@@ -81,7 +82,7 @@ def get_help_doc(doc_name):
     # 보안: 파일명 제한 (영문, 숫자, 하이픈, 언더바)
     doc_name = doc_name.replace("..", "").replace("/", "").replace("\\", "")
 
-    from utils import load_settings
+    from services.config_cache import load_settings
 
     settings = load_settings()
     lang = settings.get("lang", "ko")
@@ -114,7 +115,7 @@ def get_help_doc(doc_name):
 @login_required
 def list_help_docs():
     """사용 가능한 마크다운 문서 목록 반환 (다국어 지원)"""
-    from utils import load_settings
+    from services.config_cache import load_settings
 
     settings = load_settings()
     lang = settings.get("lang", "ko")
@@ -139,7 +140,8 @@ def list_help_docs():
 
 def initialize_plugin():
     from services.plugin_registry import register_plugin_action
-    from utils import get_i18n, load_settings
+    from services.config_cache import load_settings
+    from services.i18n_catalog import get_i18n
 
     lang = load_settings().get("lang", "ko")
 
@@ -1,7 +1,8 @@
 import os
 from flask import Blueprint, jsonify, send_from_directory
 from routes.decorators import login_required
-from utils import load_json_config, get_plugin_i18n
+from services.config_cache import load_json_config
+from services.i18n_catalog import get_plugin_i18n
 
 mp3_plugin_bp = Blueprint("mp3_plugin", __name__)
 
@@ -3,8 +3,11 @@ from typing import Optional
 from flask import Blueprint, jsonify
 from routes.decorators import login_required
 from .news_service import get_news_rss
-from utils import load_json_config, get_plugin_i18n
+from services.config_cache import load_json_config
+from services.i18n_catalog import get_plugin_i18n
 from services.plugin_registry import register_context_provider
+from services.manifest_index import manifest_index
+from services.prompt_encoder import compact_processor
 
 PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(PLUGIN_DIR, "config.json")
@@ -57,7 +60,12 @@ def initialize_plugin():
 
 
 register_context_provider(
-    "news", get_news_context, aliases=["뉴스", "기사", "소식", "news"]
+    "news",
+    get_news_context,
+    # AI에게는 링크/타임스탬프를 뺀 표 형태로 제공
+    ai_processor=compact_processor(get_news_context, drop_keys=("link", "timestamp")),
+    aliases=manifest_index.get_plugin_aliases("news"),
+    freshness={"ttl": 300, "max_stale": 1800},
 )
 
 # 플러그인 로드 시 초기화 실행
@@ -44,7 +44,12 @@ export default {
         context.registerCommand('/notion', () => this.refreshNotionWidget());
 
         this.refreshNotionWidget();
-        this.updateTimer = setInterval(() => this.refreshNotionWidget(), this.config.polling_interval_ms);
+        // [v4.3.0] 서버 컨텍스트 푸시를 변경 신호로 사용 (푸시 데이터는 briefing_limit 기준이라 목록은 다시 조회)
+        // 푸시 불가 시 polling_interval_ms 폴링 유지
+        this.stopContextUpdates = await context.onContextUpdate(() => this.refreshNotionWidget());
+        if (!this.stopContextUpdates.active) {
+            this.updateTimer = setInterval(() => this.refreshNotionWidget(), this.config.polling_interval_ms);
+        }
     },
 
     refreshNotionWidget: async function() {
@@ -209,6 +214,7 @@ export default {
 
     destroy: function () {
         if (this.updateTimer) clearInterval(this.updateTimer);
+        if (this.stopContextUpdates) this.stopContextUpdates();
         console.log("[Plugin-X] Notion Widget Destroyed.");
     }
 };
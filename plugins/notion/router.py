@@ -3,7 +3,8 @@ from .notion_service import NotionService
 from routes.decorators import login_required
 from services import require_permission
 from services.plugin_registry import register_context_provider
-from utils import get_plugin_i18n
+from services.manifest_index import manifest_index
+from services.i18n_catalog import get_plugin_i18n
 
 notion_plugin_bp = Blueprint("notion_plugin", __name__)
 notion_service = NotionService()
@@ -28,7 +29,8 @@ register_context_provider(
     "notion",
     get_notion_context,
     ai_processor=get_notion_ai_context,
-    aliases=["노션", "메모", "문서"],
+    aliases=manifest_index.get_plugin_aliases("notion"),
+    freshness={"ttl": 120, "max_stale": 900},
 )
 
 
@@ -1,6 +1,5 @@
 import os
 import hashlib
-import json
 from flask import Blueprint, jsonify, request
 from routes.decorators import login_required, standardized_plugin_response
 from routes.config import (
@@ -13,7 +12,7 @@ from routes.config import (
     BREF_CONFIG_PATH,
 )
 from services import data_service, briefing_manager, voice_service, require_permission
-from utils import load_json_config
+from services.config_cache import load_json_config, save_json_config
 
 PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(PLUGIN_DIR, "config.json")
@@ -50,8 +49,8 @@ def handle_proactive_config():
         current_config = load_json_config(CONFIG_PATH)
         current_config.update(data)
 
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            json.dump(current_config, f, ensure_ascii=False, indent=4)
+        # [v4.3.0] 원자적 백그라운드 기록 (요청 스레드에서 파일 I/O 제거)
+        save_json_config(CONFIG_PATH, current_config, merge=False)
 
         return jsonify({"status": "success", "config": current_config})
 
@@ -63,7 +62,7 @@ def handle_proactive_config():
 @standardized_plugin_response
 @require_permission("api.ai_agent")
 def tactical_briefing():
-    from utils import load_settings
+    from services.config_cache import load_settings
     from routes.config import DEBUG_MODE
 
     print("\n" + "=" * 50)
@@ -85,10 +84,19 @@ def tactical_briefing():
     filter_ids = briefing_widgets if briefing_widgets else None
 
     print(f"[ProactiveAgent] Filtering context for: {filter_ids}")
-    context = data_collector.collect_all_context(plugin_ids=filter_ids)
+    context, context_meta = data_collector.collect_all_context(
+        plugin_ids=filter_ids, with_meta=True
+    )
 
     print(f"[ProactiveAgent] Context collected: {list(context.keys())}")
-    result = bref_manager.get_briefing(context, debug_mode=(test_mode or DEBUG_MODE))
+    result = bref_manager.get_briefing(
+        context,
+        debug_mode=(test_mode or DEBUG_MODE),
+        cache_config=config.get("briefing_cache"),
+    )
+    print(f"[ProactiveAgent] Briefing cache hit: {result.get('cache_hit')}")
+    # [v4.3.0] 플러그인별 데이터 나이(초)와 상태(fresh/stale/live/error)
+    result = {**result, "context_age": context_meta}
 
     print("[ProactiveAgent] Briefing generation complete.")
     print("=" * 50 + "\n")
@@ -100,7 +108,8 @@ def tactical_briefing():
 @standardized_plugin_response
 @require_permission("api.ai_agent")
 def widget_briefing(w_type):
-    context = data_collector.collect_all_context()
+    # [v4.3.0] 요청한 위젯의 공급자만 호출
+    context = data_collector.collect_all_context(plugin_ids=[w_type])
     widget_data = context.get(w_type)
     if not widget_data:
         return jsonify({"status": "error", "message": f"No data for {w_type}"}), 404
@@ -108,13 +117,46 @@ def widget_briefing(w_type):
     return jsonify(result)
 
 
+@proactive_plugin_bp.route(
+    "/api/plugins/proactive-agent/briefing/widgets", methods=["GET", "POST"]
+)
+@login_required
+@standardized_plugin_response
+@require_permission("api.ai_agent")
+def widget_briefings():
+    """[v4.3.0] 여러 위젯 요약을 LLM 1회 호출로 생성 (?types=weather,finance 또는 POST {"types": [...] 또는 "weather,finance"})"""
+    if request.method == "POST":
+        body = request.json
+        w_types = body.get("types", []) if isinstance(body, dict) else []
+    else:
+        w_types = request.args.get("types", "")
+    if isinstance(w_types, str):
+        w_types = w_types.split(",")
+    if not isinstance(w_types, list) or not all(isinstance(t, str) for t in w_types):
+        message = "types must be a list of strings or a comma-separated string"
+        return jsonify({"status": "error", "message": message}), 400
+    w_types = list(dict.fromkeys(t.strip() for t in w_types if t.strip()))
+    if not w_types:
+        return jsonify({"status": "error", "message": "No widget types provided"}), 400
+
+    context = data_collector.collect_all_context(plugin_ids=w_types)
+    widget_items = [(t, context[t]) for t in w_types if context.get(t)]
+    missing = [t for t in w_types if not context.get(t)]
+    if not widget_items:
+        return jsonify({"status": "error", "message": f"No data for {missing}"}), 404
+
+    briefings = bref_manager.get_widget_briefings(widget_items)
+    return jsonify({"status": "success", "briefings": briefings, "missing": missing})
+
+
 @proactive_plugin_bp.route("/api/plugins/proactive-agent/check")
 @login_required
 @standardized_plugin_response
 @require_permission("api.ai_agent")
 def proactive_check():
     proactive_config = load_json_config(CONFIG_PATH)
-    context = data_collector.collect_all_context()
+    # 임계값 점검은 AI용 압축 표가 아닌 공급자 원본 데이터로 수행
+    context = data_collector.collect_all_context(for_ai=False)
     result = bref_manager.check_proactive(context, proactive_config)
     return jsonify(result)
 
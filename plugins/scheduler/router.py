@@ -1,12 +1,13 @@
 import os
-import shutil
 from flask import Blueprint, jsonify, request
 from routes.decorators import login_required
-from utils import load_json_config, save_json_config, is_sponsor, get_plugin_i18n
+from utils import is_sponsor
+from services.config_cache import load_json_config, save_json_config
+from services.i18n_catalog import get_plugin_i18n
 from services import require_permission
+from services.manifest_index import manifest_index
 
 PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
-PLUGINS_ROOT = os.path.dirname(PLUGIN_DIR)  # /plugins 전체
 CONFIG_PATH = os.path.join(PLUGIN_DIR, "config.json")
 
 scheduler_plugin_bp = Blueprint("scheduler_plugin", __name__)
@@ -43,73 +44,11 @@ register_context_provider(
 @login_required
 def get_all_exports():
     """모든 플러그인의 manifest.json에서 exports(sensors, commands, actions)를 수집"""
-    sensors = []
-    commands = []
-    actions = []
-
     try:
-        if not os.path.exists(PLUGINS_ROOT):
-            return jsonify({"sensors": [], "commands": [], "actions": []})
-
-        for plugin_name in os.listdir(PLUGINS_ROOT):
-            manifest_path = os.path.join(PLUGINS_ROOT, plugin_name, "manifest.json")
-            if not os.path.isfile(manifest_path):
-                continue
-
-            manifest = load_json_config(manifest_path)
-            exports = manifest.get("exports", {})
-            plugin_id = manifest.get("id", plugin_name)
-            plugin_display = manifest.get("name", plugin_id)
-
-            # 센서 수집
-            for sensor in exports.get("sensors", []):
-                sensors.append(
-                    {
-                        "plugin_id": plugin_id,
-                        "plugin_name": plugin_display,
-                        "sensor_id": sensor.get("id"),
-                        "name": sensor.get("name"),
-                        "unit": sensor.get("unit", ""),
-                        "type": sensor.get("type", "number"),
-                        "endpoint": sensor.get("endpoint"),
-                        "field": sensor.get("field"),
-                    }
-                )
-
-            # 명령어 수집
-            for cmd in exports.get("commands", []):
-                commands.append(
-                    {
-                        "plugin_id": plugin_id,
-                        "plugin_name": plugin_display,
-                        "prefix": cmd.get("prefix"),
-                        "name": cmd.get("name"),
-                        "examples": cmd.get("examples", []),
-                    }
-                )
-
-            # [NEW] 액션 수집 (v2.0)
-            for action in exports.get("actions", []):
-                actions.append(
-                    {
-                        "plugin_id": plugin_id,
-                        "plugin_name": plugin_display,
-                        "id": action.get("id"),
-                        "name": action.get("name"),
-                        "description": action.get("description", ""),
-                        "type": action.get(
-                            "type", "terminal_command"
-                        ),  # terminal_command or api_call
-                        "payload": action.get(
-                            "payload"
-                        ),  # { "command": "..." } or { "url": "..." }
-                    }
-                )
+        return jsonify(manifest_index.get_exports())
     except Exception as e:
         return jsonify({"sensors": [], "commands": [], "actions": [], "error": str(e)})
 
-    return jsonify({"sensors": sensors, "commands": commands, "actions": actions})
-
 
 @scheduler_plugin_bp.route("/api/plugins/scheduler/config")
 @login_required
@@ -158,11 +97,8 @@ def save_scheduler_config():
             ), 403
 
     try:
-        if os.path.exists(CONFIG_PATH):
-            backup_path = CONFIG_PATH + ".bak"
-            shutil.copy2(CONFIG_PATH, backup_path)
-
-        if save_json_config(CONFIG_PATH, data, merge=False):
+        # [v4.3.0] 백업(.bak, 개수 제한)과 원자적 교체는 config_writer가 수행
+        if save_json_config(CONFIG_PATH, data, merge=False, backup=True, wait=True):
             return jsonify(
                 {
                     "status": "success",
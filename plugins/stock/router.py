@@ -3,8 +3,11 @@ from typing import Optional
 from flask import Blueprint, jsonify
 from routes.decorators import login_required
 from .stock_service import get_stock_data
-from utils import load_json_config, get_plugin_i18n
+from services.config_cache import load_json_config
+from services.i18n_catalog import get_plugin_i18n
 from services.plugin_registry import register_context_provider
+from services.manifest_index import manifest_index
+from services.prompt_encoder import compact_processor
 
 PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(PLUGIN_DIR, "config.json")
@@ -56,7 +59,14 @@ def initialize_plugin():
 
 
 register_context_provider(
-    "stock", get_stock_context, aliases=["주식", "증시", "종목", "주가", "stock"]
+    "stock",
+    get_stock_context,
+    # AI에게는 위젯 렌더링용 중복 필드(raw_*, direction)를 뺀 표 형태로 제공
+    ai_processor=compact_processor(
+        get_stock_context, drop_keys=("symbol", "raw_price", "raw_change", "direction")
+    ),
+    aliases=manifest_index.get_plugin_aliases("stock"),
+    freshness={"ttl": 60, "max_stale": 600},
 )
 
 # 플러그인 로드 시 초기화 실행
@@ -2,7 +2,8 @@ import os
 import shutil
 import json
 from routes.config import MODELS_DIR, TEST_MODELS_DIR, AEGIS_ROOT
-from utils import get_model_list, get_model_info, load_json_config, save_settings
+from utils import get_model_list, get_model_info
+from services.config_cache import load_json_config, save_settings
 
 
 class StudioService:
@@ -151,7 +152,8 @@ class StudioService:
     @staticmethod
     def get_reactions():
         """에이기스의 리액션 설정 데이터를 반환합니다."""
-        from utils import load_all_reactions, load_settings
+        from utils import load_all_reactions
+        from services.config_cache import load_settings
 
         settings = load_settings()
         lang = settings.get("lang", "ko")
@@ -2,7 +2,8 @@ import os
 from flask import Blueprint, jsonify
 from routes.decorators import login_required
 from .system_service import get_system_stats
-from utils import load_json_config, get_plugin_i18n
+from services.config_cache import load_json_config
+from services.i18n_catalog import get_plugin_i18n
 from services.plugin_registry import register_context_provider
 
 PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
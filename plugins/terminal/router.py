@@ -1,7 +1,8 @@
 import os
 from flask import Blueprint, jsonify, request
 from routes.decorators import login_required, standardized_plugin_response
-from utils import load_json_config, get_plugin_i18n
+from services.config_cache import load_json_config
+from services.i18n_catalog import get_plugin_i18n
 
 PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(PLUGIN_DIR, "config.json")
@@ -69,9 +70,9 @@ def get_terminal_config():
 @login_required
 @standardized_plugin_response
 def save_terminal_config():
-    from utils import save_json_config
+    from services.config_cache import save_json_config
 
     data = request.json
-    if save_json_config(CONFIG_PATH, data, merge=True):
+    if save_json_config(CONFIG_PATH, data, merge=True, wait=True):
         return jsonify({"status": "success", "message": "Terminal config saved"})
     return jsonify({"status": "error", "message": "Failed to save config"}), 500
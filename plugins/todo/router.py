@@ -2,9 +2,11 @@ import os
 from flask import Blueprint, jsonify, request
 from routes.decorators import login_required
 from .todo_service import get_today_tasks, add_task, complete_task
-from utils import load_json_config, get_plugin_i18n
+from services.config_cache import load_json_config
+from services.i18n_catalog import get_plugin_i18n
 from services import require_permission
-from services.plugin_registry import register_context_provider
+from services.plugin_registry import register_context_provider, invalidate_context_cache
+from services.manifest_index import manifest_index
 
 PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(PLUGIN_DIR, "config.json")
@@ -106,7 +108,8 @@ register_context_provider(
     "todo",
     get_todo_context,
     ai_processor=get_todo_ai_context,
-    aliases=["할일", "태스크"],
+    aliases=manifest_index.get_plugin_aliases("todo"),
+    freshness={"ttl": 30, "max_stale": 300},
 )
 
 # 플러그인 로드 시 초기화 실행
@@ -127,7 +130,9 @@ def add_todo():
     title = request.json.get("title")
     if not title:
         return jsonify({"status": "error", "message": "Title is required"}), 400
-    return jsonify(add_task(title))
+    result = add_task(title)
+    invalidate_context_cache("todo")
+    return jsonify(result)
 
 
 @todo_plugin_bp.route("/api/plugins/todo/complete", methods=["POST"])
@@ -140,7 +145,9 @@ def complete_todo():
         return jsonify(
             {"status": "error", "message": "Tasklist and Task ID are required"}
         ), 400
-    return jsonify(complete_task(tasklist_id, task_id))
+    result = complete_task(tasklist_id, task_id)
+    invalidate_context_cache("todo")
+    return jsonify(result)
 
 
 @todo_plugin_bp.route("/api/plugins/todo/config")
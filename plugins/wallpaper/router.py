@@ -1,11 +1,8 @@
 from flask import Blueprint, request, jsonify
 import os
-from utils import (
-    load_json_config,
-    save_json_config,
-    is_sponsor,
-    get_plugin_i18n,
-)
+from utils import is_sponsor
+from services.config_cache import load_json_config, save_json_config
+from services.i18n_catalog import get_plugin_i18n
 from routes.decorators import login_required
 
 from werkzeug.utils import secure_filename
@@ -13,18 +10,13 @@ from routes.config import AEGIS_ROOT
 
 PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(PLUGIN_DIR, "config.json")
-LOG_FILE = "web_debug.log"
 
 
 def wp_log(msg):
-    from datetime import datetime
+    # [v4.3.0] web_debug.log 비동기 싱크 사용
+    from services.log_sink import debug_log
 
-    try:
-        dt = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(f"[{dt}] [Wallpaper] {msg}\n")
-    except Exception as e:
-        print(f"Logging error: {e}")
+    debug_log(msg, source="Wallpaper")
 
 
 wallpaper_plugin_bp = Blueprint("wallpaper_plugin", __name__)
@@ -206,9 +198,7 @@ def upload_wallpaper():
     except Exception as e:
         import traceback
 
-        wp_log(f"CRITICAL UPLOAD ERROR: {e}")
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            traceback.print_exc(file=f)
+        wp_log(f"CRITICAL UPLOAD ERROR: {e}\n{traceback.format_exc()}")
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
@@ -3,7 +3,8 @@ from typing import Optional
 from flask import Blueprint, jsonify
 from routes.decorators import login_required
 from .weather_service import get_real_weather
-from utils import load_json_config, get_plugin_i18n
+from services.config_cache import load_json_config
+from services.i18n_catalog import get_plugin_i18n
 from services.plugin_registry import register_context_provider
 
 PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -50,7 +51,10 @@ def initialize_plugin():
 
 
 register_context_provider(
-    "weather", get_weather_context, aliases=["날씨", "기상", "날시", "weather"]
+    "weather",
+    get_weather_context,
+    aliases=["날씨", "기상", "날시", "weather"],
+    freshness={"ttl": 600, "max_stale": 3600},
 )
 
 # 플러그인 로드 시 초기화 실행
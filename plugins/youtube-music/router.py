@@ -2,7 +2,8 @@ from flask import Blueprint, jsonify, request
 from routes.decorators import login_required
 from .ytmusic_service import yt_service
 from services.plugin_registry import register_context_provider
-from utils import get_plugin_i18n
+from services.manifest_index import manifest_index
+from services.i18n_catalog import get_plugin_i18n
 
 ytmusic_plugin_bp = Blueprint("ytmusic_plugin", __name__)
 
@@ -107,7 +108,7 @@ def initialize_plugin():
 register_context_provider(
     "youtube-music",
     get_ytmusic_context,
-    aliases=["유튜브", "뮤직", "음악", "노래", "youtube", "yt"],
+    aliases=manifest_index.get_plugin_aliases("youtube-music"),
 )
 
 # 플러그인 로드 시 초기화 실행
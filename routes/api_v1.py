@@ -2,7 +2,7 @@ import os
 import hashlib
 from flask import Blueprint, request, jsonify
 from routes.config import SECRETS_CONFIG_PATH
-from utils import load_json_config
+from services.config_cache import get_config
 
 api_v1_bp = Blueprint("api_v1", __name__, url_prefix="/api/v1/external")
 
@@ -17,7 +17,7 @@ def validate_api_key(api_key):
     """
     secrets.json에 정의된 EXTERNAL_API_KEYS를 기준으로 인증을 수행합니다.
     """
-    secrets = load_json_config(SECRETS_CONFIG_PATH)
+    secrets = get_config(SECRETS_CONFIG_PATH)
     keys = secrets.get("EXTERNAL_API_KEYS", {})
     # 키 값이 일치하는 서비스 이름을 반환
     for source, key in keys.items():
@@ -33,7 +33,7 @@ def get_external_config():
     """
     from routes.config import API_CONFIG_PATH
 
-    config = load_json_config(API_CONFIG_PATH)
+    config = get_config(API_CONFIG_PATH)
     return jsonify({"status": "success", "config": config})
 
 
@@ -1,7 +1,8 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify, request, Response
 from routes.decorators import login_required
 from routes.config import I18N_DIR
-from utils import load_json_config, load_settings, save_settings
+from services.config_cache import load_json_config, load_settings, save_settings
+from services.i18n_catalog import i18n_catalog
 import os
 
 i18n_bp = Blueprint("i18n", __name__)
@@ -10,42 +11,23 @@ i18n_bp = Blueprint("i18n", __name__)
 @i18n_bp.route("/i18n_config")
 @login_required
 def i18n_config():
-    """현재 설정된 언어의 JSON 팩 반환 및 플러그인 i18n 병합"""
+    """
+    현재 설정된 언어의 JSON 팩 반환 및 플러그인 i18n 병합
+    [v4.3.0] 병합 결과는 i18n_catalog에 언어별로 캐시되며, 사전 직렬화 JSON + ETag로 응답
+    """
     lang = request.args.get("lang")
     if not lang:
         settings = load_settings()
         lang = settings.get("lang", "ko")
 
-    # 1. 전역 언어팩 로드
-    pack_path = os.path.join(I18N_DIR, f"{lang}.json")
-    combined_data = load_json_config(pack_path)
-
-    # 2. [Plugin-X] 모든 플러그인의 i18n.json 병합
-    from routes.config import PLUGINS_DIR
-
-    if os.path.exists(PLUGINS_DIR):
-        for plugin_id in os.listdir(PLUGINS_DIR):
-            p_i18n_path = os.path.join(PLUGINS_DIR, plugin_id, "i18n.json")
-            if os.path.exists(p_i18n_path):
-                p_i18n_data = load_json_config(p_i18n_path)
-                # 해당 언어 섹션이 있으면 병합
-                lang_data = p_i18n_data.get(lang, {})
-                if lang_data:
-
-                    def deep_merge(target, source):
-                        for k, v in source.items():
-                            if (
-                                k in target
-                                and isinstance(target[k], dict)
-                                and isinstance(v, dict)
-                            ):
-                                deep_merge(target[k], v)
-                            else:
-                                target[k] = v
-
-                    deep_merge(combined_data, lang_data)
-
-    return jsonify(combined_data)
+    pack = i18n_catalog.get_pack(lang)
+    if request.if_none_match.contains(pack["etag"]):
+        response = Response(status=304)
+    else:
+        response = Response(pack["json"], mimetype="application/json")
+    response.set_etag(pack["etag"])
+    response.headers["Cache-Control"] = "no-cache"
+    return response
 
 
 @i18n_bp.route("/api/i18n/list")
@@ -85,6 +67,6 @@ def save_language():
 
     config = load_settings()
     config["lang"] = new_lang
-    if save_settings(config):
+    if save_settings(config, wait=True):
         return jsonify({"status": "success"})
     return jsonify({"status": "error"}), 500
@@ -1,7 +1,7 @@
 import os
 from flask import Blueprint, render_template, jsonify, send_from_directory, request
 from routes.decorators import login_required
-from utils import load_settings
+from services.config_cache import load_settings
 
 main_bp = Blueprint("main", __name__)
 
@@ -26,6 +26,64 @@ def global_ping():
     return jsonify({"status": "global_pong"})
 
 
+@main_bp.route("/api/debug/startup_profile")
+@login_required
+def startup_profile():
+    """[v4.3.0] 플러그인별 부팅 프로파일 (임포트 시간, 경과 시간, RSS 변화량)"""
+    from services.plugin_discovery import get_startup_report
+
+    return jsonify(get_startup_report())
+
+
+@main_bp.route("/api/debug/ai_cache")
+@login_required
+def ai_cache_stats():
+    """[v4.3.0] AI 응답 캐시 적중/미스/우회 통계 (+ single-flight 병합 통계)"""
+    from services.ai_response_cache import get_response_cache
+    from services.single_flight import single_flight
+
+    return jsonify(
+        {**get_response_cache().get_stats(), "single_flight": single_flight.get_stats()}
+    )
+
+
+@main_bp.route("/api/debug/ai_routing")
+@login_required
+def ai_routing_stats():
+    """[v4.3.0] 소스별 p50/p95 지연, 오류율 및 장애 조치/헤징 통계"""
+    from services.ai_router import get_ai_router
+
+    return jsonify(get_ai_router().report())
+
+
+@main_bp.route("/api/debug/config_writer")
+@login_required
+def config_writer_stats():
+    """[v4.3.0] 설정 저장 대기/기록/실패 통계 및 파일별 마지막 기록 실패"""
+    from services.config_writer import config_writer
+
+    return jsonify(config_writer.report())
+
+
+@main_bp.route("/api/debug/context_push")
+@login_required
+def context_push_stats():
+    """[v4.3.0] 컨텍스트 푸시 구독 현황 및 발행/무변경/오류 통계"""
+    from services.context_publisher import get_context_publisher
+
+    publisher = get_context_publisher()
+    return jsonify(publisher.report() if publisher else {"enabled": False})
+
+
+@main_bp.route("/api/debug/prompt_stats")
+@login_required
+def prompt_stats():
+    """[v4.3.0] 컴파일된 시스템 지침별 토큰 수 (섹션별 내역 포함)"""
+    from services.prompt_compiler import prompt_compiler
+
+    return jsonify(prompt_compiler.report())
+
+
 @main_bp.route("/")
 @login_required
 def index():
@@ -36,7 +94,7 @@ def index():
 @main_bp.route("/save_log", methods=["POST"])
 @login_required
 def save_log():
-    from datetime import datetime
+    from services.log_sink import debug_log, client_log_level
 
     data = request.json
     logs = data.get("logs", [])  # 배열로 받음
@@ -47,12 +105,11 @@ def save_log():
         logs = [{"message": msg, "level": level}]
 
     try:
-        with open("web_debug.log", "a", encoding="utf-8") as f:
-            for log in logs:
-                msg = log.get("message", "")
-                level = log.get("level", "INFO")
-                dt = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                f.write(f"[{dt}] [{level}] {msg}\n")
+        # [v4.3.0] 파일 직접 기록 대신 비동기 로그 싱크로 전달
+        for log in logs:
+            msg = log.get("message", "")
+            level = log.get("level", "INFO")
+            debug_log(msg, level=client_log_level(level), source="Client")
         return jsonify({"status": "ok"})
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
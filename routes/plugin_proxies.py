@@ -1,5 +1,3 @@
-import os
-import json
 import logging
 
 # 로깅 설정
@@ -51,15 +49,11 @@ def validate_proxy_token(plugin_id, token):
 
 
 def _check_plugin_permission(plugin_id, permission):
-    """해당 플러그인이 특정 권한을 가지고 있는지 검증합니다."""
-    manifest_path = os.path.join(PLUGINS_DIR, plugin_id, "manifest.json")
-    if not os.path.exists(manifest_path):
-        return False
+    """해당 플러그인이 특정 권한을 가지고 있는지 검증합니다. (ManifestIndex 조회)"""
+    from services.manifest_index import manifest_index
+
     try:
-        with open(manifest_path, "r", encoding="utf-8-sig") as f:
-            manifest = json.load(f)
-            permissions = manifest.get("permissions", [])
-            return permission in permissions
+        return manifest_index.has_permission(plugin_id, permission)
     except Exception:
         return False
 
@@ -1,10 +1,14 @@
 import os
-from flask import Blueprint, jsonify, send_from_directory, Response
+from flask import Blueprint, jsonify, send_from_directory, Response, request
 from routes.decorators import login_required
 from routes.config import PLUGINS_DIR
 
 # Import from separated services
-from services.plugin_bundler import get_plugin_init_pack_data, get_plugin_cache
+from services.plugin_bundler import (
+    get_plugin_init_pack_data,
+    get_plugin_cache,
+    get_plugin_pack_delta,
+)
 
 plugins_bp = Blueprint("plugins", __name__)
 
@@ -42,16 +46,71 @@ def get_plugin_asset(plugin_id, filename):
     return response
 
 
+def _negotiate_pack_encoding(cache):
+    """Accept-Encoding 협상: br > gzip > identity (사전 압축본이 있는 경우만)"""
+    accepted = request.accept_encodings
+    for encoding in ("br", "gzip"):
+        if cache.get(encoding) and accepted[encoding]:
+            return encoding
+    return None
+
+
 @plugins_bp.route("/api/plugins/init_pack")
 @login_required
 def get_plugin_init_pack():
-    """[v2.3.0] Super Bundle: Pre-serialized JSON 응답으로 오버헤드 최소화"""
+    """
+    [v2.3.0] Super Bundle: Pre-serialized JSON 응답으로 오버헤드 최소화
+    [v4.3.0] 번들 해시를 ETag로 사용(If-None-Match -> 304), 사전 압축본(br/gzip) 협상
+    """
+    # 요청 처리 동안 하나의 스냅샷만 사용 (재빌드와 겹쳐도 ETag와 본문이 일치)
     cache = get_plugin_cache()
     if not cache["json"]:
         get_plugin_init_pack_data(rebuild=True)
+        cache = get_plugin_cache()
+
+    etag = cache["hash"]
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        response.headers["Vary"] = "Accept-Encoding"
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
+    encoding = _negotiate_pack_encoding(cache)
+    if encoding:
+        response = Response(cache[encoding], mimetype="application/json")
+        response.headers["Content-Encoding"] = encoding
+    else:
+        response = Response(cache["json"], mimetype="application/json")
+
+    response.set_etag(etag)
+    response.headers["Vary"] = "Accept-Encoding"
+    # 브라우저가 매번 ETag로 재검증하도록 (변경 없으면 304)
+    response.headers["Cache-Control"] = "no-cache"
 
-    print(f"[InitPack] Serving Super Bundle (Hash: {cache['hash'][:8]})")
-    return Response(cache["json"], mimetype="application/json")
+    print(
+        f"[InitPack] Serving Super Bundle (Hash: {etag[:8]}, Encoding: {encoding or 'identity'})"
+    )
+    return response
+
+
+@plugins_bp.route("/api/plugins/init_pack/delta")
+@login_required
+def get_plugin_init_pack_delta():
+    """
+    [v4.3.0] 보유 번들 해시(since) 이후 변경된 플러그인 세그먼트만 반환.
+    full=true 이면 이력 밖의 해시이므로 /api/plugins/init_pack 전체를 다시 받아야 함.
+    """
+    since = request.args.get("since", "")
+    delta = get_plugin_pack_delta(since)
+    if not delta["full"]:
+        print(
+            f"[InitPack] Delta {since[:8]} -> {delta['version'][:8]}: "
+            f"{len(delta['changed'])} changed, {len(delta['removed'])} removed"
+        )
+    response = jsonify(delta)
+    response.headers["Cache-Control"] = "no-store"
+    return response
 
 
 @plugins_bp.route("/api/plugins/version")
@@ -61,4 +120,5 @@ def get_plugin_version():
     cache = get_plugin_cache()
     if not cache["hash"]:
         get_plugin_init_pack_data(rebuild=True)
+        cache = get_plugin_cache()
     return jsonify({"version": cache["hash"]})
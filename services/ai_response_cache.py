@@ -0,0 +1,226 @@
+"""
+AEGIS AI Response Cache
+동일한 LLM 질의(같은 엔진/모델/시스템 지침/프롬프트/컨텍스트)의 중복 호출을 막는 응답 캐시입니다.
+- 키: sha256(source, model, system_instruction, prompt, 정규화된 context_data)
+  정규화: dict 키 정렬, 모든 문자열 안의 타임스탬프는 분 단위로 절삭
+  (시스템 지침의 current_time 등 초 단위 변화로 키가 갈리지 않도록)
+- 1차: 메모리 LRU (max_entries) + TTL / 2차(선택): SQLite 디스크 계층 (재시작 후에도 유지)
+- with_search=True 질의(실시간 검색 결과)는 cache_search 옵트인 없이는 자동 우회
+- 설정: api.json "response_cache" / 통계: /api/debug/ai_cache
+"""
+
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_CONFIG = {
+    "enabled": True,
+    "ttl": 300,
+    "max_entries": 256,
+    "sqlite_path": None,
+    "disk_max_entries": 2048,
+    "cache_search": False,
+}
+
+_TIMESTAMP_RE = re.compile(r"(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}):\d{2}(?:\.\d+)?")
+
+
+def normalize_context(value):
+    """캐시 키용 정규화 (키 정렬은 json.dumps에서, 문자열 속 타임스탬프는 분 단위)"""
+    if isinstance(value, dict):
+        return {str(k): normalize_context(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize_context(v) for v in value]
+    if isinstance(value, str):
+        return _TIMESTAMP_RE.sub(r"\1", value)
+    return value
+
+
+def make_cache_key(source, model, system_instruction, prompt, context_data=None):
+    material = json.dumps(
+        normalize_context(
+            [source, model, system_instruction or "", prompt or "", context_data]
+        ),
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class _SqliteTier:
+    """만료 시각을 함께 저장하는 디스크 캐시 계층"""
+
+    def __init__(self, path, max_entries):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS ai_cache (key TEXT PRIMARY KEY, value TEXT, expires REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, key, now):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires FROM ai_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if not row:
+            return None, None
+        if row[1] <= now:
+            self.delete(key)
+            return None, None
+        return json.loads(row[0]), row[1]
+
+    def put(self, key, value, expires, now):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ai_cache (key, value, expires) VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False, default=str), expires),
+            )
+            self._conn.execute("DELETE FROM ai_cache WHERE expires <= ?", (now,))
+            self._conn.execute(
+                "DELETE FROM ai_cache WHERE key NOT IN "
+                "(SELECT key FROM ai_cache ORDER BY expires DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def delete(self, key=None):
+        with self._lock:
+            if key is None:
+                self._conn.execute("DELETE FROM ai_cache")
+            else:
+                self._conn.execute("DELETE FROM ai_cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class AIResponseCache:
+    """TTL + LRU 메모리 캐시 (선택적 SQLite 2차 계층)"""
+
+    def __init__(self, config=None, clock=time.time):
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (expires, value)
+        self._lock = threading.Lock()
+        self._disk = None
+        self._config_source = object()  # 최초 configure()는 항상 적용
+        self.config = dict(DEFAULT_CACHE_CONFIG)
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "bypassed": 0, "stores": 0}
+        self.configure(config)
+
+    def configure(self, config=None):
+        """api.json response_cache 섹션 적용 (같은 스냅샷이면 무시)"""
+        if config is self._config_source:
+            return self
+        self._config_source = config
+        new_config = dict(DEFAULT_CACHE_CONFIG)
+        if isinstance(config, dict):
+            new_config.update({k: v for k, v in config.items() if k in DEFAULT_CACHE_CONFIG})
+
+        sqlite_path = new_config["sqlite_path"]
+        if self._disk and (not sqlite_path or self._disk.path != sqlite_path):
+            self._disk.close()
+            self._disk = None
+        if sqlite_path and self._disk is None:
+            try:
+                self._disk = _SqliteTier(sqlite_path, int(new_config["disk_max_entries"]))
+            except Exception as e:
+                logger.error(f"[AIResponseCache] SQLite tier disabled ({sqlite_path}): {e}")
+        self.config = new_config
+        self._trim()
+        return self
+
+    def should_use(self, with_search=False, use_cache=None):
+        """캐시 적용 여부 (use_cache: 호출부 강제 지정 True/False, None이면 설정 기준)"""
+        if use_cache is False or not self.config["enabled"]:
+            return False
+        if with_search and not (use_cache or self.config["cache_search"]):
+            self.stats["bypassed"] += 1
+            return False
+        return True
+
+    def get(self, key):
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return entry[1]
+                del self._entries[key]
+
+        if self._disk is not None:
+            value, expires = self._disk.get(key, now)
+            if value is not None:
+                with self._lock:
+                    self._entries[key] = (expires, value)
+                    self._trim()
+                    self.stats["disk_hits"] += 1
+                return value
+
+        self.stats["misses"] += 1
+        return None
+
+    def put(self, key, value, ttl=None):
+        now = self._clock()
+        expires = now + (self.config["ttl"] if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            self._trim()
+            self.stats["stores"] += 1
+        if self._disk is not None:
+            try:
+                self._disk.put(key, value, expires, now)
+            except Exception as e:
+                logger.error(f"[AIResponseCache] SQLite write failed: {e}")
+
+    def _trim(self):
+        limit = max(1, int(self.config["max_entries"]))
+        while len(self._entries) > limit:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+        if self._disk is not None:
+            self._disk.delete(key)
+
+    def get_stats(self):
+        lookups = self.stats["hits"] + self.stats["disk_hits"] + self.stats["misses"]
+        hits = self.stats["hits"] + self.stats["disk_hits"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "disk_enabled": self._disk is not None,
+            "config": dict(self.config),
+        }
+
+
+# 전역 싱글톤 인스턴스
+ai_response_cache = AIResponseCache()
+
+
+def get_response_cache():
+    """api.json response_cache 최신 설정이 반영된 전역 캐시"""
+    from services.config_cache import get_config
+    from routes.config import API_CONFIG_PATH
+
+    return ai_response_cache.configure(get_config(API_CONFIG_PATH).get("response_cache"))
@@ -0,0 +1,327 @@
+"""
+AEGIS AI Router
+LLM 소스별 지연/오류 통계를 기반으로 장애 조치(failover)와 헤징(hedged request)을 수행하는 라우팅 계층입니다.
+- 소스별 최근 호출(window개, window_seconds 이내)의 p50/p95 지연 시간과 오류율 추적
+- 오류 응답/예외/attempt_timeout 초과 시 다음 후보 소스로 전환
+- hedge_after(초 또는 "p95") 경과 시 다음 후보에 동시 요청, 먼저 성공한 응답 채택
+- 오류율이 max_error_rate를 넘은 소스는 후보 순서의 뒤로 이동
+- 호출 지점(terminal, briefing, proactive_alert 등)별 정책: api.json "routing.policies"
+- 스트리밍(on_delta) 요청은 헤징하지 않으며, 첫 청크가 전달된 뒤에는 전환하지 않음
+"""
+
+import time
+import logging
+import threading
+import contextvars
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROUTING_CONFIG = {
+    "window": 50,
+    "window_seconds": 600,
+    "min_samples": 5,
+    "policies": {},
+}
+
+DEFAULT_POLICY = {
+    "fallbacks": [],
+    "attempt_timeout": None,
+    "hedge_after": None,
+    "max_error_rate": 0.5,
+}
+
+ROUTER_WORKERS = 8
+
+
+def _percentile(sorted_values, q):
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, int(round(q * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def is_failure(result):
+    """엔진 결과의 실패 여부 (예외 대신 {"status": "error"}로 보고하는 어댑터 규약)"""
+    return result.get("status") == "error"
+
+
+class LatencyTracker:
+    """소스별 (시각, 지연, 성공 여부) 순환 버퍼"""
+
+    def __init__(self, window=50, window_seconds=600, clock=time.monotonic):
+        self.window = window
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def record(self, source, latency, ok):
+        with self._lock:
+            samples = self._samples.get(source)
+            if samples is None or samples.maxlen != self.window:
+                samples = deque(samples or (), maxlen=self.window)
+                self._samples[source] = samples
+            samples.append((self._clock(), latency, ok))
+
+    def snapshot(self, source):
+        cutoff = self._clock() - self.window_seconds
+        with self._lock:
+            recent = [s for s in self._samples.get(source, ()) if s[0] >= cutoff]
+        if not recent:
+            return {"count": 0, "p50": None, "p95": None, "error_rate": 0.0}
+        latencies = sorted(s[1] for s in recent)
+        errors = sum(1 for s in recent if not s[2])
+        return {
+            "count": len(recent),
+            "p50": round(_percentile(latencies, 0.50), 3),
+            "p95": round(_percentile(latencies, 0.95), 3),
+            "error_rate": round(errors / len(recent), 3),
+        }
+
+    def sources(self):
+        with self._lock:
+            return list(self._samples)
+
+
+class StreamGate:
+    """스트리밍 요청에서 가장 먼저 청크를 보낸 시도만 on_delta에 연결"""
+
+    def __init__(self, on_delta):
+        self.on_delta = on_delta
+        self.owner = None
+        self._revoked = set()
+        self._lock = threading.Lock()
+
+    def wrap(self, source):
+        def deliver(chunk):
+            with self._lock:
+                if self.owner is None and source not in self._revoked:
+                    self.owner = source
+                if self.owner != source:
+                    return
+            self.on_delta(chunk)
+
+        return deliver
+
+    def revoke(self, source):
+        """시간 초과로 버린 시도가 뒤늦게 스트림을 차지하지 못하도록 차단"""
+        with self._lock:
+            self._revoked.add(source)
+
+
+class AIRouter:
+    """호출 지점별 정책에 따라 후보 소스들에 요청을 배분하는 라우터"""
+
+    def __init__(self, config=None, clock=time.monotonic, executor=None):
+        self._clock = clock
+        self._executor = executor
+        self._executor_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._config_source = object()  # 최초 configure()는 항상 적용
+        self.config = dict(DEFAULT_ROUTING_CONFIG)
+        self.tracker = LatencyTracker(clock=clock)
+        self.stats = {"routed": 0, "failovers": 0, "hedges": 0, "hedge_wins": 0, "timeouts": 0}
+        self.configure(config)
+
+    def configure(self, config=None):
+        """api.json routing 섹션 적용 (같은 스냅샷이면 무시)"""
+        if config is self._config_source:
+            return self
+        self._config_source = config
+        new_config = dict(DEFAULT_ROUTING_CONFIG)
+        if isinstance(config, dict):
+            new_config.update({k: v for k, v in config.items() if k in DEFAULT_ROUTING_CONFIG})
+        self.config = new_config
+        self.tracker.window = max(1, int(new_config["window"]))
+        self.tracker.window_seconds = float(new_config["window_seconds"])
+        return self
+
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=ROUTER_WORKERS, thread_name_prefix="ai-router"
+                )
+            return self._executor
+
+    def policy(self, call_site=None):
+        """기본값 <- policies.default <- policies[call_site] 순으로 병합한 정책"""
+        policies = self.config.get("policies") or {}
+        merged = dict(DEFAULT_POLICY)
+        merged.update(policies.get("default") or {})
+        if call_site:
+            merged.update(policies.get(call_site) or {})
+        return merged
+
+    def _unhealthy(self, source, policy):
+        snap = self.tracker.snapshot(source)
+        return (
+            snap["count"] >= self.config["min_samples"]
+            and snap["error_rate"] > policy["max_error_rate"]
+        )
+
+    def candidates(self, call_site, primary, sources=None):
+        """primary + fallbacks (비활성 소스 제외, 중복 제거, 오류율 초과 소스는 뒤로)"""
+        policy = self.policy(call_site)
+        ordered = []
+        for key in [primary] + list(policy["fallbacks"] or []):
+            if key in ordered:
+                continue
+            if sources is not None and key != primary:
+                source_config = sources.get(key)
+                if not source_config or not source_config.get("active"):
+                    continue
+            ordered.append(key)
+        healthy = [key for key in ordered if not self._unhealthy(key, policy)]
+        return healthy + [key for key in ordered if key not in healthy]
+
+    def _hedge_delay(self, policy, source):
+        hedge_after = policy["hedge_after"]
+        if hedge_after in (None, False, 0):
+            return None
+        if hedge_after == "p95":
+            snap = self.tracker.snapshot(source)
+            if snap["count"] < self.config["min_samples"]:
+                return None
+            return snap["p95"]
+        return float(hedge_after)
+
+    def route(self, call_site, primary, attempt, sources=None, on_delta=None):
+        """
+        attempt(source_key, on_delta) -> 엔진 결과 dict ({"status": "error"}면 실패).
+        반환 결과에는 실제 응답한 소스가 "source"로 기록됩니다.
+        """
+        policy = self.policy(call_site)
+        queue = self.candidates(call_site, primary, sources)
+        gate = StreamGate(on_delta) if on_delta else None
+        attempt_timeout = policy["attempt_timeout"]
+        self._count("routed")
+
+        if len(queue) == 1 and not attempt_timeout:
+            # 전환 대상도 시간 제한도 없으면 호출 스레드에서 바로 실행
+            return self._finish(self._run(queue[0], attempt, gate, {}), queue[0])
+
+        executor = self._get_executor()
+        running = {}  # future -> (source, started, state)
+        last_error = None
+        hedged = False
+
+        def launch():
+            source = queue.pop(0)
+            state = {"recorded": False}
+            # Flask 앱/요청 컨텍스트(contextvars)를 시도별 복사본으로 전달
+            ctx = contextvars.copy_context()
+            future = executor.submit(ctx.run, self._run, source, attempt, gate, state)
+            running[future] = (source, self._clock(), state)
+
+        launch()
+        while running or queue:
+            if not running:
+                if gate is not None and gate.owner is not None:
+                    break
+                self._count("failovers")
+                launch()
+
+            now = self._clock()
+            deadlines = []
+            for future, (source, started, state) in list(running.items()):
+                if not attempt_timeout or (gate is not None and gate.owner == source):
+                    # 첫 청크가 도착한 스트림은 시간 제한 대상에서 제외
+                    continue
+                if now - started < attempt_timeout:
+                    deadlines.append(started + attempt_timeout)
+                    continue
+                # 시간 초과: 결과를 버리고 오류로 집계 (스레드는 엔진 자체 타임아웃까지 계속 실행)
+                with self._lock:
+                    state["recorded"] = True
+                self.tracker.record(source, now - started, False)
+                if gate is not None:
+                    gate.revoke(source)
+                self._count("timeouts")
+                logger.warning(f"[AIRouter] {source} timed out after {attempt_timeout}s ({call_site})")
+                last_error = {"status": "error", "message": f"AI Source '{source}' timed out."}
+                del running[future]
+            if not running:
+                continue
+
+            if gate is None and not hedged and queue and len(running) == 1:
+                source, started, _ = next(iter(running.values()))
+                delay = self._hedge_delay(policy, source)
+                if delay is not None:
+                    if now - started >= delay:
+                        hedged = True
+                        self._count("hedges")
+                        logger.info(f"[AIRouter] Hedging {source} -> {queue[0]} after {delay:.2f}s ({call_site})")
+                        launch()
+                        continue
+                    deadlines.append(started + delay)
+
+            timeout = max(0.0, min(deadlines) - now) if deadlines else None
+            done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                source, _, _ = running.pop(future)
+                result = future.result()
+                if not is_failure(result):
+                    if hedged and source != primary:
+                        self._count("hedge_wins")
+                    return self._finish(result, source)
+                last_error = result
+                logger.warning(f"[AIRouter] {source} failed ({call_site}): {result.get('message')}")
+                if gate is not None and gate.owner == source:
+                    # 이미 화면에 일부가 표시된 스트림은 다른 소스로 이어 붙이지 않음
+                    queue.clear()
+
+        return last_error or {"status": "error", "message": "No available AI source."}
+
+    def _count(self, name):
+        # 요청 스레드들이 동시에 route()를 실행하므로 집계는 lock 안에서
+        with self._lock:
+            self.stats[name] += 1
+
+    def _run(self, source, attempt, gate, state):
+        started = self._clock()
+        try:
+            result = attempt(source, gate.wrap(source) if gate else None)
+        except Exception as e:
+            result = {"status": "error", "message": str(e)}
+        if not isinstance(result, dict):
+            result = {"status": "error", "message": f"Invalid response from '{source}'."}
+        with self._lock:
+            # 시간 초과로 이미 오류 집계된 시도는 중복 기록하지 않음 (헤징에서 진 시도는 지연 통계에 반영)
+            if not state.get("recorded"):
+                state["recorded"] = True
+                self.tracker.record(source, self._clock() - started, not is_failure(result))
+        return result
+
+    @staticmethod
+    def _finish(result, source):
+        if not is_failure(result):
+            result.setdefault("source", source)
+        return result
+
+    def report(self):
+        with self._lock:
+            stats = dict(self.stats)
+        return {
+            "stats": stats,
+            "sources": {s: self.tracker.snapshot(s) for s in self.tracker.sources()},
+            "policies": {
+                name: self.policy(name)
+                for name in (self.config.get("policies") or {})
+            },
+        }
+
+
+# 전역 싱글톤 인스턴스
+ai_router = AIRouter()
+
+
+def get_ai_router():
+    """api.json routing 최신 설정이 반영된 전역 라우터"""
+    from services.config_cache import get_config
+    from routes.config import API_CONFIG_PATH
+
+    return ai_router.configure(get_config(API_CONFIG_PATH).get("routing"))
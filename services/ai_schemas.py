@@ -26,6 +26,39 @@ BRIEFING_SCHEMA = {
     "required": ["briefing", "voice", "sentiment", "visual_type"],
 }
 
+# [v4.3.0] 여러 위젯 요약을 한 번의 요청으로 받기 위한 배치 스키마 (위젯당 항목 1개)
+WIDGET_BATCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "widgets": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "widget": {
+                        "type": "string",
+                        "description": "요약 대상 위젯 ID (요청에 표기된 값 그대로)",
+                    },
+                    "briefing": {
+                        "type": "string",
+                        "description": "해당 위젯 데이터에 대한 간결한 요약 보고",
+                    },
+                    "voice": {
+                        "type": "string",
+                        "description": "음성으로 들려줄 1~2문장 요약 (존댓말 사용)",
+                    },
+                    "sentiment": {
+                        "type": "string",
+                        "enum": ["happy", "neutral", "serious", "alert"],
+                    },
+                },
+                "required": ["widget", "briefing", "voice", "sentiment"],
+            },
+        }
+    },
+    "required": ["widgets"],
+}
+
 # 터미널 명령어 처리용 스키마
 COMMAND_SCHEMA = {
     "type": "object",
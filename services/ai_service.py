@@ -1,14 +1,30 @@
-import requests
 import re
 import json
 import logging
-from utils import load_json_config, clean_ai_text
+from utils import clean_ai_text
+from services.config_cache import get_config
+from services.http_pool import http_pool, resolve_http_config
+from services.ai_stream import collect_chunks, iter_ollama_chunks, iter_openai_chunks
+from services.ai_response_cache import get_response_cache, make_cache_key
+from services.ai_router import get_ai_router
 from routes.config import API_CONFIG_PATH, SECRETS_CONFIG_PATH
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
 
+def _resolve_source(config, source_key):
+    """요청된 소스 키 -> (실제 소스 키, 소스 설정). 비활성/미등록이면 general로 대체"""
+    if not source_key:
+        source_key = config.get("default_source", "ollama")
+
+    source_config = config.get("sources", {}).get(source_key)
+    if not source_config or not source_config.get("active"):
+        source_key = "general"
+        source_config = config.get("sources", {}).get(source_key)
+    return source_key, source_config
+
+
 def query_ai(
     prompt,
     source_key=None,
@@ -16,22 +32,69 @@ def query_ai(
     context_data=None,
     system_instruction=None,
     with_search=True,
+    on_delta=None,
+    use_cache=None,
+    call_site=None,
 ):
     """
     AEGIS Unified AI Hub: Dispatches queries to appropriate LLM engines.
     If is_system=True, it applies the AEGIS persona and can include context_data.
+    [v4.3.0] on_delta(chunk)가 주어지면 엔진 스트리밍 모드로 호출하고 원문 청크를 순서대로 전달
+    [v4.3.0] 동일 질의는 응답 캐시에서 반환 (with_search 질의는 use_cache=True 또는 cache_search 설정 시에만)
+    [v4.3.0] call_site(terminal, briefing, proactive_alert ...)별 라우팅 정책으로 장애 조치/헤징 (api.json "routing")
     """
-    config = load_json_config(API_CONFIG_PATH)
-    secrets = load_json_config(SECRETS_CONFIG_PATH)
+    config = get_config(API_CONFIG_PATH)
+    resolved_key, source_config = _resolve_source(config, source_key)
 
-    # 1. Determine Source
-    if not source_key:
-        source_key = config.get("default_source", "ollama")
+    def attempt(key, delta_callback):
+        return _query_engine(prompt, key, system_instruction, with_search, delta_callback)
 
-    source_config = config.get("sources", {}).get(source_key)
-    if not source_config or not source_config.get("active"):
-        source_key = "general"
-        source_config = config.get("sources", {}).get(source_key)
+    def routed():
+        return get_ai_router().route(
+            call_site, resolved_key, attempt, config.get("sources", {}), on_delta
+        )
+
+    cache = get_response_cache()
+    if not cache.should_use(with_search=with_search, use_cache=use_cache):
+        return routed()
+
+    cache_key = make_cache_key(
+        resolved_key,
+        (source_config or {}).get("model"),
+        system_instruction,
+        prompt,
+        context_data,
+    )
+    cached = cache.get(cache_key)
+    if cached is not None:
+        if on_delta and cached.get("raw"):
+            # 스트리밍 요청이면 캐시된 원문을 한 번에 전달 (HUD 증분 표시 경로 유지)
+            collect_chunks([cached["raw"]], on_delta)
+        return {**cached, "cached": True}
+
+    result = routed()
+    if result.get("status") == "success":
+        cache.put(cache_key, result)
+    return result
+
+
+def query_source(
+    prompt, source_key, system_instruction=None, with_search=False, on_delta=None
+):
+    """
+    [v4.3.0] 지정한 소스 하나에 직접 질의 (라우팅 정책/응답 캐시 미적용).
+    자체 라우팅을 하는 호출 측(브리핑 장애 조치 등)에서 fallback 소스를 호출할 때 사용
+    """
+    return _query_engine(prompt, source_key, system_instruction, with_search, on_delta)
+
+
+def _query_engine(prompt, source_key, system_instruction, with_search, on_delta):
+    # [v4.3.0] 쿼리마다 api.json/secrets.json 재파싱 방지 (불변 스냅샷)
+    config = get_config(API_CONFIG_PATH)
+    secrets = get_config(SECRETS_CONFIG_PATH)
+
+    # 1. Determine Source
+    source_key, source_config = _resolve_source(config, source_key)
 
     if not source_config:
         return {"status": "error", "message": f"AI Source '{source_key}' not found."}
@@ -48,9 +111,19 @@ def query_ai(
             from services.gemini_service import query_gemini
 
             gemini_result = query_gemini(
-                prompt, system_instruction=system_instruction, with_search=with_search
+                prompt,
+                system_instruction=system_instruction,
+                with_search=with_search,
+                on_delta=on_delta,
             )
 
+            if gemini_result.get("status") == "error":
+                # [v4.3.0] 오류 응답을 성공으로 포장하지 않음 (라우터 장애 조치 판단 기준)
+                return {
+                    "status": "error",
+                    "message": gemini_result.get("display") or "Gemini error",
+                }
+
             if "response" in gemini_result or "display" in gemini_result:
                 # 이미 규격화된 응답인 경우 그대로 반환하거나 재파싱
                 raw_text = (
@@ -82,7 +155,7 @@ def query_ai(
 
     if api_type == "ollama":
         combined_prompt = f"System: {system_instruction}\n\nUser: {prompt}"
-        payload = {"model": model, "prompt": combined_prompt, "stream": False}
+        payload = {"model": model, "prompt": combined_prompt, "stream": bool(on_delta)}
     elif api_type == "openai":
         api_key = secrets.get("AI_PROVIDER_KEYS", {}).get(source_key, "")
         if api_key:
@@ -95,23 +168,42 @@ def query_ai(
                 {"role": "user", "content": prompt},
             ],
             "temperature": 0.7,
-            "stream": False,
+            "stream": bool(on_delta),
         }
 
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=60)
-        if response.status_code != 200:
-            return {
-                "status": "error",
-                "message": f"AI Engine Error: {response.status_code}",
-            }
-
-        result = response.json()
-        full_text = ""
-        if api_type == "ollama":
-            full_text = result.get("response", "")
-        elif api_type == "openai":
-            full_text = result["choices"][0].get("message", {}).get("content", "")
+        # [v4.3.0] 소스별 keep-alive 세션 재사용 + 타임아웃/재시도 (api.json "http")
+        http_config = resolve_http_config(config, source_key)
+        response = http_pool.post(
+            source_key,
+            http_config,
+            url,
+            headers=headers,
+            json=payload,
+            stream=bool(on_delta),
+        )
+        with response:
+            if response.status_code != 200:
+                return {
+                    "status": "error",
+                    "message": f"AI Engine Error: {response.status_code}",
+                }
+
+            full_text = ""
+            if on_delta:
+                # [v4.3.0] 토큰 스트리밍: 청크를 즉시 전달하고 전체 원문은 기존 파서로 처리
+                chunks = (
+                    iter_ollama_chunks(response)
+                    if api_type == "ollama"
+                    else iter_openai_chunks(response)
+                )
+                full_text = collect_chunks(chunks, on_delta)
+            else:
+                result = response.json()
+                if api_type == "ollama":
+                    full_text = result.get("response", "")
+                elif api_type == "openai":
+                    full_text = result["choices"][0].get("message", {}).get("content", "")
 
         # Use unified parser for [DISPLAY]/[VOICE] support
         display_part, voice_part = _parse_dual_response(full_text)
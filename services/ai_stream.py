@@ -0,0 +1,165 @@
+"""
+AEGIS AI Stream
+LLM 엔진의 토큰 스트리밍 응답을 HUD용 증분 이벤트(ai_chat_delta)로 변환합니다.
+- 엔진별 청크 파서: Ollama (JSON Lines), OpenAI 호환 (SSE). Gemini는 gemini_service가 SDK 스트림을 직접 사용
+- DisplayStreamFilter: 누적 원문에서 [DISPLAY] 영역만 증분 추출 ([VOICE]/[ACTION] 이후 및 미완성 태그는 보류)
+- DisplayStream: 증분 텍스트를 min_interval 단위로 묶어 요청한 sid에만 전송
+"""
+
+import re
+import json
+import time
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STREAM_CONFIG = {"enabled": True, "min_interval": 0.05, "tts_pipeline": True}
+
+_DISPLAY_TAG = "[DISPLAY]"
+_DISPLAY_RE = re.compile(r"\[DISPLAY\]", re.IGNORECASE)
+_END_RE = re.compile(r"\[(?:VOICE|ACTION)\]", re.IGNORECASE)
+
+# 태그 앞에 붙는 마크다운 장식(**, ###) 허용 범위 - 이 길이 전까지는 [DISPLAY] 등장 여부를 기다림
+_TAG_WAIT_CHARS = 16
+
+
+def _decode_lines(response):
+    """SSE/JSON Lines 응답을 UTF-8 줄 단위로 (charset 헤더 누락 시의 Latin-1 오판 방지)"""
+    for raw in response.iter_lines():
+        if raw:
+            yield raw.decode("utf-8", errors="replace")
+
+
+def iter_ollama_chunks(response):
+    """Ollama stream=true 응답 (줄마다 {"response": "...", "done": bool})"""
+    for line in _decode_lines(response):
+        data = json.loads(line)
+        if data.get("response"):
+            yield data["response"]
+        if data.get("done"):
+            break
+
+
+def iter_openai_chunks(response):
+    """OpenAI 호환 SSE 응답 (data: {...choices[].delta.content} ... data: [DONE])"""
+    for line in _decode_lines(response):
+        if not line.startswith("data:"):
+            continue
+        payload = line[5:].strip()
+        if payload == "[DONE]":
+            break
+        data = json.loads(payload)
+        for choice in data.get("choices", []):
+            piece = (choice.get("delta") or {}).get("content")
+            if piece:
+                yield piece
+
+
+def collect_chunks(chunks, on_delta=None):
+    """청크를 on_delta로 전달하면서 전체 원문을 조립해 반환"""
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        if on_delta:
+            try:
+                on_delta(chunk)
+            except Exception as e:
+                logger.error(f"[AIStream] Delta callback error: {e}")
+    return "".join(parts)
+
+
+class DisplayStreamFilter:
+    """
+    누적 원문 -> 현재까지 표시 가능한 [DISPLAY] 텍스트.
+    feed()는 (delta, reset)을 반환하며, reset=True이면 delta가 전체 텍스트를 대체합니다
+    (예: 태그 없는 서두 뒤에 [DISPLAY]가 늦게 등장한 경우).
+    """
+
+    def __init__(self):
+        self._parts = []
+        self._emitted = ""
+
+    def visible(self, final=False):
+        text = "".join(self._parts).lstrip()
+        if not text or text[0] in "{`":
+            # JSON/코드 블록 래퍼 응답은 최종 파싱 결과로만 표시
+            return ""
+
+        match = _DISPLAY_RE.search(text)
+        if match:
+            # "**[DISPLAY]**" 형태의 닫는 강조 기호 제거
+            body = text[match.end() :].lstrip().lstrip("*")
+        elif not final and len(text) < _TAG_WAIT_CHARS and "[" in text:
+            return ""
+        else:
+            body = text
+
+        end = _END_RE.search(body)
+        if end:
+            body = body[: end.start()].rstrip().rstrip("*")
+        elif not final:
+            # 꼬리의 미완성 태그("[VOI")는 다음 청크까지 보류
+            bracket = body.rfind("[")
+            if bracket != -1 and "]" not in body[bracket:] and len(body) - bracket <= len(_DISPLAY_TAG):
+                body = body[:bracket]
+        return body.lstrip()
+
+    def feed(self, chunk, final=False):
+        if chunk:
+            self._parts.append(chunk)
+        current = self.visible(final=final)
+        if current.startswith(self._emitted):
+            delta, reset = current[len(self._emitted) :], False
+        else:
+            delta, reset = current, True
+        self._emitted = current
+        return delta, reset
+
+
+class DisplayStream:
+    """DisplayStreamFilter 결과를 묶어서 emit(payload)로 전송하는 ai_chat_delta 발행기"""
+
+    def __init__(self, emit, min_interval=DEFAULT_STREAM_CONFIG["min_interval"], stream_id=None):
+        self.emit = emit
+        self.min_interval = min_interval
+        self.stream_id = stream_id or uuid.uuid4().hex[:12]
+        self._filter = DisplayStreamFilter()
+        self._pending = ""
+        self._reset = False
+        self._seq = 0
+        self._last_emit = 0.0
+
+    def feed(self, chunk):
+        delta, reset = self._filter.feed(chunk)
+        if reset:
+            self._pending, self._reset = delta, True
+        else:
+            self._pending += delta
+        if self._pending and time.monotonic() - self._last_emit >= self.min_interval:
+            self._flush()
+
+    def close(self):
+        """남은 원문까지 반영하여 마지막 증분 전송"""
+        delta, reset = self._filter.feed("", final=True)
+        if reset:
+            self._pending, self._reset = delta, True
+        else:
+            self._pending += delta
+        if self._pending or self._reset:
+            self._flush()
+
+    def _flush(self):
+        payload = {
+            "stream_id": self.stream_id,
+            "seq": self._seq,
+            "delta": self._pending,
+            "reset": self._reset,
+        }
+        self._seq += 1
+        self._pending, self._reset = "", False
+        self._last_emit = time.monotonic()
+        try:
+            self.emit(payload)
+        except Exception as e:
+            logger.error(f"[AIStream] Emit error: {e}")
@@ -17,7 +17,7 @@ class AccessControl:
 
         try:
             from routes.config import SECRETS_CONFIG_PATH
-            from utils import load_json_config
+            from services.config_cache import load_json_config
 
             secrets = load_json_config(SECRETS_CONFIG_PATH)
             external_keys = secrets.get("EXTERNAL_API_KEYS", {})
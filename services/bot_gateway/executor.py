@@ -27,6 +27,10 @@ class ActionExecutor:
             get_all_actions,
             get_action_view_handler,
         )
+        from services.plugin_registry.deferred_manager import ensure_plugin_loaded
+
+        # [v4.3.0] 지연 로딩 플러그인의 액션은 최초 실행 시 모듈 로드
+        ensure_plugin_loaded(action_info[0])
 
         action_key = f"{action_info[0]}_{action_info[1]}".upper()
         providers, _ = get_all_actions()
@@ -1,4 +1,4 @@
-from utils import get_i18n
+from services.i18n_catalog import get_i18n
 
 
 class ResponseFormatter:
@@ -1,7 +1,7 @@
 import re
 import logging
 from typing import Optional, Dict
-from utils import get_i18n
+from services.i18n_catalog import get_i18n
 
 logger = logging.getLogger(__name__)
 
@@ -4,7 +4,11 @@ import pytz
 import os
 from datetime import datetime
 from typing import Optional, Dict
-from utils import get_i18n, load_settings
+from services.config_cache import get_settings
+from services.i18n_catalog import get_i18n
+from services.ai_stream import DEFAULT_STREAM_CONFIG, DisplayStream
+from services.tts_pipeline import TtsPipeline
+from services.prompt_compiler import prompt_compiler
 from . import ai_service, voice_service
 
 logger = logging.getLogger(__name__)
@@ -58,6 +62,51 @@ class IntelligenceHub:
     def __init__(self, broadcast_callback=None):
         self.broadcast_callback = broadcast_callback
 
+    def _open_streams(self, settings, sid: Optional[str]):
+        """
+        [v4.3.0] 요청한 클라이언트(sid) 전용 스트림 생성.
+        DisplayStream: [DISPLAY] 증분 -> ai_chat_delta / TtsPipeline: [VOICE] 문장별 음성 -> ai_tts_segment
+        """
+        if not sid or not self.broadcast_callback:
+            return None, None
+        config = dict(DEFAULT_STREAM_CONFIG)
+        config.update(settings.get("ai_stream") or {})
+        if not config.get("enabled"):
+            return None, None
+        display_stream = DisplayStream(
+            lambda payload: self.broadcast_callback("ai_chat_delta", payload, sid=sid),
+            min_interval=config["min_interval"],
+        )
+        tts_pipeline = None
+        if config.get("tts_pipeline"):
+            tts_pipeline = TtsPipeline(
+                lambda payload: self.broadcast_callback("ai_tts_segment", payload, sid=sid),
+                stream_id=display_stream.stream_id,
+            )
+        return display_stream, tts_pipeline
+
+    def _abort_stream(self, display_stream, user_input, error_text, sid):
+        """[v4.3.0] 실패한 스트림 종료: 남은 증분을 보내고 stream_id가 담긴 오류 ai_chat으로 말풍선 교체"""
+        try:
+            display_stream.close()
+            self.broadcast_callback(
+                "ai_chat",
+                {
+                    "input": user_input,
+                    "response": error_text,
+                    "briefing": "",
+                    "audio_url": None,
+                    "audio_playlist": [],
+                    "visual_type": "ai",
+                    "motion": "neutral",
+                    "stream_id": display_stream.stream_id,
+                    "error": True,
+                },
+                sid=sid,
+            )
+        except Exception as e:
+            logger.error(f"[IntelligenceHub] Stream abort failed: {e}")
+
     def fallback_to_ai(
         self,
         text: str,
@@ -79,9 +128,12 @@ class IntelligenceHub:
         )
 
         logger.info(f"AI Fallback Query (sid={sid}): {text[:50]}...")
+        display_stream = tts_pipeline = None
+        error_text = None
         try:
             # 1. 플러그인 컨텍스트 수집 (제한된 플러그인이 있으면 그 정보만 수집)
-            settings = load_settings()
+            # [v4.3.0] 요청당 1회 불변 스냅샷 조회 (디스크/파싱은 캐시가 처리)
+            settings = get_settings()
             tz_name = settings.get("timezone", "Asia/Seoul")
             try:
                 tz = pytz.timezone(tz_name)
@@ -92,63 +144,48 @@ class IntelligenceHub:
             now_tz = datetime.now(tz)
             current_time = now_tz.strftime("%Y-%m-%d %H:%M:%S")
 
-            # [v3.7.2] 전용 플러그인 프롬프트 우선 로드
-            plugin_specific_prompt = ""
-            if restrict_to_plugin_id:
-                plugin_specific_prompt = load_plugin_ai_prompt(restrict_to_plugin_id)
+            lang_setting = lang or settings.get("lang", "ko")
 
-            # 프롬프트 로드 (기본 페르소나 및 시스템 컨텍스트)
-            persona_prompt = load_prompt("01_persona.md")
-            system_context_template = load_prompt("02_system_context.md")
+            from services.plugin_registry import (
+                get_all_actions,
+                ensure_plugin_loaded,
+                get_action_tokenizer,
+                dispatch_actions,
+            )
 
-            # 하이브리드 모드 시 플러그인 전용 지침이 있으면 그것을 우선, 없으면 기본 extra_instruction 사용
-            role_context = plugin_specific_prompt or extra_instruction
+            # [v4.3.0] 지연 로딩 플러그인의 액션 지침이 누락되지 않도록 선 로드
+            if restrict_to_plugin_id:
+                ensure_plugin_loaded(restrict_to_plugin_id)
 
-            system_prompt = system_context_template.format(
-                current_time=current_time,
+            # [v4.3.0] 정적 지침(페르소나/시스템 컨텍스트/언어/액션/응답 형식)은 컴파일 캐시 사용,
+            # 호출마다 current_time 슬롯만 채움
+            compiled_prompt = prompt_compiler.compile(
+                lang=lang_setting,
                 tz_name=tz_name,
-                role_context=role_context,
+                restrict_to_plugin_id=restrict_to_plugin_id,
+                extra_instruction=extra_instruction,
+                legacy_prompts=action_prompts,
+            )
+            ai_instruction = compiled_prompt.render(current_time)
+            logger.debug(
+                f"[IntelligenceHub] Instruction size: ~{compiled_prompt.tokens} tokens"
             )
 
-            ai_instruction = f"{persona_prompt}\n\n{system_prompt}\n"
-
-            # [v3.8.1] 언어 설정 강제 (브리핑 언어 불일치 방지)
-            lang_setting = lang or load_settings().get("lang", "ko")
-            if lang_setting == "ko":
-                ai_instruction += "\nCRITICAL: 모든 응답([DISPLAY], [VOICE])은 반드시 **한국어**로 작성하십시오.\n"
-            else:
-                ai_instruction += (
-                    f"\nCRITICAL: YOU MUST RESPOND IN {lang_setting.upper()}.\n"
-                )
-
-            # [v3.7.1] PluginRegistry에서 통합 시스템 액션 지침 수집 (필터링 지원)
-            from services.plugin_registry import get_all_actions
-
-            reg_handlers, reg_prompts = get_all_actions(plugin_id=restrict_to_plugin_id)
-
-            # [v3.7.5] 기존 legacy action_prompts도 필터링 조건이 있을 경우 배제 시도
-            # (BotManager에 직접 등록된 것들은 plugin_id 정보가 부족할 수 있으므로 주의)
-            combined_prompts = reg_prompts
-            combined_handlers = reg_handlers
-
+            # [v3.7.5] 기존 legacy action_handlers는 필터링 조건이 없을 때만 병합
+            # (레지스트리 dict를 직접 수정하지 않도록 복사본 사용)
+            reg_handlers, _ = get_all_actions(plugin_id=restrict_to_plugin_id)
+            combined_handlers = dict(reg_handlers)
             if not restrict_to_plugin_id:
-                combined_prompts.update(action_prompts or {})
                 combined_handlers.update(action_handlers or {})
 
-            if combined_prompts:
-                ai_instruction += "\n[AVAILABLE ACTIONS]\n"
-                # [v3.8.0] 앨리어싱 지침 강화 및 동적 프롬프트 전면 적용
-                if restrict_to_plugin_id:
-                    ai_instruction += f"(Context: 이 사용자 요청은 오직 {restrict_to_plugin_id} 플러그인의 범위 내에서 처리되어야 합니다. 타 플러그인의 액션 태그를 절대 사용하지 마십시오.)\n"
+            # AI 질의 수행 (sid가 있으면 토큰 스트리밍 + 문장 단위 TTS 파이프라인)
+            display_stream, tts_pipeline = self._open_streams(settings, sid)
 
-                for key, part in combined_prompts.items():
-                    ai_instruction += f"{part}\n"
+            def on_delta(chunk):
+                display_stream.feed(chunk)
+                if tts_pipeline:
+                    tts_pipeline.feed(chunk)
 
-            response_format = load_prompt("04_response_format.md")
-            if response_format:
-                ai_instruction += f"\n\n{response_format}\n"
-
-            # AI 질의 수행
             ai_result = ai_service.query_ai(
                 text,
                 source_key=model,
@@ -156,9 +193,13 @@ class IntelligenceHub:
                 context_data=context_data,
                 is_system=True,
                 with_search=with_search,
+                on_delta=on_delta if display_stream else None,
+                call_site="terminal",
             )
 
             if ai_result.get("status") == "success":
+                if display_stream:
+                    display_stream.close()
                 display_text = ai_result.get(
                     "display", get_i18n("bot.ai_error_no_response", lang=lang)
                 )
@@ -166,20 +207,9 @@ class IntelligenceHub:
                 raw_response = ai_result.get("raw") or display_text
 
                 # 동적 액션 핸들러 처리
-                action_triggered = False
-                for action_key, handler in combined_handlers.items():
-                    key_alt = action_key.replace("_", "")
-                    pattern = rf"\[ACTION\]\s*({re.escape(action_key)}|{re.escape(key_alt)}):\s*(.*?)(?:\n|$)"
-
-                    match = re.search(pattern, raw_response, re.IGNORECASE)
-                    if match:
-                        action_data = match.group(2).strip()
-                        logger.debug(f"[IntelligenceHub] 🎯 Action Triggered: {action_key}")
-                        try:
-                            handler(action_data, target_id)
-                            action_triggered = True
-                        except Exception as e:
-                            logger.error(f"Action handler error ({action_key}): {e}")
+                # [v4.3.0] 단일 패스 추출 (모든 호출), O(1) 키 조회, 플러그인 간 병렬 실행
+                invocations = get_action_tokenizer(combined_handlers).extract(raw_response)
+                dispatch_actions(invocations, combined_handlers, target_id)
 
                 # 정제된 텍스트 생성
                 clean_display = re.sub(
@@ -192,8 +222,14 @@ class IntelligenceHub:
                     flags=re.DOTALL | re.IGNORECASE,
                 ).strip()
 
-                # TTS 생성
-                audio_url = voice_service.generate_cached_tts(clean_briefing)
+                # TTS 생성 (파이프라인 사용 시 이미 문장별 세그먼트가 같은 sid로 전송됨)
+                # 전체 문장 음성은 세그먼트가 없을 때만 합성 (중복 합성으로 최종 응답이 늦어지지 않도록)
+                audio_playlist = []
+                if tts_pipeline:
+                    audio_playlist = tts_pipeline.close(clean_briefing)
+                audio_url = (
+                    None if audio_playlist else voice_service.generate_cached_tts(clean_briefing)
+                )
 
                 # HUD 이벤트 전송 (콜백 사용)
                 if self.broadcast_callback:
@@ -204,20 +240,33 @@ class IntelligenceHub:
                             "response": clean_display,
                             "briefing": clean_briefing,
                             "audio_url": audio_url,
+                            "audio_playlist": audio_playlist,
                             "visual_type": ai_result.get("visual_type", "ai"),
                             "motion": "happy"
                             if ai_result.get("sentiment") == "positive"
                             else "neutral",
+                            # [v4.3.0] 스트리밍 중이던 말풍선을 최종 파싱 결과로 교체하기 위한 식별자
+                            "stream_id": display_stream.stream_id
+                            if display_stream
+                            else None,
                         },
                         sid=sid,
                     )
 
                 return {"text": clean_display}
             else:
-                return {
-                    "text": f"{get_i18n('bot.ai_fallback_error', lang=lang)}: {ai_result.get('message')}"
-                }
+                error_text = f"{get_i18n('bot.ai_fallback_error', lang=lang)}: {ai_result.get('message')}"
+                return {"text": error_text}
 
         except Exception as e:
             logger.error(f"AI Fallback Error: {e}")
-            return {"text": f"{get_i18n('bot.ai_system_error', lang=lang)}: {str(e)}"}
+            error_text = f"{get_i18n('bot.ai_system_error', lang=lang)}: {str(e)}"
+            return {"text": error_text}
+        finally:
+            if error_text is not None:
+                # [v4.3.0] 실패한 응답의 남은 음성 세그먼트는 버리고 종료 마커 전송
+                if tts_pipeline:
+                    tts_pipeline.cancel()
+                # [v4.3.0] 실패 시에도 스트리밍 말풍선이 남지 않도록 종료 이벤트 전송
+                if display_stream:
+                    self._abort_stream(display_stream, user_input or text, error_text, sid)
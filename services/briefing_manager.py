@@ -1,10 +1,40 @@
 import os
+import re
 import json
 import time
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from services import gemini_service, voice_service
 from routes.config import I18N_DIR
-from utils import load_json_config, load_settings
+from services.config_cache import get_config, load_json_config, load_settings
+from services.single_flight import single_flight, fingerprint
+from services.context_fingerprint import context_fingerprint
+from services.prompt_encoder import render_context
+from services.ai_router import get_ai_router
+from routes.config import API_CONFIG_PATH
+
+# [v4.3.0] 위젯 일괄 브리핑의 음성 파일 동시 생성 상한
+WIDGET_TTS_WORKERS = 4
+
+# [v4.3.0] 컨텍스트 지문 브리핑 캐시 기본값 (volatile_keys=None이면 기본 휘발성 필드 패턴)
+DEFAULT_BRIEFING_CACHE = {
+    "enabled": True,
+    "max_age": 900,
+    "volatile_keys": None,
+    "float_precision": 1,
+}
+
+
+def _extract_json(text):
+    """텍스트 엔진 응답에서 첫 JSON 객체 추출 (없으면 빈 dict)"""
+    match = re.search(r"\{.*\}", text or "", re.DOTALL)
+    if not match:
+        return {}
+    try:
+        data = json.loads(match.group(0))
+        return data if isinstance(data, dict) else {}
+    except ValueError:
+        return {}
 
 
 class BriefingManager:
@@ -27,9 +57,36 @@ class BriefingManager:
         # Fallback to ko
         return load_json_config(os.path.join(I18N_DIR, "ko.json"))
 
-    def get_briefing(self, context_data, debug_mode=True):
+    def _route(self, call_site, gemini_call, prompt):
+        """
+        [v4.3.0] Gemini 전용 호출을 1차 소스(general)로 두고, api.json routing 정책의 fallbacks 소스에는
+        같은 프롬프트를 텍스트 엔진으로 전달 (장애/지연 시 전환 및 헤징)
+        """
+        from services import ai_service
+
+        def attempt(source, _on_delta):
+            if source == "general":
+                return gemini_call()
+            result = ai_service.query_source(prompt, source)
+            if result.get("status") != "success":
+                return result
+            data = _extract_json(result.get("raw"))
+            return {
+                "display": data.get("briefing") or data.get("text") or result["display"],
+                "briefing": data.get("voice") or result["briefing"],
+                "sentiment": data.get("sentiment", "neutral"),
+                "visual_type": data.get("visual_type", "none"),
+                "status": "success",
+            }
+
+        sources = get_config(API_CONFIG_PATH).get("sources", {})
+        return get_ai_router().route(call_site, "general", attempt, sources)
+
+    def get_briefing(self, context_data, debug_mode=True, cache_config=None):
         """
         캐시를 확인하거나 새로운 브리핑을 생성하여 반환
+        [v4.3.0] cache_config(proactive-agent config.json "briefing_cache"): 컨텍스트 지문이 같고
+        max_age(초) 이내면 이전 브리핑/음성을 즉시 반환. 응답의 cache_hit로 적중 여부 표시
         """
         # 1. 개발 모드 파일 캐시 확인
         if (
@@ -41,62 +98,161 @@ class BriefingManager:
                 with open(self.text_cache_path, "r", encoding="utf-8") as f:
                     cached_data = json.load(f)
 
-                return {
-                    "display": cached_data.get("display")
-                    or cached_data.get("briefing"),
-                    "briefing": cached_data.get("briefing"),
-                    "sentiment": cached_data.get("sentiment", "neutral"),
-                    "visual_type": cached_data.get("visual_type", "none"),
-                    "audio_url": f"/static/audio/last_briefing.mp3?t={os.path.getmtime(self.audio_cache_path)}",
-                    "debug_prompt": cached_data.get("debug_prompt"),
-                    "debug_response": cached_data.get("debug_response"),
-                }
+                return self._compose(
+                    cached_data,
+                    f"/static/audio/last_briefing.mp3?t={os.path.getmtime(self.audio_cache_path)}",
+                    cache_hit=True,
+                )
             except Exception:
                 pass
 
+        # 2. [v4.3.0] 컨텍스트 지문 기반 캐시 (휘발성 필드 제외, 실질적 변화 시에만 재생성)
+        cache_config = {**DEFAULT_BRIEFING_CACHE, **(cache_config or {})}
+        context_fp = None
+        if cache_config["enabled"]:
+            context_fp = context_fingerprint(
+                context_data,
+                volatile_keys=cache_config["volatile_keys"],
+                float_precision=cache_config["float_precision"],
+            )
+            cached = self._load_fresh_briefing(context_fp, cache_config["max_age"])
+            if cached is not None:
+                return cached
+
+        # [v4.3.0] 여러 탭/기기에서 동시에 요청한 같은 브리핑은 1회만 생성 (LLM 호출 및 last_briefing.mp3 기록 1회)
+        key = (
+            "briefing",
+            self.audio_cache_path,
+            debug_mode,
+            context_fp or fingerprint(context_data),
+        )
+        return single_flight.do(
+            key, self._generate_briefing, context_data, debug_mode, context_fp
+        )
+
+    @staticmethod
+    def _compose(data, audio_url, cache_hit=False):
+        briefing_text = data.get("briefing", "")
+        return {
+            "display": data.get("display") or briefing_text,
+            "briefing": briefing_text,
+            "sentiment": data.get("sentiment", "neutral"),
+            "visual_type": data.get("visual_type", "none"),
+            "audio_url": audio_url,
+            "debug_prompt": data.get("debug_prompt"),
+            "debug_response": data.get("debug_response"),
+            "cache_hit": cache_hit,
+        }
+
+    def _load_fresh_briefing(self, context_fp, max_age):
+        """같은 지문으로 생성된 브리핑이 max_age 이내이고 음성 파일이 그대로면 반환"""
+        try:
+            with open(self.text_cache_path, "r", encoding="utf-8") as f:
+                cached_data = json.load(f)
+            audio_mtime = os.path.getmtime(self.audio_cache_path)
+        except (OSError, ValueError):
+            return None
+
+        age = time.time() - cached_data.get("generated_at", 0)
+        if (
+            cached_data.get("context_fingerprint") != context_fp
+            or age > max_age
+            # 선제 알림 등 다른 생성 경로가 last_briefing.mp3를 덮어쓴 경우 무효
+            or cached_data.get("audio_mtime") != audio_mtime
+        ):
+            return None
+
+        print(f"[BriefingManager] [CACHE] Context unchanged, reusing briefing ({int(age)}s old)")
+        result = self._compose(
+            cached_data, f"/static/audio/last_briefing.mp3?t={audio_mtime}", cache_hit=True
+        )
+        result["cache_age"] = round(age, 1)
+        return result
+
+    def _generate_briefing(self, context_data, debug_mode, context_fp=None):
         # 2. 새로운 Gemini 브리핑 생성 (Gemini 서비스 내부에서 언어 인지)
         print(
             f"[BriefingManager] [ACTION] Generating fresh briefing for context keys: {list(context_data.keys())}"
         )
-        result = gemini_service.get_briefing(
-            self.api_key, context_data, debug_mode=debug_mode
+        prompt, _ = gemini_service.build_briefing_prompt(context_data)
+        result = self._route(
+            "briefing",
+            lambda: gemini_service.get_briefing(
+                self.api_key, context_data, debug_mode=debug_mode
+            ),
+            prompt,
         )
         briefing_text = result.get("briefing", "")
         print(
             f"[BriefingManager] [DEBUG] Briefing text generated ({len(briefing_text)} chars). Sentiment: {result.get('sentiment')}"
         )
 
-        # 3. 파일 캐시 저장 (JSON)
-        os.makedirs(os.path.dirname(self.text_cache_path), exist_ok=True)
-        with open(self.text_cache_path, "w", encoding="utf-8") as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
-
-        # 4. 음성 파일 생성 (MP3) - Voice Service 내부에서 언어별 보이스 자동 할당
+        # 3. 음성 파일 생성 (MP3) - Voice Service 내부에서 언어별 보이스 자동 할당
         print("[BriefingManager] [ACTION] Generating MP3 for briefing text...")
         voice_service.generate_edge_tts(
             briefing_text, output_path=self.audio_cache_path
         )
 
+        # 4. 파일 캐시 저장 (JSON) - 실패한 생성 결과는 지문 캐시에 등록하지 않음
+        cached_data = dict(result)
+        if context_fp and result.get("status") != "error":
+            cached_data["context_fingerprint"] = context_fp
+            cached_data["generated_at"] = time.time()
+            if os.path.exists(self.audio_cache_path):
+                cached_data["audio_mtime"] = os.path.getmtime(self.audio_cache_path)
+        os.makedirs(os.path.dirname(self.text_cache_path), exist_ok=True)
+        with open(self.text_cache_path, "w", encoding="utf-8") as f:
+            json.dump(cached_data, f, ensure_ascii=False, indent=2)
+
         # 5. 최종 결과 조합
-        return {
-            "display": result.get("display", briefing_text),
-            "briefing": briefing_text,
-            "sentiment": result.get("sentiment", "neutral"),
-            "visual_type": result.get("visual_type", "none"),
-            "audio_url": f"/static/audio/last_briefing.mp3?t={time.time()}",
-            "debug_prompt": result.get("debug_prompt"),
-            "debug_response": result.get("debug_response"),
-        }
+        return self._compose(
+            result, f"/static/audio/last_briefing.mp3?t={time.time()}"
+        )
 
     def get_widget_briefing(self, widget_type, widget_data):
         """
         특정 위젯 데이터만 분석하여 요약 브리핑 생성
         """
+        # [v4.3.0] 같은 위젯/데이터에 대한 동시 요청은 1회만 생성
+        key = ("widget_briefing", widget_type, fingerprint(widget_data))
+        return single_flight.do(
+            key, self._generate_widget_briefing, widget_type, widget_data
+        )
+
+    def _generate_widget_briefing(self, widget_type, widget_data):
         # 1. Gemini 분석 요청
         result = gemini_service.get_widget_briefing(
             self.api_key, widget_type, widget_data
         )
-        briefing_text = result.get("briefing", "")
+        return self._finish_widget_briefing(widget_type, result)
+
+    def get_widget_briefings(self, widget_items):
+        """
+        [v4.3.0] 여러 위젯 요약을 LLM 1회 호출로 생성하고 음성은 병렬 합성
+        widget_items: [(widget_type, widget_data), ...] -> {widget_type: get_widget_briefing과 같은 형식}
+        """
+        if not widget_items:
+            return {}
+        key = ("widget_briefings", fingerprint(widget_items))
+        return single_flight.do(key, self._generate_widget_briefings, widget_items)
+
+    def _generate_widget_briefings(self, widget_items):
+        results = gemini_service.get_widget_briefings(self.api_key, widget_items)
+        workers = max(1, min(len(results), WIDGET_TTS_WORKERS))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                widget_type: executor.submit(
+                    self._finish_widget_briefing, widget_type, result
+                )
+                for widget_type, result in results.items()
+            }
+            return {widget_type: f.result() for widget_type, f in futures.items()}
+
+    def _finish_widget_briefing(self, widget_type, result):
+        # 플러그인 브리핑은 음성용 요약을 "voice" 키로 반환
+        briefing_text = (
+            result.get("briefing") or result.get("voice") or result.get("display", "")
+        )
 
         # 2. 음성 파일 생성
         widget_audio_path = self.audio_cache_path.replace(
@@ -123,9 +279,12 @@ class BriefingManager:
 
         # 1. 금융 지수 급변동 체크
         finance = context_data.get("finance")
-        if finance:
+        # AI용 압축 표 문자열 등 원본 형태가 아니면 건너뜀 (호출 측은 for_ai=False 데이터를 전달)
+        if isinstance(finance, dict):
             for name, data in finance.items():
-                change = data.get("change_percent", 0)
+                if not isinstance(data, dict):
+                    continue
+                change = data.get("change_pct_raw", data.get("change_percent", 0))
                 if abs(change) >= thresholds.get("finance_change_abs", 1.5):
                     alert_tpl = alerts.get(
                         "finance_change", "Financial Index Alert: {name} {change}%"
@@ -138,8 +297,12 @@ class BriefingManager:
 
         # 2. 일정 임박 체크 (15분 이내)
         calendar_events = context_data.get("calendar", [])
+        if not isinstance(calendar_events, list):
+            calendar_events = []
         now = datetime.datetime.now().astimezone()
         for event in calendar_events:
+            if not isinstance(event, dict):
+                continue
             start_str = event.get("start")
             if (
                 start_str and "T" in start_str
@@ -161,38 +324,60 @@ class BriefingManager:
 
         # 3. 트리거가 감지되면 Gemini에게 상황 보고 요청
         if triggers:
-            # gemini_service가 언어 설정을 직접 참조하여 올바른 프롬프트를 선택합니다.
-            prompt_data = ", ".join(triggers)
-
-            # gemini_service.get_briefing 처럼 언어별 프롬프트를 가져와야 함
-            # 여기서는 gemini_service에 로직을 맡기거나 직접 프롬프트 생성
-            # gemini_service 고도화 버전을 사용
-            # [Plugin-X] proactive-agent 폴더에서 알림용 프롬프트 로드
-            prompt_tpl = gemini_service._load_plugin_prompt(
-                "proactive-agent", "proactive_alert"
+            # [v4.3.0] 같은 트리거 조합의 동시 점검은 상황 보고 1회만 생성
+            return single_flight.do(
+                ("proactive_alert", self.audio_cache_path, tuple(triggers)),
+                self._generate_alert,
+                triggers,
             )
 
-            if not prompt_tpl:
-                prompt_tpl = "System Alert: {{triggers}}"
+        return {"triggered": False}
 
-            prompt = prompt_tpl.replace("{{triggers}}", prompt_data)
-            result = gemini_service.get_custom_response(self.api_key, prompt)
+    def _generate_alert(self, triggers):
+        # gemini_service가 언어 설정을 직접 참조하여 올바른 프롬프트를 선택합니다.
+        prompt_data = ", ".join(triggers)
 
-            # 음성 생성 (언어별 보이스 자동 선택)
-            voice_service.generate_edge_tts(
-                result.get("briefing", ""), output_path=self.audio_cache_path
-            )
+        # gemini_service.get_briefing 처럼 언어별 프롬프트를 가져와야 함
+        # 여기서는 gemini_service에 로직을 맡기거나 직접 프롬프트 생성
+        # gemini_service 고도화 버전을 사용
+        # [Plugin-X] proactive-agent 폴더에서 알림용 프롬프트 로드
+        prompt_tpl = gemini_service._load_plugin_prompt(
+            "proactive-agent", "proactive_alert"
+        )
 
-            return {
-                "triggered": True,
-                "display": result.get("display"),
-                "briefing": result.get("briefing"),
-                "sentiment": result.get("sentiment", "neutral"),
-                "visual_type": result.get("visual_type", "none"),
-                "audio_url": f"/static/audio/last_briefing.mp3?t={time.time()}",
-            }
+        if not prompt_tpl:
+            prompt_tpl = "System Alert: {{triggers}}"
 
-        return {"triggered": False}
+        prompt = prompt_tpl.replace("{{triggers}}", prompt_data)
+        result = self._route(
+            "proactive_alert",
+            lambda: self._custom_response(prompt),
+            prompt,
+        )
+
+        # 음성 생성 (언어별 보이스 자동 선택)
+        voice_service.generate_edge_tts(
+            result.get("briefing", ""), output_path=self.audio_cache_path
+        )
+
+        return {
+            "triggered": True,
+            "display": result.get("display"),
+            "briefing": result.get("briefing"),
+            "sentiment": result.get("sentiment", "neutral"),
+            "visual_type": result.get("visual_type", "none"),
+            "audio_url": f"/static/audio/last_briefing.mp3?t={time.time()}",
+        }
+
+    def _custom_response(self, prompt):
+        result = gemini_service.get_custom_response(self.api_key, prompt)
+        if isinstance(result, str):
+            # [DISPLAY]/[VOICE] 태그 응답은 원문 문자열로 반환되므로 dict로 정규화
+            from services import ai_service
+
+            display, voice = ai_service._parse_dual_response(result)
+            return {"display": display, "briefing": voice, "status": "success"}
+        return result
 
     def process_ai_command(self, command, context_data, source_key="gemini"):
         """
@@ -212,7 +397,7 @@ class BriefingManager:
             prompt_tpl = "Analyze command: {{command}}\nContext: {{context_data}}\nRespond in JSON Schema."
 
         system_instruction = prompt_tpl.replace(
-            "{{context_data}}", json.dumps(context_data, ensure_ascii=False)
+            "{{context_data}}", render_context(context_data)
         )
 
         res = ai_service.query_ai(
@@ -221,6 +406,7 @@ class BriefingManager:
             is_system=True,
             context_data=context_data,
             system_instruction=system_instruction,
+            call_site="terminal",
         )
 
         # ai_service.query_ai()는 이미 {status, display, briefing...} 형태를 보장함
@@ -0,0 +1,165 @@
+"""
+AEGIS Config Cache
+settings.json 및 JSON 설정 파일의 read-through 캐시입니다.
+- 파싱 결과를 불변 스냅샷(FrozenDict / tuple)으로 보관
+- os.stat (mtime, size) 재검증은 경로별로 check_interval 초에 최대 1회
+- 저장 함수는 config_writer를 통해 기록하며 캐시를 새 내용으로 즉시 갱신 (invalidate/prime 훅)
+"""
+
+import os
+import time
+import threading
+import utils
+from routes.config import BASE_DIR
+
+SETTINGS_PATH = os.path.join(BASE_DIR, "settings.json")
+
+# stat 재검증 최소 간격 (초)
+DEFAULT_CHECK_INTERVAL = 1.0
+
+
+class FrozenDict(dict):
+    """읽기 전용 dict (json 직렬화 및 isinstance(dict) 호환 유지)"""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Config snapshot is read-only. Use load_json_config() for a mutable copy.")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return (dict, (thaw(self),))
+
+
+def freeze(value):
+    """dict -> FrozenDict, list -> tuple 재귀 변환"""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value):
+    """불변 스냅샷을 수정 가능한 dict/list 복사본으로 변환"""
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+def _stat_signature(path):
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+class ConfigCache:
+    """경로별 불변 설정 스냅샷 캐시"""
+
+    def __init__(self, check_interval=DEFAULT_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._entries = {}  # abspath -> {"signature", "snapshot", "checked"}
+        self._lock = threading.Lock()
+
+    def get(self, path, loader=None):
+        """
+        불변 스냅샷 반환. loader: 실제 파일 파싱 함수 (기본 utils.load_json_config)
+        """
+        key = os.path.abspath(path)
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and now - entry["checked"] < self.check_interval:
+            return entry["snapshot"]
+
+        signature = _stat_signature(key)
+        if entry is not None and entry["signature"] == signature:
+            entry["checked"] = now
+            return entry["snapshot"]
+
+        data = (loader or utils.load_json_config)(path)
+        snapshot = freeze(data if data is not None else {})
+        with self._lock:
+            self._entries[key] = {
+                "signature": signature,
+                "snapshot": snapshot,
+                "checked": now,
+            }
+        return snapshot
+
+    def prime(self, path, data):
+        """방금 기록한 내용으로 캐시를 직접 갱신 (다음 조회 시 파일을 다시 읽지 않음)"""
+        key = os.path.abspath(path)
+        with self._lock:
+            self._entries[key] = {
+                "signature": _stat_signature(key),
+                "snapshot": freeze(data),
+                "checked": time.monotonic(),
+            }
+
+    def invalidate(self, path=None):
+        """path 캐시 폐기 (None이면 전체)"""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+
+# 전역 싱글톤 인스턴스
+config_cache = ConfigCache()
+
+
+def get_config(path):
+    """JSON 설정 불변 스냅샷 (읽기 전용 경로용)"""
+    return config_cache.get(path)
+
+
+def get_settings():
+    """settings.json 불변 스냅샷 (읽기 전용 경로용)"""
+    return config_cache.get(SETTINGS_PATH, loader=lambda _path: utils.load_settings())
+
+
+def load_json_config(path):
+    """utils.load_json_config 호환: 캐시 스냅샷의 수정 가능한 복사본"""
+    return thaw(get_config(path))
+
+
+def load_settings():
+    """utils.load_settings 호환: 캐시 스냅샷의 수정 가능한 복사본"""
+    return thaw(get_settings())
+
+
+def invalidate_config(path=None):
+    config_cache.invalidate(path)
+
+
+def save_json_config(path, data, merge=True, backup=False, wait=False):
+    """
+    utils.save_json_config 호환 저장.
+    [v4.3.0] config_writer를 통해 원자적/병합형으로 백그라운드 기록 (캐시는 즉시 갱신)
+    반환: 기록 결과 Future, wait=True면 디스크 기록 성공 여부(bool)
+    """
+    from services.config_writer import config_writer
+
+    return config_writer.write(path, data, merge=merge, backup=backup, wait=wait)
+
+
+def save_settings(data, wait=False):
+    """
+    utils.save_settings 호환 저장 (settings.json에 최상위 키 병합, 부분 dict 저장 허용).
+    반환은 save_json_config와 동일
+    """
+    from services.config_writer import config_writer
+
+    return config_writer.write(SETTINGS_PATH, data, merge=True, wait=wait)
@@ -0,0 +1,191 @@
+"""
+AEGIS Config Writer
+JSON 설정 저장을 요청 스레드에서 분리하는 원자적/병합형 쓰기 서비스입니다.
+- 임시 파일 + fsync + os.replace 원자적 교체 (동시 요청에도 찢어진 파일 없음)
+- 같은 파일에 대한 짧은 시간 내 연속 저장은 마지막 내용 1회 기록으로 병합
+- 백업 이력은 path.bak, path.bak.1 ... 형태로 개수 제한
+- 기록 대기 중에도 config_cache에 새 내용을 반영하여 즉시 읽기 일관성 유지
+- write()는 실제 기록 결과를 담는 Future 반환 (병합된 저장은 같은 Future 공유),
+  wait=True면 호출 스레드에서 바로 기록하고 성공 여부(bool) 반환
+- 기록 실패는 파일별로 보관하여 report() (/api/debug/config_writer)로 확인
+"""
+
+import os
+import copy
+import json
+import time
+import atexit
+import logging
+import tempfile
+import threading
+from concurrent.futures import Future
+from services.config_cache import config_cache, get_config, thaw
+
+logger = logging.getLogger(__name__)
+
+# 연속 저장 병합 대기 시간 (초)
+DEFAULT_COALESCE_WINDOW = 0.25
+
+# 파일당 보관할 백업 개수
+DEFAULT_BACKUP_LIMIT = 5
+
+
+def _backup_paths(path, limit):
+    return [f"{path}.bak"] + [f"{path}.bak.{i}" for i in range(1, limit)]
+
+
+def rotate_backups(path, limit=DEFAULT_BACKUP_LIMIT):
+    """현재 파일을 path.bak으로 보관하고 기존 백업을 한 칸씩 밀어냄 (최대 limit개)"""
+    if limit <= 0 or not os.path.exists(path):
+        return
+    backups = _backup_paths(path, limit)
+    if os.path.exists(backups[-1]):
+        os.remove(backups[-1])
+    for older, newer in zip(reversed(backups[1:]), reversed(backups[:-1])):
+        if os.path.exists(newer):
+            os.replace(newer, older)
+    with open(path, "rb") as src, open(backups[0], "wb") as dst:
+        dst.write(src.read())
+
+
+def write_json_atomic(path, data):
+    """임시 파일에 기록 후 os.replace로 교체"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class ConfigWriter:
+    """백그라운드 스레드 1개로 동작하는 병합형 JSON 설정 기록기"""
+
+    def __init__(
+        self,
+        coalesce_window=DEFAULT_COALESCE_WINDOW,
+        backup_limit=DEFAULT_BACKUP_LIMIT,
+    ):
+        self.coalesce_window = coalesce_window
+        self.backup_limit = backup_limit
+        self._pending = {}  # abspath -> {"path", "data", "due", "backup"}
+        self._cond = threading.Condition()
+        # 꺼내기+기록을 한 단위로 묶어 같은 파일의 기록 순서 역전 방지
+        self._commit_lock = threading.Lock()
+        self._thread = None
+        self.stats = {"requested": 0, "written": 0, "coalesced": 0, "failed": 0}
+        self.failures = {}  # path -> {"error", "at"} (마지막 기록 실패, 이후 성공 시 제거)
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="config-writer", daemon=True
+            )
+            self._thread.start()
+
+    def write(self, path, data, merge=True, backup=False, wait=False):
+        """
+        저장 예약. merge=True면 현재 내용(대기 중인 내용 포함)에 최상위 키 병합.
+        반환: Future (디스크 기록 성공 시 True, 실패 시 예외)
+        wait=True: 병합 대기 없이 호출 스레드에서 기록하고 성공 여부(bool) 반환
+          (저장 결과를 사용자에게 응답하는 경로용)
+        """
+        key = os.path.abspath(path)
+        data = copy.deepcopy(data)
+        with self._cond:
+            pending = self._pending.get(key)
+            if merge and isinstance(data, dict):
+                base = pending["data"] if pending else thaw(get_config(path))
+                if isinstance(base, dict):
+                    base.update(data)
+                    data = base
+
+            self.stats["requested"] += 1
+            if pending:
+                self.stats["coalesced"] += 1
+            future = pending["future"] if pending else Future()
+            self._pending[key] = {
+                "path": path,
+                "data": data,
+                "future": future,
+                # 최초 예약 시각 기준으로 병합 (연속 저장이 기록을 무한히 미루지 않도록)
+                "due": pending["due"]
+                if pending
+                else time.monotonic() + self.coalesce_window,
+                "backup": backup or bool(pending and pending["backup"]),
+            }
+            # 디스크 기록 전에도 읽기 경로가 새 내용을 보도록 캐시 갱신
+            config_cache.prime(path, data)
+            if not wait:
+                self._ensure_thread()
+                self._cond.notify()
+        if wait:
+            self._drain(keys=[key])
+            return future.exception() is None
+        return future
+
+    def _take_due(self, force=False, keys=None):
+        if keys is not None:
+            return [self._pending.pop(k) for k in keys if k in self._pending]
+        now = time.monotonic()
+        due = [k for k, item in self._pending.items() if force or item["due"] <= now]
+        return [self._pending.pop(k) for k in due]
+
+    def _commit(self, item):
+        path = item["path"]
+        try:
+            if item["backup"]:
+                rotate_backups(path, self.backup_limit)
+            write_json_atomic(path, item["data"])
+            config_cache.prime(path, item["data"])
+            self.stats["written"] += 1
+            self.failures.pop(path, None)
+            item["future"].set_result(True)
+        except Exception as e:
+            self.stats["failed"] += 1
+            self.failures[path] = {"error": str(e), "at": time.time()}
+            # 캐시에 미리 반영한 내용을 버리고 디스크의 실제 내용으로 복귀
+            config_cache.invalidate(path)
+            logger.error(f"[ConfigWriter] Failed to write {path}: {e}")
+            item["future"].set_exception(e)
+
+    def _drain(self, force=False, keys=None):
+        with self._commit_lock:
+            with self._cond:
+                items = self._take_due(force=force, keys=keys)
+            for item in items:
+                self._commit(item)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                next_due = min(item["due"] for item in self._pending.values())
+                delay = next_due - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+            self._drain()
+
+    def flush(self):
+        """대기 중인 모든 저장을 호출 스레드에서 즉시 기록 (종료 시/테스트용)"""
+        self._drain(force=True)
+
+    def report(self):
+        with self._cond:
+            pending = len(self._pending)
+        return {"stats": dict(self.stats), "pending": pending, "failures": dict(self.failures)}
+
+
+# 전역 싱글톤 인스턴스
+config_writer = ConfigWriter()
+atexit.register(config_writer.flush)
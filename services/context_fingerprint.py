@@ -0,0 +1,61 @@
+"""
+AEGIS Context Fingerprint
+수집된 플러그인 컨텍스트의 "내용이 실질적으로 바뀌었는지"를 판단하기 위한 안정적인 해시입니다.
+- 휘발성 필드(수집 시각, 가동 시간 등)는 키 이름 패턴(fnmatch, 대소문자 무시)으로 제외
+  일정 시작/마감 시각(start_at, due_at 등)은 내용이므로 수집 기록용 키만 지정
+- 실수는 float_precision 자리로 반올림 (미세한 수치 흔들림으로 해시가 갈리지 않도록)
+- dict 키 정렬 JSON의 sha256
+"""
+
+import json
+import hashlib
+from fnmatch import fnmatchcase
+
+DEFAULT_VOLATILE_KEYS = (
+    "timestamp",
+    "fetched_at",
+    "updated_at",
+    "generated_at",
+    "uptime*",
+    "last_updated",
+    "fetched*",
+    "now",
+    "current_time",
+    "elapsed*",
+)
+
+DEFAULT_FLOAT_PRECISION = 1
+
+
+def _is_volatile(key, patterns):
+    key = str(key).lower()
+    return any(fnmatchcase(key, pattern) for pattern in patterns)
+
+
+def normalize_context(value, volatile_keys=DEFAULT_VOLATILE_KEYS, float_precision=DEFAULT_FLOAT_PRECISION):
+    """휘발성 필드 제거 + 실수 반올림"""
+    if isinstance(value, dict):
+        return {
+            str(k): normalize_context(v, volatile_keys, float_precision)
+            for k, v in value.items()
+            if not _is_volatile(k, volatile_keys)
+        }
+    if isinstance(value, (list, tuple)):
+        return [normalize_context(v, volatile_keys, float_precision) for v in value]
+    if isinstance(value, float) and float_precision is not None:
+        return round(value, float_precision)
+    return value
+
+
+def context_fingerprint(context, volatile_keys=None, float_precision=DEFAULT_FLOAT_PRECISION):
+    """컨텍스트 내용 지문 (volatile_keys=None이면 기본 패턴 사용)"""
+    patterns = tuple(
+        p.lower() for p in (DEFAULT_VOLATILE_KEYS if volatile_keys is None else volatile_keys)
+    )
+    material = json.dumps(
+        normalize_context(context, patterns, float_precision),
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
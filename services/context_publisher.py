@@ -0,0 +1,249 @@
+"""
+AEGIS Context Publisher
+위젯 폴링 대신 서버가 플러그인 컨텍스트를 갱신하여 Socket.IO로 푸시하는 발행기입니다.
+- 플러그인당 룸 1개 ("plugin:<id>"), 위젯 마운트 시 context_subscribe로 참여
+- 구독자가 있는 플러그인만 자체 주기로 갱신: intervals[plugin_id] > freshness ttl > default_interval
+- 공급자 호출은 get_plugin_context_data(공유 워커 풀 + freshness 캐시)를 그대로 사용
+  -> 상류 호출 수는 플러그인 수에 비례 (클라이언트 수 x 위젯 수와 무관)
+- 컨텍스트 지문(context_fingerprint)이 바뀐 플러그인만 context_update 전송
+- invalidate_context_cache() 호출(액션 실행 등) 시 해당 플러그인을 다음 주기를 기다리지 않고 재발행
+"""
+
+import time
+import logging
+import threading
+from services.context_fingerprint import context_fingerprint
+from services.plugin_registry.globals import _context_policies
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PUSH_CONFIG = {
+    "enabled": True,
+    "tick": 5,
+    "default_interval": 60,
+    "intervals": {},
+    "timeout": 5,
+}
+
+EVENT_NAME = "context_update"
+
+
+def room_name(plugin_id):
+    return f"plugin:{plugin_id}"
+
+
+def _default_collect(plugin_ids, timeout):
+    from services.plugin_registry import get_plugin_context_data
+
+    return get_plugin_context_data(
+        plugin_ids=plugin_ids, for_ai=False, timeout=timeout, with_meta=True
+    )
+
+
+def _default_emit(event, data, room):
+    from services.socket_service import socketio
+
+    socketio.emit(event, data, to=room)
+
+
+class ContextPublisher:
+    """구독 중인 플러그인의 컨텍스트를 주기적으로 수집하고 변경분만 룸에 발행"""
+
+    def __init__(self, config=None, collect=None, emit=None, clock=time.monotonic):
+        self._collect = collect or _default_collect
+        self._emit = emit or _default_emit
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._subscribers = {}  # plugin_id -> {sid}
+        self._state = {}  # plugin_id -> {"fingerprint", "event", "next_due", "stale"}
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self.stats = {"polls": 0, "published": 0, "unchanged": 0, "errors": 0}
+        self.configure(config)
+
+    def configure(self, config=None):
+        """settings.json context_push 섹션 적용"""
+        merged = dict(DEFAULT_PUSH_CONFIG)
+        if isinstance(config, dict):
+            merged.update({k: v for k, v in config.items() if k in DEFAULT_PUSH_CONFIG})
+        self.config = merged
+        return self
+
+    def interval(self, plugin_id):
+        """플러그인 갱신 주기 (초, 최소 tick)"""
+        intervals = self.config.get("intervals") or {}
+        if plugin_id in intervals:
+            value = intervals[plugin_id]
+        else:
+            policy = _context_policies.get(plugin_id)
+            value = policy["ttl"] if policy and policy["ttl"] else self.config["default_interval"]
+        return max(float(self.config["tick"]), float(value))
+
+    # ------------------------------------------------------------------
+    # 구독 관리
+    # ------------------------------------------------------------------
+    def subscribe(self, sid, plugin_id):
+        """sid를 구독자로 등록. 이미 발행된 최신 이벤트가 있으면 반환 (신규 구독자 즉시 렌더링용)"""
+        with self._lock:
+            self._subscribers.setdefault(plugin_id, set()).add(sid)
+            state = self._state.get(plugin_id)
+            if state is None:
+                state = {"fingerprint": None, "event": None, "next_due": 0.0, "stale": False}
+                self._state[plugin_id] = state
+            event = state["event"]
+        if event is None:
+            self._wake.set()
+        return event
+
+    def unsubscribe(self, sid, plugin_id=None):
+        """plugin_id=None이면 sid의 모든 구독 해제 (연결 종료). 구독자가 없어진 플러그인은 갱신 중단"""
+        with self._lock:
+            targets = [plugin_id] if plugin_id else list(self._subscribers)
+            for pid in targets:
+                sids = self._subscribers.get(pid)
+                if not sids:
+                    continue
+                sids.discard(sid)
+                if not sids:
+                    del self._subscribers[pid]
+                    self._state.pop(pid, None)
+
+    def subscriptions(self):
+        with self._lock:
+            return {pid: len(sids) for pid, sids in self._subscribers.items()}
+
+    def request_refresh(self, plugin_id=None):
+        """다음 주기를 기다리지 않고 재수집 (plugin_id=None이면 구독 중인 전체)"""
+        with self._lock:
+            for pid, state in self._state.items():
+                if plugin_id is None or pid == plugin_id:
+                    state["next_due"] = 0.0
+        self._wake.set()
+
+    # ------------------------------------------------------------------
+    # 수집 / 발행
+    # ------------------------------------------------------------------
+    def poll_once(self):
+        """갱신 시점이 된 플러그인을 한 번에 수집하고 변경된 플러그인만 발행. 반환: 발행한 plugin_id 목록"""
+        now = self._clock()
+        with self._lock:
+            due = [pid for pid, state in self._state.items() if state["next_due"] <= now]
+        if not due:
+            return []
+
+        self.stats["polls"] += 1
+        try:
+            data, meta = self._collect(due, self.config["timeout"])
+        except Exception as e:
+            logger.warning(f"[ContextPublisher] Collect failed ({', '.join(due)}): {e}")
+            data, meta = {}, {}
+
+        outgoing = []
+        with self._lock:
+            for pid in due:
+                state = self._state.get(pid)
+                if state is None:
+                    continue  # 수집 중 구독 해제됨
+                info = meta.get(pid) or {}
+                if pid not in data or info.get("state") == "error":
+                    self.stats["errors"] += 1
+                    state["next_due"] = now + self.interval(pid)
+                    continue
+
+                # 만료 값(stale)은 백그라운드 갱신이 끝나는 대로 한 번 더 확인 (연속 stale이면 정상 주기)
+                recheck = info.get("state") == "stale" and not state["stale"]
+                state["stale"] = info.get("state") == "stale"
+                state["next_due"] = now + (self.config["tick"] if recheck else self.interval(pid))
+
+                fingerprint = context_fingerprint(data[pid])
+                if fingerprint == state["fingerprint"]:
+                    self.stats["unchanged"] += 1
+                    continue
+                state["fingerprint"] = fingerprint
+                state["event"] = {
+                    "plugin_id": pid,
+                    "data": data[pid],
+                    "fingerprint": fingerprint,
+                    "age": info.get("age"),
+                }
+                outgoing.append((pid, state["event"]))
+
+        for pid, event in outgoing:
+            try:
+                self._emit(EVENT_NAME, event, room_name(pid))
+                self.stats["published"] += 1
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"[ContextPublisher] Emit failed ({pid}): {e}")
+                with self._lock:
+                    state = self._state.get(pid)
+                    if state is not None and state["event"] is event:
+                        # 전송 실패한 변경은 같은 내용이어도 다음 tick에 재발행
+                        state["fingerprint"] = None
+                        state["next_due"] = min(state["next_due"], now + self.config["tick"])
+        return [pid for pid, _ in outgoing]
+
+    def report(self):
+        return {
+            "stats": dict(self.stats),
+            "subscriptions": self.subscriptions(),
+            "intervals": {pid: self.interval(pid) for pid in self.subscriptions()},
+        }
+
+    # ------------------------------------------------------------------
+    # 스레드
+    # ------------------------------------------------------------------
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.error(f"[ContextPublisher] Poll failed: {e}")
+            self._wake.wait(self.config["tick"])
+
+    def start(self):
+        if self._thread is not None:
+            return self
+        from services.plugin_registry import add_invalidation_listener
+
+        add_invalidation_listener(self.request_refresh)
+        self._thread = threading.Thread(
+            target=self._run, name="context-publisher", daemon=True
+        )
+        self._thread.start()
+        print(f"[ContextPublisher] Pushing context updates (tick={self.config['tick']}s)")
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+
+_publisher = None
+
+
+def start_context_publisher(push_config=None):
+    """
+    settings.json의 context_push 섹션으로 발행 스레드 시작 (프로세스당 1회)
+      - enabled: 기본 True (False면 위젯은 기존 폴링 유지)
+      - tick: 갱신 대상 확인 주기 (초)
+      - default_interval: freshness 정책이 없는 플러그인의 갱신 주기 (초)
+      - intervals: 플러그인별 갱신 주기 지정 {plugin_id: 초}
+      - timeout: 1회 수집 마감 (초)
+    """
+    global _publisher
+    push_config = push_config if isinstance(push_config, dict) else {}
+    if not push_config.get("enabled", True):
+        return None
+    if _publisher is None:
+        _publisher = ContextPublisher(push_config).start()
+    return _publisher
+
+
+def get_context_publisher():
+    """실행 중인 발행기 (비활성화 상태면 None)"""
+    return _publisher
@@ -0,0 +1,91 @@
+"""
+AEGIS Content-Security-Policy Compiler
+코어 규칙 + settings.json(network.csp_allow_list) + 플러그인 manifest csp_domains를
+하나의 헤더 문자열로 미리 컴파일해 두고, 입력이 바뀔 때만 다시 컴파일합니다.
+"""
+
+import os
+import json
+import time
+import threading
+from services.manifest_index import manifest_index
+
+# 입력 변경(manifest 인덱스 버전, settings.json mtime) 재검증 최소 간격 (초)
+DEFAULT_CHECK_INTERVAL = 2.0
+
+# [v4.1.5] Core CSP rules (모든 응답에 공통 적용되는 기본 정책)
+CORE_CSP_RULES = {
+    "default-src": ["'self'"],
+    "script-src": ["'self'", "'unsafe-inline'", "'unsafe-eval'", "blob:", "https://www.youtube.com", "https://s.ytimg.com"],
+    "style-src": ["'self'", "'unsafe-inline'", "https://fonts.googleapis.com", "https://cdnjs.cloudflare.com"],
+    "img-src": ["'self'", "data:", "blob:"],
+    "font-src": ["'self'", "https://fonts.gstatic.com", "data:", "https://cdnjs.cloudflare.com"],
+    "media-src": ["'self'", "data:", "blob:"],
+    "frame-src": ["'self'", "blob:", "data:", "https://www.youtube.com", "https://www.youtube-nocookie.com"],
+    "connect-src": ["'self'", "ws:", "wss:"],
+}
+
+
+def compile_csp(user_csp, plugin_csp):
+    """
+    CSP 헤더 문자열 생성.
+    병합 순서: 코어 -> 사용자 설정 -> 플러그인 (중복은 최초 등장 위치만 유지하여 결과가 항상 동일)
+    """
+    csp_rules = {k: list(v) for k, v in CORE_CSP_RULES.items()}
+    for source in (user_csp or {}, plugin_csp or {}):
+        for key, values in source.items():
+            if isinstance(values, str):
+                values = [values]
+            csp_rules.setdefault(key, []).extend(values)
+
+    return "; ".join(
+        f"{k} {' '.join(dict.fromkeys(v))}" for k, v in csp_rules.items()
+    )
+
+
+def _stat_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class CompiledCSP:
+    """
+    컴파일된 CSP 헤더 캐시.
+    응답마다 header()를 호출하면 재검증 간격 내에서는 저장된 문자열만 반환합니다.
+    """
+
+    def __init__(self, settings_path, check_interval=DEFAULT_CHECK_INTERVAL):
+        self.settings_path = settings_path
+        self.check_interval = check_interval
+        self._header = None
+        self._signature = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+    def _load_user_csp(self):
+        try:
+            with open(self.settings_path, "r", encoding="utf-8") as f:
+                network = json.load(f).get("network", {})
+            return network.get("csp_allow_list", {}) if isinstance(network, dict) else {}
+        except Exception:
+            return {}
+
+    def header(self):
+        now = time.monotonic()
+        if self._header is not None and now - self._last_check < self.check_interval:
+            return self._header
+
+        with self._lock:
+            signature = (
+                manifest_index.current_version(),
+                _stat_mtime(self.settings_path),
+            )
+            if signature != self._signature:
+                self._header = compile_csp(
+                    self._load_user_csp(), manifest_index.get_csp_domains()
+                )
+                self._signature = signature
+            self._last_check = now
+            return self._header
@@ -1,4 +1,5 @@
 from services.plugin_registry import get_plugin_context_data
+from services.single_flight import single_flight
 
 
 class DataService:
@@ -10,11 +11,24 @@ class DataService:
         # config_paths는 레거시 호환을 위해 유지하지만 더 이상 주력으로 사용하지 않음
         self.config_paths = config_paths or {}
 
-    def collect_all_context(self, plugin_ids=None):
+    def collect_all_context(self, plugin_ids=None, with_meta=False, for_ai=True):
         """
         [Plugin-X] 등록된 플러그인의 데이터를 수집 (필터 선택 가능)
         """
         # 1. 동적 플러그인 데이터 통합 (Plugin-X Registry)
         # plugin_ids가 None이면 레지스트리의 모든 플러그인을 가져옵니다.
-        context = get_plugin_context_data(plugin_ids=plugin_ids)
-        return context
+        # [v4.3.0] 동시에 들어온 같은 범위의 수집 요청은 1회만 실행하고 결과를 공유
+        # with_meta=True면 (context, {plugin_id: {"age", "state"}}) 반환
+        # for_ai=False면 AI 전용 프로세서(압축 표 인코딩 등) 대신 공급자 원본 데이터 (규칙 기반 점검용)
+        key = ("context", tuple(plugin_ids) if plugin_ids else None, for_ai)
+        context, meta = single_flight.do(
+            key,
+            get_plugin_context_data,
+            plugin_ids=plugin_ids,
+            for_ai=for_ai,
+            with_meta=True,
+        )
+        # 호출부별 dict 수정이 서로 간섭하지 않도록 얕은 복사본 반환
+        if with_meta:
+            return dict(context), dict(meta)
+        return dict(context)
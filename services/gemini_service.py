@@ -1,12 +1,14 @@
 import json
 import logging
 from datetime import datetime
-from utils import load_json_config, load_settings
+from services.config_cache import load_json_config, load_settings
 from routes.config import PLUGINS_DIR, GEMINI_API_KEY
 
 from .ai_base import ai_base, types
-from .ai_schemas import BRIEFING_SCHEMA, COMMAND_SCHEMA
+from .ai_schemas import BRIEFING_SCHEMA, COMMAND_SCHEMA, WIDGET_BATCH_SCHEMA
 from .ai_tools import get_internal_system_data, search_the_web
+from services.ai_response_cache import get_response_cache, make_cache_key
+from services.prompt_encoder import render_context, render_value
 
 logger = logging.getLogger(__name__)
 
@@ -41,16 +43,14 @@ def _load_plugin_prompt(plugin_id, task):
     return None
 
 
-def get_briefing(api_key, context_data, debug_mode=False):
-    """대시보드 전술 브리핑 생성"""
-    client = ai_base.client
-    model_id = ai_base.model_id
-
+def build_briefing_prompt(context_data):
+    """대시보드 전술 브리핑 프롬프트 -> (완성 프롬프트, 캐시 키용 정적 지침)"""
     prompt_tpl = (
         _load_plugin_prompt("proactive-agent", "dashboard_briefing")
         or "Analyze context: {{context_data}}"
     )
-    context_str = json.dumps(context_data, ensure_ascii=False, indent=2)
+    # [v4.3.0] 플러그인별 섹션 + 압축 인코딩 (들여쓰기 JSON 대비 토큰 절감)
+    context_str = render_context(context_data)
 
     lang = _get_lang()
     language_instruction = (
@@ -61,6 +61,26 @@ def get_briefing(api_key, context_data, debug_mode=False):
 
     validation_guide = f"{language_instruction}\n\nAnalyze for any anomalies. Acknowledge connectivity issues if data looks corrupted."
     prompt = prompt_tpl.replace("{{context_data}}", context_str) + validation_guide
+    return prompt, prompt_tpl + validation_guide
+
+
+def get_briefing(api_key, context_data, debug_mode=False):
+    """대시보드 전술 브리핑 생성"""
+    client = ai_base.client
+    model_id = ai_base.model_id
+
+    prompt, instruction = build_briefing_prompt(context_data)
+
+    # [v4.3.0] 여러 탭의 동일 컨텍스트 브리핑 요청은 응답 캐시에서 반환
+    cache = get_response_cache()
+    cache_key = None
+    if not debug_mode and cache.should_use(with_search=False):
+        cache_key = make_cache_key(
+            "gemini:briefing", model_id, instruction, "", context_data
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
 
     config = types.GenerateContentConfig(
         tools=[],
@@ -83,6 +103,8 @@ def get_briefing(api_key, context_data, debug_mode=False):
             "sentiment": res.get("sentiment", "neutral"),
             "visual_type": res.get("visual_type", "none"),
         }
+        if cache_key:
+            cache.put(cache_key, dict(result))
         if debug_mode:
             result["debug_prompt"] = prompt
         return result
@@ -93,14 +115,32 @@ def get_briefing(api_key, context_data, debug_mode=False):
             "briefing": "Failed.",
             "sentiment": "neutral",
             "visual_type": "none",
+            "status": "error",
         }
 
 
+def _plugin_briefing_prompt(plugin_id, task, data):
+    """플러그인 프롬프트 -> (완성 프롬프트, 응답 캐시 키 또는 None)"""
+    prompt_tpl = _load_plugin_prompt(plugin_id, task) or "Analyze: {{data}}"
+    prompt = prompt_tpl.replace("{{data}}", render_value(data))
+    cache_key = None
+    if get_response_cache().should_use(with_search=False):
+        cache_key = make_cache_key(
+            f"gemini:{plugin_id}:{task}", ai_base.model_id, prompt_tpl, "", data
+        )
+    return prompt, cache_key
+
+
 def get_plugin_briefing(api_key, plugin_id, task, data):
     """플러그인 전용 AI 서비스"""
     client = ai_base.client
-    prompt_tpl = _load_plugin_prompt(plugin_id, task) or "Analyze: {{data}}"
-    prompt = prompt_tpl.replace("{{data}}", json.dumps(data, ensure_ascii=False))
+    prompt, cache_key = _plugin_briefing_prompt(plugin_id, task, data)
+
+    cache = get_response_cache()
+    if cache_key:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
 
     config = types.GenerateContentConfig(
         response_mime_type="application/json",
@@ -112,11 +152,14 @@ def get_plugin_briefing(api_key, plugin_id, task, data):
             model=ai_base.model_id, contents=prompt, config=config
         )
         res = response.parsed
-        return {
+        result = {
             "display": ai_base.clean_response(res.get("briefing", "")),
             "voice": ai_base.clean_response(res.get("voice", "")),
             "sentiment": res.get("sentiment", "neutral"),
         }
+        if cache_key:
+            cache.put(cache_key, dict(result))
+        return result
     except Exception as e:
         logger.error(f"Plugin Briefing Error ({plugin_id}): {e}")
         return {"display": "Error", "voice": "Error", "sentiment": "neutral"}
@@ -126,6 +169,80 @@ def get_widget_briefing(api_key, widget_type, widget_data):
     return get_plugin_briefing(api_key, widget_type, "widget_summary", widget_data)
 
 
+def get_widget_briefings(api_key, widget_items):
+    """
+    [v4.3.0] 여러 위젯 요약을 구조화 출력 1회로 생성 (WIDGET_BATCH_SCHEMA: 위젯당 항목 1개).
+    widget_items: [(widget_type, widget_data), ...] -> {widget_type: get_widget_briefing과 같은 형식}
+    - 위젯별 응답 캐시는 단건 요청과 공유 (캐시에 없는 위젯만 배치에 포함)
+    - 응답에서 누락된 위젯은 단건 요청으로 보완
+    """
+    cache = get_response_cache()
+    results, pending = {}, []
+    for widget_type, widget_data in widget_items:
+        prompt, cache_key = _plugin_briefing_prompt(
+            widget_type, "widget_summary", widget_data
+        )
+        cached = cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            results[widget_type] = dict(cached)
+        else:
+            pending.append((widget_type, widget_data, prompt, cache_key))
+
+    if len(pending) == 1:
+        widget_type, widget_data, _, _ = pending[0]
+        results[widget_type] = get_widget_briefing(api_key, widget_type, widget_data)
+        pending = []
+
+    if pending:
+        lang = _get_lang()
+        language_instruction = (
+            "CRITICAL: You MUST respond in KOREAN."
+            if lang == "ko"
+            else f"CRITICAL: You MUST respond in {lang}."
+        )
+        sections = "\n\n".join(
+            f"[WIDGET: {widget_type}]\n{prompt}" for widget_type, _, prompt, _ in pending
+        )
+        prompt = (
+            "Summarize each widget below independently. Return exactly one entry per widget "
+            "in `widgets`, with `widget` set to the widget ID shown in its header.\n\n"
+            f"{sections}\n\n{language_instruction}"
+        )
+        config = types.GenerateContentConfig(
+            response_mime_type="application/json",
+            response_schema=WIDGET_BATCH_SCHEMA,
+        )
+        try:
+            response = ai_base.client.models.generate_content(
+                model=ai_base.model_id, contents=prompt, config=config
+            )
+            res = response.parsed or ai_base.parse_json_response(response.text)
+            entries = {
+                str(item.get("widget", "")): item for item in res.get("widgets", [])
+            }
+            for widget_type, _, _, cache_key in pending:
+                item = entries.get(widget_type)
+                if not item:
+                    continue
+                result = {
+                    "display": ai_base.clean_response(item.get("briefing", "")),
+                    "voice": ai_base.clean_response(item.get("voice", "")),
+                    "sentiment": item.get("sentiment", "neutral"),
+                }
+                if cache_key:
+                    cache.put(cache_key, dict(result))
+                results[widget_type] = result
+        except Exception as e:
+            logger.error(f"Widget Batch Briefing Error: {e}")
+
+        for widget_type, widget_data, _, _ in pending:
+            if widget_type not in results:
+                logger.warning(f"[Gemini] Batch missed widget '{widget_type}', requesting individually")
+                results[widget_type] = get_widget_briefing(api_key, widget_type, widget_data)
+
+    return {widget_type: results[widget_type] for widget_type, _ in widget_items}
+
+
 def process_command(api_key, command, context_data):
     """지능형 에이전트 명령어 처리"""
     client = ai_base.client
@@ -184,8 +301,10 @@ def process_command(api_key, command, context_data):
         }
 
 
-def get_custom_response(api_key, prompt, with_search=True, system_instruction=None):
-    """기존 ad-hoc 질의 유지"""
+def get_custom_response(
+    api_key, prompt, with_search=True, system_instruction=None, on_delta=None
+):
+    """기존 ad-hoc 질의 유지 ([v4.3.0] on_delta 지정 시 generate_content_stream으로 청크 전달)"""
     client = ai_base.client
     tools = [types.Tool(google_search=types.GoogleSearch())] if with_search else []
 
@@ -194,10 +313,20 @@ def get_custom_response(api_key, prompt, with_search=True, system_instruction=No
     )
 
     try:
-        response = client.models.generate_content(
-            model=ai_base.model_id, contents=prompt, config=config
-        )
-        text = response.text.strip()
+        if on_delta:
+            from services.ai_stream import collect_chunks
+
+            stream = client.models.generate_content_stream(
+                model=ai_base.model_id, contents=prompt, config=config
+            )
+            text = collect_chunks(
+                (chunk.text for chunk in stream if chunk.text), on_delta
+            ).strip()
+        else:
+            response = client.models.generate_content(
+                model=ai_base.model_id, contents=prompt, config=config
+            )
+            text = response.text.strip()
 
         if "[DISPLAY]" in text or "[VOICE]" in text:
             return text
@@ -219,12 +348,13 @@ def get_custom_response(api_key, prompt, with_search=True, system_instruction=No
         return {"display": f"Error: {e}", "briefing": "Error", "status": "error"}
 
 
-def query_gemini(prompt, system_instruction=None, with_search=True):
+def query_gemini(prompt, system_instruction=None, with_search=True, on_delta=None):
     res = get_custom_response(
         GEMINI_API_KEY,
         prompt,
         with_search=with_search,
         system_instruction=system_instruction,
+        on_delta=on_delta,
     )
     if isinstance(res, str):
         return {"response": res}
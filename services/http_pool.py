@@ -0,0 +1,147 @@
+"""
+AEGIS HTTP Pool
+외부 LLM 엔진(Ollama, OpenAI 호환 API) 호출용 소스별 keep-alive 세션 풀입니다.
+- 소스(api.json sources 키)마다 requests.Session 1개를 재사용 (TCP/TLS 재연결 비용 제거)
+- 연결 수 제한(pool_connections / pool_maxsize), connect/read 타임아웃 분리
+- 재시도는 서버가 요청을 처리하지 않은 실패에만 적용 (연결 실패, 429/502/503/504)
+  + 지수 백오프에 full jitter 적용
+- 설정: api.json 최상위 "http" (공통 기본값) < sources.{key}.http (소스별 재정의)
+"""
+
+import time
+import random
+import logging
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HTTP_CONFIG = {
+    "pool_connections": 2,
+    "pool_maxsize": 4,
+    "connect_timeout": 5.0,
+    "read_timeout": 60.0,
+    "retries": 2,
+    "backoff_base": 0.5,
+    "backoff_max": 8.0,
+    "retry_statuses": [429, 502, 503, 504],
+}
+
+
+def resolve_http_config(api_config, source_key):
+    """api.json 스냅샷에서 source_key의 최종 HTTP 설정 계산"""
+    api_config = api_config or {}
+    source = api_config.get("sources", {}).get(source_key) or {}
+    resolved = dict(DEFAULT_HTTP_CONFIG)
+    for layer in (api_config.get("http"), source.get("http")):
+        if isinstance(layer, dict):
+            resolved.update(
+                {k: v for k, v in layer.items() if k in DEFAULT_HTTP_CONFIG}
+            )
+    resolved["retry_statuses"] = tuple(resolved["retry_statuses"] or ())
+    return resolved
+
+
+def backoff_delay(attempt, base, maximum, rng=random):
+    """attempt번째 재시도 대기 시간 (full jitter: 0 ~ min(max, base * 2^attempt))"""
+    return rng.uniform(0, min(maximum, base * (2**attempt)))
+
+
+def _retry_after(response):
+    """Retry-After 헤더(초 단위)만 지원, 없거나 해석 불가하면 None"""
+    value = response.headers.get("Retry-After") if response is not None else None
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class HttpPool:
+    """소스별 keep-alive 세션 레지스트리"""
+
+    def __init__(self, sleep=time.sleep):
+        self._sessions = {}  # source_key -> (pool_signature, Session)
+        self._lock = threading.Lock()
+        self._sleep = sleep
+        self.stats = {"requests": 0, "retries": 0, "failures": 0, "sessions": 0}
+
+    def _build_session(self, config):
+        session = requests.Session()
+        # 재시도는 post()에서 직접 수행 (urllib3 Retry는 POST 재전송 여부를 세밀하게 제어하기 어려움)
+        adapter = HTTPAdapter(
+            pool_connections=int(config["pool_connections"]),
+            pool_maxsize=int(config["pool_maxsize"]),
+            max_retries=0,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def session(self, source_key, config):
+        """source_key 전용 세션 반환 (풀 크기 설정이 바뀌면 새 세션으로 교체)"""
+        signature = (config["pool_connections"], config["pool_maxsize"])
+        with self._lock:
+            current = self._sessions.get(source_key)
+            if current and current[0] == signature:
+                return current[1]
+            session = self._build_session(config)
+            self._sessions[source_key] = (signature, session)
+            self.stats["sessions"] += 1
+        if current:
+            current[1].close()
+        return session
+
+    def post(self, source_key, config, url, **kwargs):
+        """
+        풀링된 세션으로 POST. 응답을 받은 경우 상태 코드와 무관하게 Response 반환,
+        재시도 후에도 연결하지 못하면 마지막 예외를 그대로 발생시킵니다.
+        """
+        session = self.session(source_key, config)
+        kwargs.setdefault("timeout", (config["connect_timeout"], config["read_timeout"]))
+        retries = max(0, int(config["retries"]))
+
+        for attempt in range(retries + 1):
+            self.stats["requests"] += 1
+            response = None
+            try:
+                response = session.post(url, **kwargs)
+                if (
+                    response.status_code not in config["retry_statuses"]
+                    or attempt == retries
+                ):
+                    return response
+                reason = f"HTTP {response.status_code}"
+            except requests.ConnectionError as e:
+                # ConnectTimeout 포함. ReadTimeout은 엔진이 이미 생성 중일 수 있어 재전송하지 않음
+                if attempt == retries:
+                    self.stats["failures"] += 1
+                    raise
+                reason = type(e).__name__
+
+            delay = _retry_after(response)
+            if delay is None:
+                delay = backoff_delay(
+                    attempt, config["backoff_base"], config["backoff_max"]
+                )
+            else:
+                delay = min(delay, config["backoff_max"])
+            if response is not None:
+                response.close()
+            self.stats["retries"] += 1
+            logger.warning(
+                f"[HttpPool] {source_key}: {reason}, retry {attempt + 1}/{retries} in {delay:.2f}s"
+            )
+            self._sleep(delay)
+
+    def close(self, source_key=None):
+        """세션 종료 (None이면 전체)"""
+        with self._lock:
+            keys = list(self._sessions) if source_key is None else [source_key]
+            closing = [self._sessions.pop(k) for k in keys if k in self._sessions]
+        for _signature, session in closing:
+            session.close()
+
+
+# 전역 싱글톤 인스턴스
+http_pool = HttpPool()
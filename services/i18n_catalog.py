@@ -0,0 +1,205 @@
+"""
+AEGIS i18n Catalog
+언어별 병합 언어팩(전역 팩 + 모든 플러그인 i18n.json)을 한 번만 빌드하여 메모리에 보관합니다.
+- mtime 시그니처 기반 무효화 (재검증 최소 간격 적용)
+- 사전 직렬화 JSON + ETag (/i18n_config 응답용)
+- 점(.) 경로로 평탄화된 카탈로그 (get_i18n / get_plugin_i18n O(1) 조회)
+- 언어 코드는 I18N_DIR에 언어팩 파일이 있는 것만 허용 (그 외는 DEFAULT_LANG, 캐시 크기 제한)
+"""
+
+import os
+import copy
+import json
+import time
+import hashlib
+import threading
+from routes.config import I18N_DIR, PLUGINS_DIR
+from services.config_cache import get_settings, load_json_config, invalidate_config
+
+# mtime 재검증 최소 간격 (초)
+DEFAULT_CHECK_INTERVAL = 2.0
+# 언어팩 파일이 없는 언어 코드 요청 시 사용할 언어
+DEFAULT_LANG = "ko"
+
+
+def _stat_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _deep_merge(target, source):
+    for k, v in source.items():
+        if k in target and isinstance(target[k], dict) and isinstance(v, dict):
+            _deep_merge(target[k], v)
+        else:
+            target[k] = v
+
+
+def _flatten(data, prefix="", out=None):
+    """중첩 dict를 'a.b.c' 키로 평탄화 (중간 노드도 포함하여 하위 트리 조회 지원)"""
+    if out is None:
+        out = {}
+    for k, v in data.items():
+        path = f"{prefix}{k}"
+        out[path] = v
+        if isinstance(v, dict):
+            _flatten(v, f"{path}.", out)
+    return out
+
+
+class I18nCatalog:
+    """언어별 병합 팩 + 플러그인별 평탄화 카탈로그 캐시"""
+
+    def __init__(
+        self,
+        i18n_dir=I18N_DIR,
+        plugins_dir=PLUGINS_DIR,
+        check_interval=DEFAULT_CHECK_INTERVAL,
+    ):
+        self.i18n_dir = i18n_dir
+        self.plugins_dir = plugins_dir
+        self.check_interval = check_interval
+        self._packs = {}  # lang -> {data, json, etag, flat, signature, checked}
+        self._plugins = {}  # plugin_id -> {mtime, data, flat: {lang: {...}}, checked}
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # 플러그인 i18n.json
+    # ------------------------------------------------------------------
+    def _plugin_i18n_paths(self):
+        if not os.path.exists(self.plugins_dir):
+            return []
+        paths = []
+        for plugin_id in sorted(os.listdir(self.plugins_dir)):
+            p_i18n_path = os.path.join(self.plugins_dir, plugin_id, "i18n.json")
+            if os.path.exists(p_i18n_path):
+                paths.append((plugin_id, p_i18n_path))
+        return paths
+
+    def _get_plugin_entry(self, plugin_id):
+        """플러그인 i18n.json 캐시 엔트리 (mtime 변경 시 재파싱)"""
+        now = time.monotonic()
+        entry = self._plugins.get(plugin_id)
+        if entry and now - entry["checked"] < self.check_interval:
+            return entry
+
+        path = os.path.join(self.plugins_dir, plugin_id, "i18n.json")
+        mtime = _stat_mtime(path)
+        with self._lock:
+            entry = self._plugins.get(plugin_id)
+            if entry is None or entry["mtime"] != mtime:
+                # 설정 캐시의 재검증 주기 때문에 방금 감지한 변경이 가려지지 않도록 먼저 폐기
+                invalidate_config(path)
+                data = load_json_config(path) if mtime is not None else {}
+                entry = {"mtime": mtime, "data": data or {}, "flat": {}}
+                self._plugins[plugin_id] = entry
+            entry["checked"] = now
+            return entry
+
+    # ------------------------------------------------------------------
+    # 언어별 병합 팩
+    # ------------------------------------------------------------------
+    def _pack_signature(self, lang):
+        pack_path = os.path.join(self.i18n_dir, f"{lang}.json")
+        return (_stat_mtime(pack_path),) + tuple(
+            (plugin_id, _stat_mtime(path))
+            for plugin_id, path in self._plugin_i18n_paths()
+        )
+
+    def _build_pack(self, lang, signature):
+        # 1. 전역 언어팩 로드
+        pack_path = os.path.join(self.i18n_dir, f"{lang}.json")
+        invalidate_config(pack_path)
+        combined_data = load_json_config(pack_path) or {}
+
+        # 2. [Plugin-X] 모든 플러그인의 i18n.json 중 해당 언어 섹션 병합
+        for plugin_id, _ in self._plugin_i18n_paths():
+            lang_data = self._get_plugin_entry(plugin_id)["data"].get(lang, {})
+            if lang_data:
+                _deep_merge(combined_data, copy.deepcopy(lang_data))
+
+        json_str = json.dumps(combined_data, ensure_ascii=False)
+        return {
+            "data": combined_data,
+            "json": json_str,
+            "etag": hashlib.sha256(json_str.encode("utf-8")).hexdigest(),
+            "flat": _flatten(combined_data),
+            "signature": signature,
+        }
+
+    def resolve_lang(self, lang):
+        """언어팩 파일이 있는 언어 코드만 허용 (임의 문자열이 캐시 키로 쌓이지 않도록)"""
+        if lang in self._packs:
+            return lang
+        if (
+            isinstance(lang, str)
+            and lang.replace("-", "").replace("_", "").isalnum()
+            and os.path.isfile(os.path.join(self.i18n_dir, f"{lang}.json"))
+        ):
+            return lang
+        return DEFAULT_LANG
+
+    def get_pack(self, lang):
+        """언어별 병합 팩 엔트리 {data, json, etag, flat} (변경 없으면 캐시 재사용)"""
+        # 알 수 없는 언어 코드도 대체 언어의 캐시 경로를 타도록 먼저 정규화
+        lang = self.resolve_lang(lang)
+        now = time.monotonic()
+        pack = self._packs.get(lang)
+        if pack and now - pack["checked"] < self.check_interval:
+            return pack
+
+        with self._lock:
+            signature = self._pack_signature(lang)
+            pack = self._packs.get(lang)
+            if pack is None or pack["signature"] != signature:
+                pack = self._build_pack(lang, signature)
+                self._packs[lang] = pack
+            pack["checked"] = time.monotonic()
+            return pack
+
+    def invalidate(self):
+        """다음 조회 시 mtime 재검증 강제"""
+        with self._lock:
+            for entry in list(self._packs.values()) + list(self._plugins.values()):
+                entry["checked"] = 0.0
+
+    # ------------------------------------------------------------------
+    # 조회 API
+    # ------------------------------------------------------------------
+    def lookup(self, key, lang):
+        return self.get_pack(lang)["flat"].get(key, key)
+
+    def lookup_plugin(self, plugin_id, key, lang):
+        """플러그인 i18n.json 조회. 플러그인에 없는 키는 전역 언어팩으로 폴백"""
+        entry = self._get_plugin_entry(plugin_id)
+        # 플러그인 파일에 있는 언어 섹션이면 그대로, 아니면 전역 팩 기준으로 검증
+        if lang not in entry["data"]:
+            lang = self.resolve_lang(lang)
+        flat = entry["flat"].get(lang)
+        if flat is None:
+            flat = _flatten(entry["data"].get(lang) or {})
+            entry["flat"][lang] = flat
+        if key in flat:
+            return flat[key]
+        return self.get_pack(lang)["flat"].get(key, key)
+
+
+# 전역 싱글톤 인스턴스
+i18n_catalog = I18nCatalog()
+
+
+def _current_lang():
+    # [v4.3.0] 조회마다 디스크를 읽지 않도록 설정 캐시 스냅샷 사용
+    return get_settings().get("lang", DEFAULT_LANG)
+
+
+def get_i18n(key, lang=None):
+    """전역(+플러그인 병합) 언어팩에서 'a.b.c' 키 조회. 없으면 키 그대로 반환"""
+    return i18n_catalog.lookup(key, lang or _current_lang())
+
+
+def get_plugin_i18n(plugin_id, key, lang=None):
+    """플러그인 i18n.json에서 'a.b.c' 키 조회. 없으면 전역 언어팩, 그래도 없으면 키 그대로 반환"""
+    return i18n_catalog.lookup_plugin(plugin_id, key, lang or _current_lang())
@@ -0,0 +1,200 @@
+"""
+AEGIS Debug Log Sink
+web_debug.log 기록을 요청 스레드에서 분리하는 비동기 로깅 파이프라인입니다.
+- 호출부: QueueHandler로 큐에 넣기만 함 (파일 I/O 없음)
+- 백그라운드: QueueListener가 배치 단위로 기록, 크기 기반 로테이션
+- 선택: JSON Lines 포맷
+"""
+
+import json
+import time
+import queue
+import atexit
+import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+DEBUG_LOGGER_NAME = "aegis.debug"
+
+DEFAULT_SINK_CONFIG = {
+    "path": "web_debug.log",
+    "max_bytes": 5 * 1024 * 1024,
+    "backup_count": 3,
+    "json_lines": False,
+    "batch_size": 64,
+    "flush_interval": 1.0,
+}
+
+_CLIENT_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
+class JsonLineFormatter(logging.Formatter):
+    """레코드 1개를 JSON 한 줄로 직렬화"""
+
+    def format(self, record):
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "source": getattr(record, "source", None),
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class BatchingRotatingFileHandler(RotatingFileHandler):
+    """
+    flush를 batch_size 건 또는 flush_interval 초마다 한 번만 수행하는 RotatingFileHandler.
+    QueueListener 스레드에서만 emit되며, 남은 버퍼는 주기적 flush 스레드가 비웁니다.
+    """
+
+    def __init__(self, filename, max_bytes, backup_count, batch_size, flush_interval):
+        super().__init__(
+            filename,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+            delay=True,
+        )
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def flush(self):
+        # StreamHandler.emit이 레코드마다 호출 -> 배치 조건을 만족할 때만 실제 flush
+        self._pending += 1
+        if (
+            self._pending >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.force_flush()
+
+    def force_flush(self):
+        self.acquire()
+        try:
+            if self.stream and self._pending:
+                self.stream.flush()
+            self._pending = 0
+            self._last_flush = time.monotonic()
+        finally:
+            self.release()
+
+    def close(self):
+        self.force_flush()
+        super().close()
+
+
+class DebugLogSink:
+    """QueueHandler/QueueListener 기반 web_debug.log 싱크"""
+
+    def __init__(self):
+        self.config = dict(DEFAULT_SINK_CONFIG)
+        self.logger = logging.getLogger(DEBUG_LOGGER_NAME)
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self._queue = queue.SimpleQueue()
+        self._queue_handler = QueueHandler(self._queue)
+        self._listener = None
+        self._file_handler = None
+        self._flusher_stop = None
+        self._lock = threading.Lock()
+
+    def _build_file_handler(self):
+        cfg = self.config
+        handler = BatchingRotatingFileHandler(
+            cfg["path"],
+            max_bytes=cfg["max_bytes"],
+            backup_count=cfg["backup_count"],
+            batch_size=cfg["batch_size"],
+            flush_interval=cfg["flush_interval"],
+        )
+        if cfg["json_lines"]:
+            handler.setFormatter(JsonLineFormatter())
+        else:
+            handler.setFormatter(
+                logging.Formatter(
+                    "[%(asctime)s] [%(levelname)s] %(message)s", "%Y-%m-%d %H:%M:%S"
+                )
+            )
+        return handler
+
+    def _flusher(self, handler, stop_event):
+        while not stop_event.wait(handler.flush_interval):
+            handler.force_flush()
+
+    def start(self):
+        with self._lock:
+            if self._listener is not None:
+                return self
+            self._file_handler = self._build_file_handler()
+            self._listener = QueueListener(
+                self._queue, self._file_handler, respect_handler_level=False
+            )
+            self._listener.start()
+            self._flusher_stop = threading.Event()
+            threading.Thread(
+                target=self._flusher,
+                args=(self._file_handler, self._flusher_stop),
+                name="debug-log-flusher",
+                daemon=True,
+            ).start()
+            if self._queue_handler not in self.logger.handlers:
+                self.logger.addHandler(self._queue_handler)
+            return self
+
+    def stop(self):
+        """큐에 남은 레코드를 모두 기록하고 파일을 닫음"""
+        with self._lock:
+            if self._listener is None:
+                return
+            self.logger.removeHandler(self._queue_handler)
+            self._listener.stop()
+            self._flusher_stop.set()
+            self._file_handler.close()
+            self._listener = None
+            self._file_handler = None
+
+    def configure(self, config=None):
+        """settings.json의 debug_log 섹션 적용 (실행 중이면 새 설정으로 재시작)"""
+        config = config if isinstance(config, dict) else {}
+        new_config = dict(DEFAULT_SINK_CONFIG)
+        new_config.update({k: v for k, v in config.items() if k in DEFAULT_SINK_CONFIG})
+        if new_config == self.config and self._listener is not None:
+            return self
+        self.stop()
+        self.config = new_config
+        return self.start()
+
+    def log(self, msg, level=logging.INFO, source=None):
+        if self._listener is None:
+            self.start()
+        text = f"[{source}] {msg}" if source and not self.config["json_lines"] else msg
+        self.logger.log(level, text, extra={"source": source})
+
+
+# 전역 싱글톤 인스턴스
+log_sink = DebugLogSink()
+atexit.register(log_sink.stop)
+
+
+def configure_log_sink(config=None):
+    return log_sink.configure(config)
+
+
+def debug_log(msg, level=logging.INFO, source=None):
+    """web_debug.log 비동기 기록 (요청 스레드에서는 큐 삽입만 수행)"""
+    log_sink.log(msg, level=level, source=source)
+
+
+def client_log_level(level_name):
+    """브라우저 로그 레벨 문자열 -> logging 레벨"""
+    return _CLIENT_LEVELS.get(str(level_name).upper(), logging.INFO)
@@ -0,0 +1,307 @@
+"""
+AEGIS Plugin-X Manifest Index
+모든 플러그인의 manifest.json을 한 번만 스캔하여 메모리에 보관하고,
+디렉토리/파일 mtime 비교로 저비용 재검증을 수행하는 공유 인덱스입니다.
+"""
+
+import os
+import json
+import time
+import threading
+import logging
+from routes.config import PLUGINS_DIR
+
+logger = logging.getLogger(__name__)
+
+# CSP 병합 대상 지시어 (플러그인이 선언할 수 있는 범위)
+CSP_DIRECTIVES = ("img-src", "script-src", "connect-src", "frame-src")
+
+# mtime 재검증 최소 간격 (초)
+DEFAULT_CHECK_INTERVAL = 2.0
+
+
+def _stat_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _declares_context_provider(manifest, backend_path):
+    """
+    [v4.3.0] 컨텍스트 공급자 등록 여부 (지연 로딩 플러그인을 전체 컨텍스트 수집 시 로드할지 판단)
+    manifest "context_provider": true/false 선언이 우선, 없으면 backend 소스에서 등록 호출 검색
+    """
+    declared = manifest.get("context_provider")
+    if isinstance(declared, bool):
+        return declared
+    if not backend_path:
+        return False
+    try:
+        with open(backend_path, "r", encoding="utf-8-sig") as f:
+            return "register_context_provider" in f.read()
+    except OSError:
+        return False
+
+
+def _build_entry(plugin_id, plugin_path, manifest_path):
+    """manifest.json 1개를 파싱하여 파생 데이터까지 포함한 인덱스 엔트리 생성"""
+    with open(manifest_path, "r", encoding="utf-8-sig") as f:
+        manifest = json.load(f)
+
+    csp = {}
+    for directive, domains in (manifest.get("csp_domains") or {}).items():
+        if directive in CSP_DIRECTIVES and isinstance(domains, list):
+            csp[directive] = tuple(domains)
+
+    backend_file = (manifest.get("entry") or {}).get("backend")
+    config_path = os.path.join(plugin_path, "config.json")
+    aliases = manifest.get("aliases")
+    backend_path = os.path.join(plugin_path, backend_file) if backend_file else None
+
+    return {
+        "id": plugin_id,
+        "path": plugin_path,
+        "manifest": manifest,
+        "priority": manifest.get("priority", 100),
+        "permissions": frozenset(manifest.get("permissions") or []),
+        "csp_domains": csp,
+        "exports": manifest.get("exports") or {},
+        "aliases": list(aliases) if isinstance(aliases, list) else [],
+        "has_ai_prompt": os.path.exists(os.path.join(plugin_path, "ai_prompt.md")),
+        "config_path": config_path if os.path.exists(config_path) else None,
+        "backend_path": backend_path,
+        "context_provider": _declares_context_provider(manifest, backend_path),
+        # 재검증용 시그니처 (폴더 mtime: 파일 추가/삭제, manifest mtime: 내용 변경)
+        "_dir_mtime": _stat_mtime(plugin_path),
+        "_manifest_mtime": _stat_mtime(manifest_path),
+    }
+
+
+class ManifestIndex:
+    """
+    PLUGINS_DIR 전체 manifest.json 인메모리 인덱스.
+    - 최초 접근 시 1회 스캔, 이후 check_interval 마다 mtime만 비교하여 변경분만 재파싱
+    - version: 인덱스 내용이 바뀔 때마다 증가 (파생 캐시 무효화 키로 사용)
+    """
+
+    def __init__(self, plugins_dir=PLUGINS_DIR, check_interval=DEFAULT_CHECK_INTERVAL):
+        self.plugins_dir = plugins_dir
+        self.check_interval = check_interval
+        self.version = 0
+        self._entries = {}
+        self._root_mtime = None
+        self._last_check = 0.0
+        self._derived = {}
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # 스캔 및 재검증
+    # ------------------------------------------------------------------
+    def _rescan(self):
+        root_mtime = _stat_mtime(self.plugins_dir)
+        if root_mtime is None:
+            changed = bool(self._entries)
+            self._entries = {}
+            self._root_mtime = None
+            return changed
+
+        old_entries = self._entries
+        new_entries = {}
+        changed = root_mtime != self._root_mtime
+
+        for plugin_id in os.listdir(self.plugins_dir):
+            plugin_path = os.path.join(self.plugins_dir, plugin_id)
+            if not os.path.isdir(plugin_path):
+                continue
+            manifest_path = os.path.join(plugin_path, "manifest.json")
+
+            old = old_entries.get(plugin_id)
+            if (
+                old is not None
+                and old["_dir_mtime"] == _stat_mtime(plugin_path)
+                and old["_manifest_mtime"] == _stat_mtime(manifest_path)
+            ):
+                new_entries[plugin_id] = old
+                continue
+
+            if not os.path.exists(manifest_path):
+                # __pycache__ 등 매니페스트 없는 디렉토리는 변경으로 치지 않음
+                if old is not None:
+                    changed = True
+                continue
+            changed = True
+            try:
+                new_entries[plugin_id] = _build_entry(
+                    plugin_id, plugin_path, manifest_path
+                )
+            except Exception as e:
+                logger.warning(f"[ManifestIndex] Manifest error for {plugin_id}: {e}")
+
+        if set(new_entries) != set(old_entries):
+            changed = True
+
+        self._entries = new_entries
+        self._root_mtime = root_mtime
+        return changed
+
+    def _ensure_fresh(self, force=False):
+        now = time.monotonic()
+        if not force and self._last_check and now - self._last_check < self.check_interval:
+            return
+        with self._lock:
+            if not force and self._last_check and now - self._last_check < self.check_interval:
+                return
+            if self._rescan() or not self._last_check:
+                self.version += 1
+                self._derived = {}
+                logger.debug(
+                    f"[ManifestIndex] Reindexed {len(self._entries)} manifests (v{self.version})"
+                )
+            self._last_check = time.monotonic()
+
+    def invalidate(self):
+        """다음 접근 시 강제 재검증 (플러그인 설치/삭제 직후 호출)"""
+        self._last_check = 0.0
+
+    def refresh(self):
+        """즉시 재검증하고 현재 버전을 반환"""
+        self._ensure_fresh(force=True)
+        return self.version
+
+    def current_version(self):
+        """재검증 주기를 반영한 현재 인덱스 버전"""
+        self._ensure_fresh()
+        return self.version
+
+    # ------------------------------------------------------------------
+    # 조회 API
+    # ------------------------------------------------------------------
+    def get(self, plugin_id):
+        """플러그인 인덱스 엔트리 (없으면 None)"""
+        self._ensure_fresh()
+        return self._entries.get(plugin_id)
+
+    def get_manifest(self, plugin_id):
+        """파싱된 manifest dict (읽기 전용으로 취급할 것)"""
+        entry = self.get(plugin_id)
+        return entry["manifest"] if entry else None
+
+    def all(self):
+        """모든 엔트리를 plugin_id 순으로 반환"""
+        self._ensure_fresh()
+        entries = self._entries
+        return [entries[pid] for pid in sorted(entries)]
+
+    def ids(self):
+        self._ensure_fresh()
+        return sorted(self._entries)
+
+    def has_permission(self, plugin_id, permission):
+        entry = self.get(plugin_id)
+        return bool(entry) and permission in entry["permissions"]
+
+    def find_config_path(self, name):
+        """
+        위젯 설정 경로 탐색: 1:1 폴더명 매칭 후, 접두사 매칭(하위 호환)으로 폴백.
+        예: 'system' 요청 시 'system-stats'의 config.json
+        """
+        entry = self.get(name)
+        if entry and entry["config_path"]:
+            return entry["config_path"]
+        for entry in self.all():
+            if entry["id"].startswith(name) and entry["config_path"]:
+                return entry["config_path"]
+        return None
+
+    def _get_derived(self, key, builder):
+        self._ensure_fresh()
+        derived = self._derived
+        if key not in derived:
+            derived[key] = builder()
+        return derived[key]
+
+    def get_csp_domains(self):
+        """모든 플러그인의 CSP 도메인 통합 (지시어별 정렬 리스트)"""
+
+        def build():
+            merged = {k: set() for k in CSP_DIRECTIVES}
+            for entry in self._entries.values():
+                for directive, domains in entry["csp_domains"].items():
+                    merged[directive].update(domains)
+            return {k: sorted(v) for k, v in merged.items()}
+
+        return self._get_derived("csp_domains", build)
+
+    def get_exports(self):
+        """모든 플러그인의 exports(sensors, commands, actions) 통합 목록"""
+
+        def build():
+            sensors, commands, actions = [], [], []
+            for entry in self.all():
+                manifest = entry["manifest"]
+                exports = entry["exports"]
+                plugin_id = manifest.get("id", entry["id"])
+                plugin_display = manifest.get("name", plugin_id)
+
+                for sensor in exports.get("sensors", []):
+                    sensors.append(
+                        {
+                            "plugin_id": plugin_id,
+                            "plugin_name": plugin_display,
+                            "sensor_id": sensor.get("id"),
+                            "name": sensor.get("name"),
+                            "unit": sensor.get("unit", ""),
+                            "type": sensor.get("type", "number"),
+                            "endpoint": sensor.get("endpoint"),
+                            "field": sensor.get("field"),
+                        }
+                    )
+
+                for cmd in exports.get("commands", []):
+                    commands.append(
+                        {
+                            "plugin_id": plugin_id,
+                            "plugin_name": plugin_display,
+                            "prefix": cmd.get("prefix"),
+                            "name": cmd.get("name"),
+                            "examples": cmd.get("examples", []),
+                        }
+                    )
+
+                for action in exports.get("actions", []):
+                    actions.append(
+                        {
+                            "plugin_id": plugin_id,
+                            "plugin_name": plugin_display,
+                            "id": action.get("id"),
+                            "name": action.get("name"),
+                            "description": action.get("description", ""),
+                            "type": action.get("type", "terminal_command"),
+                            "payload": action.get("payload"),
+                        }
+                    )
+            return {"sensors": sensors, "commands": commands, "actions": actions}
+
+        return self._get_derived("exports", build)
+
+    def get_plugin_aliases(self, plugin_id):
+        """플러그인 manifest의 aliases (register_context_provider에 그대로 전달하는 단일 출처)"""
+        entry = self.get(plugin_id)
+        return list(entry["aliases"]) if entry else []
+
+    def get_aliases(self):
+        """manifest에 선언된 aliases -> plugin_id 매핑"""
+
+        def build():
+            alias_map = {}
+            for entry in self._entries.values():
+                for alias in entry["aliases"]:
+                    alias_map[alias] = entry["id"]
+            return alias_map
+
+        return self._get_derived("aliases", build)
+
+
+# 전역 싱글톤 인스턴스
+manifest_index = ManifestIndex()
@@ -1,80 +1,129 @@
 import os
+import copy
+import gzip
 import json
 import hashlib
-from routes.config import PLUGINS_DIR
+import threading
+from collections import OrderedDict
+from services.manifest_index import manifest_index
+
+try:
+    import brotli  # Flask-Compress 의존성으로 함께 설치됨
+except ImportError:
+    brotli = None
 
 # [v2.3.0] AEGIS Extreme Cache (AXC) - Server side
-_PLUGIN_PACK_CACHE = {"json": None, "raw": None, "hash": None}
+# [v4.3.0] gzip/br: 빌드 시점에 미리 압축해 둔 응답 본문 (요청마다 재압축하지 않음)
+# [v4.3.0] 재빌드 시 새 dict를 만들어 한 번에 교체 (읽는 쪽은 잠금 없이 hash/본문이 일치하는 스냅샷을 봄)
+_PLUGIN_PACK_CACHE = {"json": None, "raw": None, "hash": None, "gzip": None, "br": None}
 
-def get_plugin_init_pack_data(rebuild=False):
-    """인메모리 캐시를 포함한 통합 패킷 데이터 생성"""
-    global _PLUGIN_PACK_CACHE
-    if not rebuild and _PLUGIN_PACK_CACHE["raw"]:
-        # raw data only for internal use if needed
-        return _PLUGIN_PACK_CACHE["raw"]
+# [v4.3.0] 플러그인별 세그먼트 (manifest + 번들 자산 + 개별 해시 + 파일 시그니처)
+_PLUGIN_SEGMENTS = {}
 
-    print("[InitPack] Cache miss or rebuild. Generating Super Bundle...")
-    pack = {"plugins": [], "bundle": {}}
-    if not os.path.exists(PLUGINS_DIR):
-        return pack
+# 번들 해시 -> {plugin_id: segment_hash} (delta 계산용, 최근 N개만 보관)
+_PACK_HISTORY = OrderedDict()
+PACK_HISTORY_LIMIT = 16
 
-    for plugin_id in sorted(os.listdir(PLUGINS_DIR)):
-        plugin_path = os.path.join(PLUGINS_DIR, plugin_id)
-        if not os.path.isdir(plugin_path):
-            continue
+_bundle_lock = threading.RLock()
+
+# [v4.0] Hybrid Level Injection 대상 시스템 플러그인
+SYSTEM_PLUGIN_IDS = {
+    "title",
+    "sidebar",
+    "unit-select",
+    "plugin-loader",
+    "wallpaper",
+    "core-bridge",
+}
+
+
+def _build_compressed_variants(json_str):
+    """Super Bundle JSON의 사전 압축본 생성 (gzip 항상, brotli는 모듈이 있을 때만)"""
+    body = json_str.encode("utf-8")
+    variants = {"gzip": gzip.compress(body, compresslevel=9, mtime=0), "br": None}
+    if brotli is not None:
+        try:
+            variants["br"] = brotli.compress(body, mode=brotli.MODE_TEXT, quality=11)
+        except Exception as e:
+            print(f"[InitPack] Brotli compression failed: {e}")
+    return variants
+
+
+def _stat_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_plugin_asset_paths(index_entry):
+    """manifest entry(html/js/css)가 가리키는 자산 파일 경로 목록 [(key, path)]"""
+    entry = index_entry["manifest"].get("entry", {})
+    return [
+        (key, os.path.join(index_entry["path"], entry[key]))
+        for key in ["html", "js", "css"]
+        if key in entry
+    ]
+
+
+def _segment_signature(index_entry):
+    """세그먼트 재빌드 필요 여부 판단용 시그니처 (manifest/자산 mtime, ai_prompt 존재 여부)"""
+    return (
+        index_entry["_manifest_mtime"],
+        index_entry["has_ai_prompt"],
+        tuple(_stat_mtime(path) for _, path in get_plugin_asset_paths(index_entry)),
+    )
+
+
+def _build_segment(index_entry, signature):
+    """플러그인 1개의 세그먼트 생성 (manifest URL/메타 주입 + 자산 내용 수집)"""
+    plugin_id = index_entry["id"]
+
+    # 인덱스 원본은 공유 데이터이므로 복사본에 URL/메타 주입
+    manifest = copy.deepcopy(index_entry["manifest"])
+    manifest["id"] = plugin_id
+    bundle = {}
+    for key, file_path in get_plugin_asset_paths(index_entry):
+        # 폴백용 URL 유지
+        file_name = manifest["entry"][key]
+        manifest["entry"][key] = f"/api/plugins/assets/{plugin_id}/{file_name}"
+
+        # 번들링 (파일 내용 수집)
+        if os.path.exists(file_path):
+            with open(file_path, "r", encoding="utf-8") as af:
+                bundle[key] = af.read()
+
+    # [v3.7.2] 지원 체계 탐색 (시각화용)
+    has_commands = any(a.get("commands") for a in manifest.get("actions", []))
+
+    manifest["support_systematic"] = has_commands
+    manifest["support_hybrid"] = index_entry["has_ai_prompt"]
+
+    # [v4.0] Hybrid Level Injection for System Plugins
+    if "hybrid_level" not in manifest:
+        if plugin_id in SYSTEM_PLUGIN_IDS or manifest.get("priority", 100) < 0:
+            manifest["hybrid_level"] = 1
+        else:
+            manifest["hybrid_level"] = 2  # Default to Iframe in v4.0
+
+    segment_json = json.dumps({"manifest": manifest, "bundle": bundle}, sort_keys=True)
+    return {
+        "manifest": manifest,
+        "bundle": bundle,
+        "hash": hashlib.sha256(segment_json.encode("utf-8")).hexdigest(),
+        "signature": signature,
+    }
 
-        manifest_path = os.path.join(plugin_path, "manifest.json")
-        if os.path.exists(manifest_path):
-            try:
-                with open(manifest_path, "r", encoding="utf-8-sig") as f:
-                    manifest = json.load(f)
-                    manifest["id"] = plugin_id
-                    entry = manifest.get("entry", {})
-                    for key in ["html", "js", "css"]:
-                        if key in entry:
-                            file_name = entry[key]
-                            # 폴백용 URL 유지
-                            manifest["entry"][key] = (
-                                f"/api/plugins/assets/{plugin_id}/{file_name}"
-                            )
-
-                            # 번들링 (파일 내용 수집)
-                            file_path = os.path.join(plugin_path, file_name)
-                            if os.path.exists(file_path):
-                                if plugin_id not in pack["bundle"]:
-                                    pack["bundle"][plugin_id] = {}
-                                with open(file_path, "r", encoding="utf-8") as af:
-                                    pack["bundle"][plugin_id][key] = af.read()
-
-                    # [v3.7.2] 지원 체계 탐색 (시각화용)
-                    has_commands = any(
-                        a.get("commands") for a in manifest.get("actions", [])
-                    )
-                    has_ai_prompt = os.path.exists(
-                        os.path.join(plugin_path, "ai_prompt.md")
-                    )
-
-                    manifest["support_systematic"] = has_commands
-                    manifest["support_hybrid"] = has_ai_prompt
-
-                    # [v4.0] Hybrid Level Injection for System Plugins
-                    system_ids = {
-                        "title",
-                        "sidebar",
-                        "unit-select",
-                        "plugin-loader",
-                        "wallpaper",
-                        "core-bridge",
-                    }
-                    if "hybrid_level" not in manifest:
-                        if plugin_id in system_ids or manifest.get("priority", 100) < 0:
-                            manifest["hybrid_level"] = 1
-                        else:
-                            manifest["hybrid_level"] = 2  # Default to Iframe in v4.0
-
-                    pack["plugins"].append(manifest)
-            except Exception as e:
-                print(f"[InitPack] Error processing {plugin_id}: {e}")
+
+def _assemble_pack():
+    """세그먼트를 Super Bundle로 조립하고 해시/압축본/이력 갱신 (_bundle_lock 내부 호출)"""
+    global _PLUGIN_PACK_CACHE
+    pack = {"plugins": [], "bundle": {}}
+    for plugin_id in sorted(_PLUGIN_SEGMENTS):
+        segment = _PLUGIN_SEGMENTS[plugin_id]
+        pack["plugins"].append(segment["manifest"])
+        if segment["bundle"]:
+            pack["bundle"][plugin_id] = segment["bundle"]
 
     # 리스트 정렬
     pack["plugins"].sort(key=lambda p: p.get("priority", 100))
@@ -83,10 +132,111 @@ def get_plugin_init_pack_data(rebuild=False):
     json_str = json.dumps(pack)
     bundle_hash = hashlib.sha256(json_str.encode("utf-8")).hexdigest()
 
-    _PLUGIN_PACK_CACHE["raw"] = pack
-    _PLUGIN_PACK_CACHE["json"] = json_str
-    _PLUGIN_PACK_CACHE["hash"] = bundle_hash
+    snapshot = {"json": json_str, "raw": pack, "hash": bundle_hash}
+    snapshot.update(_build_compressed_variants(json_str))
+    _PLUGIN_PACK_CACHE = snapshot
+
+    _PACK_HISTORY[bundle_hash] = {
+        pid: seg["hash"] for pid, seg in _PLUGIN_SEGMENTS.items()
+    }
+    _PACK_HISTORY.move_to_end(bundle_hash)
+    while len(_PACK_HISTORY) > PACK_HISTORY_LIMIT:
+        _PACK_HISTORY.popitem(last=False)
     return pack
 
+
+def refresh_plugin_segments(plugin_ids=None, force=False):
+    """
+    [v4.3.0] 변경된 플러그인 세그먼트만 재빌드.
+    plugin_ids: 검사 대상 (None이면 전체 + 삭제된 플러그인 정리)
+    force: 시그니처가 같아도 재빌드
+    반환: 내용이 실제로 바뀐 plugin_id 목록
+    """
+    with _bundle_lock:
+        entries = {e["id"]: e for e in manifest_index.all()}
+        targets = list(entries) if plugin_ids is None else list(plugin_ids)
+        changed = []
+
+        for plugin_id in targets:
+            index_entry = entries.get(plugin_id)
+            old = _PLUGIN_SEGMENTS.get(plugin_id)
+            if index_entry is None:
+                if _PLUGIN_SEGMENTS.pop(plugin_id, None) is not None:
+                    changed.append(plugin_id)
+                continue
+
+            signature = _segment_signature(index_entry)
+            if not force and old and old["signature"] == signature:
+                continue
+            try:
+                segment = _build_segment(index_entry, signature)
+            except Exception as e:
+                print(f"[InitPack] Error processing {plugin_id}: {e}")
+                if _PLUGIN_SEGMENTS.pop(plugin_id, None) is not None:
+                    changed.append(plugin_id)
+                continue
+
+            _PLUGIN_SEGMENTS[plugin_id] = segment
+            if old is None or old["hash"] != segment["hash"]:
+                changed.append(plugin_id)
+
+        if plugin_ids is None:
+            for plugin_id in [pid for pid in _PLUGIN_SEGMENTS if pid not in entries]:
+                del _PLUGIN_SEGMENTS[plugin_id]
+                changed.append(plugin_id)
+
+        if changed or not _PLUGIN_PACK_CACHE["raw"]:
+            _assemble_pack()
+            if changed and len(changed) < len(_PLUGIN_SEGMENTS):
+                print(f"[InitPack] Segments rebuilt: {', '.join(changed)}")
+        return changed
+
+
+def get_plugin_init_pack_data(rebuild=False):
+    """인메모리 캐시를 포함한 통합 패킷 데이터 생성"""
+    if not rebuild and _PLUGIN_PACK_CACHE["raw"]:
+        # raw data only for internal use if needed
+        return _PLUGIN_PACK_CACHE["raw"]
+
+    print("[InitPack] Cache miss or rebuild. Generating Super Bundle...")
+    with _bundle_lock:
+        refresh_plugin_segments(force=True)
+        return _PLUGIN_PACK_CACHE["raw"]
+
+
+def get_plugin_pack_delta(since):
+    """
+    [v4.3.0] 클라이언트가 보유한 번들 해시(since) 이후 변경된 세그먼트만 반환.
+    since가 이력에 없으면 full=True (전체 번들 재다운로드 필요)
+    """
+    with _bundle_lock:
+        if not _PLUGIN_PACK_CACHE["raw"]:
+            get_plugin_init_pack_data(rebuild=True)
+
+        current = _PLUGIN_PACK_CACHE["hash"]
+        old_hashes = _PACK_HISTORY.get(since)
+        if old_hashes is None:
+            return {"version": current, "since": since, "full": True}
+
+        changed = {
+            pid: {
+                "hash": seg["hash"],
+                "manifest": seg["manifest"],
+                "bundle": seg["bundle"],
+            }
+            for pid, seg in _PLUGIN_SEGMENTS.items()
+            if old_hashes.get(pid) != seg["hash"]
+        }
+        removed = [pid for pid in old_hashes if pid not in _PLUGIN_SEGMENTS]
+        return {
+            "version": current,
+            "since": since,
+            "full": False,
+            "changed": changed,
+            "removed": removed,
+        }
+
+
 def get_plugin_cache():
+    """현재 번들 스냅샷 (재빌드되어도 반환된 dict 내용은 바뀌지 않음)"""
     return _PLUGIN_PACK_CACHE
@@ -1,147 +1,370 @@
 import os
-import json
 import sys
+import json
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from flask import Blueprint
 from routes.config import PLUGINS_DIR
+from services.manifest_index import manifest_index
+from services.log_sink import debug_log
+
+# [v4.3.0] 지연 로딩 프록시가 수용하는 HTTP 메서드
+_LAZY_METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE"]
+
+# [v4.3.0] 병렬 임포트 기본 워커 수 (소형 ARM 홈서버 기준 상한)
+DEFAULT_IMPORT_WORKERS = min(4, os.cpu_count() or 1)
+
+# 마지막 discovery 결과 요약 (로드/지연/실패 플러그인 + 플러그인별 시작 프로파일)
+_startup_report = {
+    "mode": "eager",
+    "import_workers": 1,
+    "total_wall_ms": 0.0,
+    "loaded": [],
+    "deferred": [],
+    "failed": [],
+    "plugins": [],
+}
+
+
+def _debug_log(msg):
+    # [v4.3.0] 비동기 로그 싱크로 위임 (파일 I/O는 백그라운드 스레드에서 배치 처리)
+    debug_log(msg)
+
+
+def _current_rss():
+    """현재 프로세스 RSS (bytes). psutil 미설치 환경에서는 None"""
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss
+    except Exception:
+        return None
+
 
 def get_all_plugin_csp_domains():
-    """모든 플러그인의 CSP 도메인 통합 수집"""
-    merged_domains = {
-        "img-src": set(),
-        "script-src": set(),
-        "connect-src": set(),
-        "frame-src": set(),
+    """모든 플러그인의 CSP 도메인 통합 수집 (ManifestIndex 파생 데이터)"""
+    return manifest_index.get_csp_domains()
+
+
+def _collect_blueprints(module):
+    """모듈 속성 중 Blueprint 객체 수집"""
+    found = []
+    for attr_name in dir(module):
+        # [v2.3.1] LocalProxy 접근으로 인한 RuntimeContext 에러 방지
+        # request와 같은 LocalProxy 객체에 getattr 수행 시 런타임 에러 발생 가능
+        try:
+            attr = getattr(module, attr_name)
+        except Exception:
+            continue
+
+        # Blueprint 객체이거나 'Blueprint' 클래스명인 경우 (Duck Typing)
+        is_bp = isinstance(attr, Blueprint) or type(attr).__name__ == "Blueprint"
+        if is_bp and hasattr(attr, "name"):
+            found.append(attr)
+    return found
+
+
+def load_plugin_backend(plugin_id, backend_path):
+    """플러그인 backend_entry 모듈을 실행하고 발견된 Blueprint 목록을 반환"""
+    import importlib.util
+
+    # [Plugin-X] 명확한 고유 모듈명 생성 (dashes -> underscores)
+    module_name = f"plugins_{plugin_id.replace('-', '_')}_router"
+
+    spec = importlib.util.spec_from_file_location(module_name, backend_path)
+    if not (spec and spec.loader):
+        return []
+
+    module = importlib.util.module_from_spec(spec)
+
+    # 패키지 정보 주입 (상대 경로 임포트 지원용)
+    module.__package__ = f"plugins.{plugin_id}"
+
+    # sys.modules 등록 (상대 경로 임포트 시 패키지 검색 가능하게 함)
+    sys.modules[module_name] = module
+
+    # 실행
+    print(f"[Plugin-X] Loading plugin: {plugin_id} ...")
+    spec.loader.exec_module(module)
+    return _collect_blueprints(module)
+
+
+class _LazyDispatcher:
+    """
+    [v4.3.0] 지연 로드된 플러그인 Blueprint 전용 디스패처.
+    앱이 이미 요청을 처리한 뒤에는 Blueprint를 등록할 수 없으므로,
+    플러그인 전용 섀도 앱의 url_map으로 매칭하여 실제 뷰 함수를 직접 호출합니다.
+    """
+
+    def __init__(self, plugin_id, module_name, blueprints):
+        from flask import Flask
+
+        self.plugin_id = plugin_id
+        self.shadow_app = Flask(module_name)
+        for bp in blueprints:
+            self.shadow_app.register_blueprint(bp)
+
+    def dispatch(self):
+        from flask import request, redirect
+        from werkzeug.routing import RequestRedirect
+
+        adapter = self.shadow_app.url_map.bind_to_environ(request.environ)
+        try:
+            endpoint, view_args = adapter.match()
+        except RequestRedirect as e:
+            return redirect(e.new_url, code=e.code)
+        # NotFound / MethodNotAllowed는 메인 앱의 에러 핸들러로 전파
+        return self.shadow_app.view_functions[endpoint](**view_args)
+
+
+def _collect_deferred_aliases(entry):
+    """모듈 로드 전 라우팅용 알리아스: manifest aliases + i18n.json의 언어별 aliases"""
+    aliases = list(entry["aliases"])
+    i18n_path = os.path.join(entry["path"], "i18n.json")
+    if os.path.exists(i18n_path):
+        try:
+            with open(i18n_path, "r", encoding="utf-8-sig") as f:
+                i18n_data = json.load(f)
+            for lang_pack in i18n_data.values():
+                lang_aliases = (
+                    lang_pack.get("aliases") if isinstance(lang_pack, dict) else None
+                )
+                if isinstance(lang_aliases, list):
+                    aliases.extend(lang_aliases)
+        except Exception:
+            pass
+    return list(dict.fromkeys(aliases))
+
+
+def _make_lazy_blueprint(entry, url_prefix):
+    """
+    [v4.3.0] 경량 프록시 Blueprint 생성.
+    url_prefix 하위 요청이 처음 들어오는 순간 실제 router 모듈을 임포트합니다.
+    """
+    from flask import jsonify
+    from services.plugin_registry import register_deferred_plugin, ensure_plugin_loaded
+
+    plugin_id = entry["id"]
+    backend_path = entry["backend_path"]
+    module_name = f"plugins_{plugin_id.replace('-', '_')}_router"
+
+    def loader():
+        found = load_plugin_backend(plugin_id, backend_path)
+        _debug_log(
+            f"[Plugin-X] Lazy backend loaded: {plugin_id} -> {[bp.name for bp in found]}"
+        )
+        return _LazyDispatcher(plugin_id, module_name, found)
+
+    register_deferred_plugin(
+        plugin_id,
+        loader,
+        aliases=_collect_deferred_aliases(entry),
+        context_provider=entry.get("context_provider", True),
+    )
+
+    lazy_bp = Blueprint(f"lazy_{plugin_id.replace('-', '_')}", __name__)
+
+    def lazy_dispatch(subpath=""):
+        dispatcher = ensure_plugin_loaded(plugin_id)
+        if dispatcher is None:
+            return (
+                jsonify(
+                    {
+                        "status": "error",
+                        "message": f"Plugin backend '{plugin_id}' failed to load",
+                    }
+                ),
+                503,
+            )
+        return dispatcher.dispatch()
+
+    prefix = url_prefix.rstrip("/")
+    lazy_bp.add_url_rule(
+        prefix,
+        "dispatch",
+        lazy_dispatch,
+        defaults={"subpath": ""},
+        methods=_LAZY_METHODS,
+    )
+    lazy_bp.add_url_rule(
+        f"{prefix}/<path:subpath>", "dispatch", lazy_dispatch, methods=_LAZY_METHODS
+    )
+    return lazy_bp
+
+
+def get_startup_report():
+    """마지막 플러그인 discovery 요약 (지연 플러그인은 현재 로드 여부 포함)"""
+    from services.plugin_registry import get_deferred_plugins
+
+    report = dict(_startup_report)
+    report["deferred_state"] = get_deferred_plugins()
+    return report
+
+
+def _import_plugin_profiled(entry):
+    """
+    [v4.3.0] 워커 스레드에서 플러그인 1개를 임포트하고 소요 시간을 측정.
+    - import_ms: 해당 스레드의 CPU 시간 (순수 임포트 비용)
+    - wall_ms: 실제 경과 시간 (I/O, GIL 대기 포함)
+    - rss_delta_kb: 프로세스 전체 RSS 변화량 (병렬 실행 시 다른 플러그인과 겹칠 수 있는 근사치)
+    """
+    rss_before = _current_rss()
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+
+    result = {
+        "id": entry["id"],
+        "priority": entry["priority"],
+        "status": "loaded",
+        "blueprints": [],
+        "error": None,
     }
-    if not os.path.exists(PLUGINS_DIR):
-        return merged_domains
-
-    for plugin_id in os.listdir(PLUGINS_DIR):
-        plugin_path = os.path.join(PLUGINS_DIR, plugin_id)
-        if os.path.isdir(plugin_path):
-            manifest_path = os.path.join(plugin_path, "manifest.json")
-            if os.path.exists(manifest_path):
-                try:
-                    with open(manifest_path, "r", encoding="utf-8-sig") as f:
-                        manifest = json.load(f)
-                        csp = manifest.get("csp_domains", {})
-                        for directive, domains in csp.items():
-                            if directive in merged_domains and isinstance(
-                                domains, list
-                            ):
-                                for d in domains:
-                                    merged_domains[directive].add(d)
-                except Exception:
-                    continue
-    return {k: sorted(list(v)) for k, v in merged_domains.items()}
-
-def discover_plugin_blueprints():
-    """AEGIS Plugin-X: 각 플러그인 폴더에서 backend_entry로 지정된 Blueprint 자동 수집"""
+    try:
+        result["blueprints"] = load_plugin_backend(entry["id"], entry["backend_path"])
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = str(e)
+        result["traceback"] = traceback.format_exc()
+
+    result["import_ms"] = round((time.thread_time() - cpu_start) * 1000, 2)
+    result["wall_ms"] = round((time.perf_counter() - wall_start) * 1000, 2)
+    rss_after = _current_rss()
+    result["rss_delta_kb"] = (
+        (rss_after - rss_before) // 1024
+        if rss_before is not None and rss_after is not None
+        else None
+    )
+    return result
+
+
+def discover_plugin_blueprints(loading_config=None):
+    """
+    AEGIS Plugin-X: 각 플러그인 폴더에서 backend_entry로 지정된 Blueprint 자동 수집
+    loading_config: settings.json의 plugin_loading 섹션
+      - mode: "eager"(기본) | "lazy" (entry.url_prefix를 선언한 플러그인을 최초 요청 시 로드)
+      - eager_plugins: lazy 모드에서도 부팅 시 로드할 플러그인 ID 목록
+      - import_workers: 병렬 임포트 스레드 수 (1이면 순차 임포트)
+    [v4.3.0] 독립적인 플러그인 모듈은 스레드 풀에서 병렬 임포트하되,
+    Blueprint 반환 순서는 (priority, plugin_id) 순으로 항상 동일하게 유지합니다.
+    """
+    global _startup_report
     blueprints = []
     if not os.path.exists(PLUGINS_DIR):
         return blueprints
 
+    loading_config = loading_config if isinstance(loading_config, dict) else {}
+    lazy_mode = loading_config.get("mode", "eager") == "lazy"
+    eager_ids = set(loading_config.get("eager_plugins") or [])
+    try:
+        workers = max(
+            1, int(loading_config.get("import_workers", DEFAULT_IMPORT_WORKERS))
+        )
+    except (TypeError, ValueError):
+        workers = DEFAULT_IMPORT_WORKERS
+
+    report = {
+        "mode": "lazy" if lazy_mode else "eager",
+        "import_workers": workers,
+        "total_wall_ms": 0.0,
+        "rss_start_kb": None,
+        "rss_end_kb": None,
+        "loaded": [],
+        "deferred": [],
+        "failed": [],
+        "plugins": [],
+    }
+
+    def log(msg, echo=True):
+        if echo:
+            print(msg)
+        _debug_log(msg)
+
+    rss_start = _current_rss()
+    wall_start = time.perf_counter()
     print(f"[Plugin-X] Starting discovery in {PLUGINS_DIR}...")
-    for plugin_id in os.listdir(PLUGINS_DIR):
-        plugin_path = os.path.join(PLUGINS_DIR, plugin_id)
-        if not os.path.isdir(plugin_path):
-            continue
+
+    # 1. 결정적 순서 확정 (priority 오름차순, 동순위는 plugin_id 순)
+    entries = sorted(manifest_index.all(), key=lambda e: (e["priority"], e["id"]))
+    slots = []  # (entry, lazy_blueprint | None)
+    for entry in entries:
+        plugin_id = entry["id"]
 
         # [v4.0] 상세 로깅 추가
-        with open("web_debug.log", "a", encoding="utf-8") as log_f:
-            log_f.write(f"[Plugin-X] Scanning: {plugin_id}\n")
+        log(f"[Plugin-X] Scanning: {plugin_id}", echo=False)
 
-        # 1. manifest.json 체크
-        manifest_path = os.path.join(plugin_path, "manifest.json")
-        if not os.path.exists(manifest_path):
+        backend_path = entry["backend_path"]
+        if not backend_path:
             continue
 
-        try:
-            with open(manifest_path, "r", encoding="utf-8-sig") as f:
-                manifest = json.load(f)
-                backend_file = manifest.get("entry", {}).get("backend")
-
-                if backend_file:
-                    backend_path = os.path.join(plugin_path, backend_file)
-                    if not os.path.exists(backend_path):
-                        msg = (
-                            f"[Plugin-X] ERROR: Backend file not found: {backend_path}"
-                        )
-                        print(msg)
-                        with open("web_debug.log", "a", encoding="utf-8") as log_f:
-                            log_f.write(msg + "\n")
-                        continue
-
-                    # [Plugin-X] 명확한 고유 모듈명 생성 (dashes -> underscores)
-                    module_name = f"plugins_{plugin_id.replace('-', '_')}_router"
-
-                    try:
-                        import importlib.util
-
-                        spec = importlib.util.spec_from_file_location(
-                            module_name, backend_path
-                        )
-                        if spec and spec.loader:
-                            module = importlib.util.module_from_spec(spec)
-
-                            # 패키지 정보 주입 (상대 경로 임포트 지원용)
-                            module.__package__ = f"plugins.{plugin_id}"
-
-                            # sys.modules 등록 (상대 경로 임포트 시 패키지 검색 가능하게 함)
-                            sys.modules[module_name] = module
-
-                            # 실행
-                            print(f"[Plugin-X] Loading plugin: {plugin_id} ...")
-                            spec.loader.exec_module(module)
-
-                            # Blueprint 탐색
-                            found_bp_count = 0
-                            for attr_name in dir(module):
-                                # [v2.3.1] LocalProxy 접근으로 인한 RuntimeContext 에러 방지
-                                # request와 같은 LocalProxy 객체에 getattr 수행 시 런타임 에러 발생 가능
-                                try:
-                                    attr = getattr(module, attr_name)
-                                except Exception:
-                                    continue
-
-                                # Blueprint 객체이거나 'Blueprint' 클래스명인 경우 (Duck Typing)
-                                is_bp = (
-                                    isinstance(attr, Blueprint)
-                                    or type(attr).__name__ == "Blueprint"
-                                )
-                                if is_bp and hasattr(attr, "name"):
-                                    blueprints.append(attr)
-                                    found_bp_count += 1
-                                    msg = f"[Plugin-X] SUCCESS: Backend loaded (Blueprint): {plugin_id} -> {attr.name}"
-                                    print(msg)
-                                    with open(
-                                        "web_debug.log", "a", encoding="utf-8"
-                                    ) as log_f:
-                                        log_f.write(msg + "\n")
-
-                            if found_bp_count == 0:
-                                msg = f"[Plugin-X] WARNING: No Blueprint found in {backend_path}"
-                                print(msg)
-                                with open(
-                                    "web_debug.log", "a", encoding="utf-8"
-                                ) as log_f:
-                                    log_f.write(msg + "\n")
-
-                    except Exception as e:
-                        msg = f"[Plugin-X] CRITICAL ERROR loading {plugin_id}: {e}"
-                        print(msg)
-                        with open("web_debug.log", "a", encoding="utf-8") as log_f:
-                            log_f.write(msg + "\n")
-                        import traceback
-
-                        traceback.print_exc()
-
-        except Exception as e:
-            msg = f"[Plugin-X] Manifest error for {plugin_id}: {e}"
-            print(msg)
-            with open("web_debug.log", "a", encoding="utf-8") as log_f:
-                log_f.write(msg + "\n")
+        if not os.path.exists(backend_path):
+            log(f"[Plugin-X] ERROR: Backend file not found: {backend_path}")
+            report["failed"].append(plugin_id)
+            continue
+
+        # [v4.3.0] Lazy 모드: URL prefix를 선언한 플러그인은 프록시만 등록
+        url_prefix = entry["manifest"].get("entry", {}).get("url_prefix")
+        if lazy_mode and url_prefix and plugin_id not in eager_ids:
+            slots.append((entry, _make_lazy_blueprint(entry, url_prefix)))
+        else:
+            slots.append((entry, None))
+
+    # 2. 임포트 대상 병렬 실행
+    import_entries = [entry for entry, lazy_bp in slots if lazy_bp is None]
+    if workers > 1 and len(import_entries) > 1:
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="plugin-import"
+        ) as pool:
+            results = dict(
+                zip(
+                    [e["id"] for e in import_entries],
+                    pool.map(_import_plugin_profiled, import_entries),
+                )
+            )
+    else:
+        results = {e["id"]: _import_plugin_profiled(e) for e in import_entries}
+
+    # 3. 우선순위 순서대로 결과 수집
+    for entry, lazy_bp in slots:
+        plugin_id = entry["id"]
+        if lazy_bp is not None:
+            blueprints.append(lazy_bp)
+            report["deferred"].append(plugin_id)
+            report["plugins"].append(
+                {"id": plugin_id, "priority": entry["priority"], "status": "deferred"}
+            )
+            continue
+
+        result = results[plugin_id]
+        found = result.pop("blueprints")
+        if result["status"] == "failed":
+            log(f"[Plugin-X] CRITICAL ERROR loading {plugin_id}: {result['error']}")
+            print(result.pop("traceback"), end="")
+            report["failed"].append(plugin_id)
+        else:
+            for bp in found:
+                log(
+                    f"[Plugin-X] SUCCESS: Backend loaded (Blueprint): {plugin_id} -> {bp.name}"
+                )
+            if not found:
+                log(
+                    f"[Plugin-X] WARNING: No Blueprint found in {entry['backend_path']}"
+                )
+            blueprints.extend(found)
+            report["loaded"].append(plugin_id)
+        result["blueprint_names"] = [bp.name for bp in found]
+        report["plugins"].append(result)
+
+    rss_end = _current_rss()
+    report["total_wall_ms"] = round((time.perf_counter() - wall_start) * 1000, 2)
+    report["rss_start_kb"] = rss_start // 1024 if rss_start is not None else None
+    report["rss_end_kb"] = rss_end // 1024 if rss_end is not None else None
+    _startup_report = report
 
     print(
-        f"[Plugin-X] Discovery complete. Total {len(blueprints)} blueprints discovered."
+        f"[Plugin-X] Discovery complete. Total {len(blueprints)} blueprints discovered "
+        f"in {report['total_wall_ms']:.0f}ms ({workers} workers)."
     )
+    if report["deferred"]:
+        log(f"[Plugin-X] Deferred (lazy) plugins: {', '.join(report['deferred'])}")
     return blueprints
@@ -2,14 +2,28 @@ from .context_manager import (
     register_context_provider,
     get_plugin_context_data,
     get_context_aliases,
+    invalidate_context_cache,
+    add_invalidation_listener,
 )
 from .action_manager import (
     register_action_handler,
     register_plugin_action,
     get_all_actions,
+    get_action_registry_version,
     get_action_help_info,
     register_deterministic_action,
     get_action_by_command,
     get_all_deterministic_actions,
 )
+from .action_parser import (
+    ActionTokenizer,
+    get_action_tokenizer,
+    dispatch_actions,
+)
+from .deferred_manager import (
+    register_deferred_plugin,
+    ensure_plugin_loaded,
+    ensure_plugins_loaded,
+    get_deferred_plugins,
+)
 from .help_manager import get_unified_help_markdown
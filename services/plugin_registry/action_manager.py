@@ -8,9 +8,19 @@ from services.plugin_registry.globals import (
     _deterministic_actions,
     _action_help_data,
     _action_view_handlers,
+    _registry_versions,
 )
 
 
+def _bump_action_version():
+    _registry_versions["actions"] += 1
+
+
+def get_action_registry_version():
+    """[v4.3.0] 액션 레지스트리 변경 카운터 (등록될 때마다 증가)"""
+    return _registry_versions["actions"]
+
+
 def register_action_handler(
     action_key, handler_func, prompt_instruction=None, view_handler=None
 ):
@@ -23,6 +33,7 @@ def register_action_handler(
         _action_prompts[key] = prompt_instruction
     if view_handler:
         _action_view_handlers[key] = view_handler
+    _bump_action_version()
     print(f"[PluginRegistry] Action Registered (Manual): {key}")
 
 
@@ -107,6 +118,7 @@ def register_plugin_action(
     _action_help_data[key] = {"desc": desc, "args": arg_list}
     if view_handler:
         _action_view_handlers[key] = view_handler
+    _bump_action_version()
 
     print(f"[PluginRegistry] Systemic Action Registered: {key}")
 
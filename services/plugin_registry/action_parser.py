@@ -0,0 +1,123 @@
+"""
+[v4.3.0] AI 응답의 [ACTION] 태그 단일 패스 추출 및 디스패치.
+- 정규식 1개로 응답 전체를 한 번만 스캔하여 모든 `[ACTION] KEY: args` 호출을 순서대로 추출
+- 키 조회는 정규화 키(대문자, '_' 유무 모두) -> 실제 키 dict로 O(1)
+- 키 맵은 (액션 레지스트리 버전, 핸들러 키 집합)이 바뀔 때만 재구성
+- 서로 다른 플러그인의 액션은 병렬 실행, 같은 플러그인 액션은 응답 순서대로 순차 실행
+"""
+
+import re
+import logging
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from services.plugin_registry.globals import _action_metadata, _registry_versions
+from services.plugin_registry.context_manager import invalidate_context_cache
+
+logger = logging.getLogger(__name__)
+
+# 키는 플러그인 ID의 '-'를 포함할 수 있음 (예: PROACTIVE-AGENT_BRIEF)
+# 콜론 뒤가 비어 있으면 다음 줄을 인자로 사용 (기존 규칙 호환), 단 다음 줄이 태그([VOICE] 등)면 빈 인자
+_ACTION_LINE_RE = re.compile(
+    r"\[ACTION\]\s*([A-Za-z0-9_\-]+)\s*:[ \t]*(?:\r?\n[ \t]*(?!\[))?([^\n]*)", re.IGNORECASE
+)
+
+ACTION_WORKERS = 4
+
+_executor = None
+_executor_lock = threading.Lock()
+_tokenizer_cache = {}
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=ACTION_WORKERS, thread_name_prefix="ai-action"
+            )
+        return _executor
+
+
+class ActionTokenizer:
+    """등록된 액션 키 집합에 대한 [ACTION] 태그 추출기"""
+
+    def __init__(self, keys):
+        self._key_map = {}
+        for key in keys:
+            upper = key.upper()
+            self._key_map[upper] = key
+            # 기존 규칙 호환: 모델이 '_'를 빼고 출력한 키도 허용 (TODOADD -> TODO_ADD)
+            self._key_map.setdefault(upper.replace("_", ""), key)
+
+    def extract(self, text):
+        """응답의 모든 액션 호출을 [(action_key, action_data), ...] 순서대로 반환 (미등록 키 제외)"""
+        invocations = []
+        for match in _ACTION_LINE_RE.finditer(text or ""):
+            key = self._key_map.get(match.group(1).upper())
+            if key is None:
+                logger.debug(f"[ActionParser] Unknown action key: {match.group(1)}")
+                continue
+            invocations.append((key, match.group(2).strip()))
+        return invocations
+
+
+def get_action_tokenizer(handlers):
+    """handlers 키 집합용 토크나이저 (레지스트리 변경 시에만 재구성)"""
+    keys = frozenset(handlers)
+    cache_key = (_registry_versions["actions"], keys)
+    tokenizer = _tokenizer_cache.get(cache_key)
+    if tokenizer is None:
+        if len(_tokenizer_cache) >= 32:
+            _tokenizer_cache.clear()
+        tokenizer = ActionTokenizer(keys)
+        _tokenizer_cache[cache_key] = tokenizer
+    return tokenizer
+
+
+def _run_group(invocations, handlers, target_id):
+    results = []
+    for key, action_data in invocations:
+        logger.debug(f"[ActionParser] 🎯 Action Triggered: {key}")
+        try:
+            results.append((key, handlers[key](action_data, target_id), None))
+            # [v4.3.0] 액션이 바꾼 데이터를 다음 질의에서 바로 보도록 해당 플러그인 컨텍스트 캐시 폐기
+            if key in _action_metadata:
+                invalidate_context_cache(_action_metadata[key])
+        except Exception as e:
+            logger.error(f"Action handler error ({key}): {e}")
+            results.append((key, None, e))
+    return results
+
+
+def dispatch_actions(invocations, handlers, target_id=None, concurrent=True):
+    """
+    추출된 액션 실행. 반환: [(action_key, result, error)] (추출 순서 유지)
+    concurrent=True면 플러그인 단위 그룹을 병렬 실행 (그룹 내부는 순차)
+    """
+    if not invocations:
+        return []
+
+    groups = {}
+    for index, (key, action_data) in enumerate(invocations):
+        # legacy 액션(플러그인 정보 없음)은 키 단위로 독립 그룹 처리
+        group = _action_metadata.get(key) or key
+        groups.setdefault(group, []).append((index, key, action_data))
+
+    if not concurrent or len(groups) == 1:
+        return _run_group(invocations, handlers, target_id)
+
+    executor = _get_executor()
+    futures = []
+    for items in groups.values():
+        # Flask 앱/요청 컨텍스트(contextvars)를 그룹별 복사본으로 전달
+        ctx = contextvars.copy_context()
+        future = executor.submit(
+            ctx.run, _run_group, [item[1:] for item in items], handlers, target_id
+        )
+        futures.append(([item[0] for item in items], future))
+    ordered = [None] * len(invocations)
+    for indexes, future in futures:
+        for index, result in zip(indexes, future.result()):
+            ordered[index] = result
+    return ordered
@@ -1,22 +1,63 @@
+import copy
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
 from services.plugin_registry.globals import (
     _context_providers,
     _ai_processors,
     _context_aliases,
+    _context_policies,
+    _context_concurrency,
+    _context_cache,
 )
-from services.plugin_registry.sanitizer import _sanitize_data
+from services.plugin_registry.sanitizer import sanitize_payload, resolve_budget, fit_to_budget
+from services.plugin_registry.deferred_manager import ensure_plugins_loaded
+
+logger = logging.getLogger(__name__)
+
+# [v4.3.0] 모든 컨텍스트 수집(요청 + 백그라운드 갱신)이 공유하는 워커 수 상한
+CONTEXT_WORKERS = 8
+
+_cache_lock = threading.Lock()
+_inflight = {}  # {(plugin_id, for_ai): [(generation, Future)]} - 공급자당 동시 호출 상한까지 (초과 호출자는 결과 공유)
+_generations = {}  # {plugin_id: int} - 무효화 이전에 시작된 호출의 결과가 캐시를 덮어쓰지 않도록
+_invalidation_listeners = []  # [v4.3.0] callback(plugin_id or None) - 컨텍스트 푸시 등 변경 즉시 반영용
+_executor = None
+
+
+def _normalize_policy(freshness):
+    """freshness: {"ttl": 초, "max_stale": 초, "refresh_in_background": bool}"""
+    policy = {"ttl": 0, "max_stale": 0, "refresh_in_background": True}
+    policy.update({k: v for k, v in freshness.items() if k in policy})
+    return policy
 
 
 def register_context_provider(
-    plugin_id, provider_func, ai_processor=None, aliases=None
+    plugin_id, provider_func, ai_processor=None, aliases=None, freshness=None, max_concurrency=1
 ):
     """
     플러그인 데이터 공급자 등록.
     ai_processor: (선택) AI에게 제공할 때 데이터를 정제할 전용 함수
+    freshness: [v4.3.0] (선택) 캐시 정책 {"ttl", "max_stale", "refresh_in_background"}
+      - ttl 이내: 캐시 값 즉시 반환
+      - ttl 초과 ~ ttl + max_stale: 캐시 값을 즉시 반환하고 백그라운드에서 갱신
+      - 그 이후(또는 refresh_in_background=False): 실시간 호출, 실패 시 마지막 캐시 값으로 대체
+    max_concurrency: [v4.3.0] 공급자 동시 호출 상한 (기본 1). 상한에 도달하면 새 호출 없이
+      가장 최근에 시작된 호출의 결과를 공유 (요청별 인자가 없는 공급자라 결과가 같음, 무효화 이전 호출은 제외)
     """
     _context_providers[plugin_id] = provider_func
+    _context_concurrency[plugin_id] = max(1, int(max_concurrency))
     if ai_processor:
         _ai_processors[plugin_id] = ai_processor
 
+    if freshness:
+        _context_policies[plugin_id] = _normalize_policy(freshness)
+    else:
+        _context_policies.pop(plugin_id, None)
+    invalidate_context_cache(plugin_id)
+
     _context_aliases[plugin_id] = plugin_id
     if aliases:
         for alias in aliases:
@@ -25,16 +66,132 @@ def register_context_provider(
     print(f"[PluginRegistry] Registered: {plugin_id}")
 
 
-def get_plugin_context_data(plugin_ids=None, for_ai=True, timeout=5):
+def invalidate_context_cache(plugin_id=None):
     """
-    플러그인 데이터 병렬 수집. for_ai=True 이면 AI 전용 프로세서가 있을 경우 이를 사용함.
+    [v4.3.0] 플러그인(또는 전체)의 캐시된 컨텍스트 폐기 (데이터를 변경하는 액션 실행 후 호출)
+    진행 중인 호출은 _inflight에 그대로 두되 세대(_generations)를 올려 그 결과가 캐시에 저장되지 않고,
+    이후 호출자와 공유되지도 않도록 함 (무효화 직후 요청은 항상 새 호출)
+    """
+    with _cache_lock:
+        for key in list(_context_cache):
+            if plugin_id is None or key[0] == plugin_id:
+                del _context_cache[key]
+        targets = {key[0] for key in _inflight} if plugin_id is None else {plugin_id}
+        for pid in targets:
+            _generations[pid] = _generations.get(pid, 0) + 1
+    for callback in list(_invalidation_listeners):
+        try:
+            callback(plugin_id)
+        except Exception as e:
+            logger.warning(f"[PluginRegistry] Invalidation listener failed: {e}")
+
+
+def add_invalidation_listener(callback):
+    """[v4.3.0] invalidate_context_cache() 호출 시 callback(plugin_id) 실행 (None이면 전체 무효화)"""
+    if callback not in _invalidation_listeners:
+        _invalidation_listeners.append(callback)
+
+
+def _get_executor():
+    global _executor
+    with _cache_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=CONTEXT_WORKERS, thread_name_prefix="context-provider"
+            )
+        return _executor
+
+
+def _fetch(pid, func, for_ai, generation):
+    """공급자 호출 + 위생 처리 + 캐시 저장 (마감 이후 늦게 끝난 결과도 캐시에 반영). 반환: 캐시 엔트리"""
+    value, size = sanitize_payload(func())
+    # 위생 처리는 변경 없는 객체를 그대로 반환하므로, 공급자가 모듈 상태(dict/list)를 직접 반환해도
+    # 캐시 값이 함께 바뀌지 않도록 저장 시점에 복사본을 만듦 (호출 측은 반환 값을 읽기 전용으로 사용)
+    if isinstance(value, (dict, list)):
+        value = copy.deepcopy(value)
+    entry = {"value": value, "size": size, "fetched_at": time.monotonic()}
+    with _cache_lock:
+        if _generations.get(pid, 0) == generation:
+            _context_cache[(pid, for_ai)] = entry
+    return entry
+
+
+def _load_budget():
+    """[v4.3.0] api.json context_budget 섹션 (설정을 읽을 수 없으면 예산 없음)"""
+    try:
+        from services.config_cache import get_config
+        from routes.config import API_CONFIG_PATH
+
+        return resolve_budget(get_config(API_CONFIG_PATH).get("context_budget"))
+    except Exception as e:
+        logger.debug(f"[PluginRegistry] Context budget unavailable: {e}")
+        return None
+
+
+def _submit(pid, func, for_ai):
     """
-    from concurrent.futures import ThreadPoolExecutor
+    공급자 호출 예약. 현재 세대의 진행 중인 호출이 동시 호출 상한에 도달했으면 가장 최근 호출의 Future를 공유.
+    무효화 이전 세대의 호출은 오래된 데이터를 반환할 수 있으므로 공유하지 않음 (잠시 상한을 넘더라도 새 호출)
+    """
+    key = (pid, for_ai)
+    executor = _get_executor()
+    with _cache_lock:
+        generation = _generations.get(pid, 0)
+        running = _inflight.setdefault(key, [])
+        # 완료 콜백(_release) 실행 전이라 목록에 남아 있는 끝난 호출도 공유하지 않음
+        current = [f for gen, f in running if gen == generation and not f.done()]
+        if len(current) >= _context_concurrency.get(pid, 1):
+            return current[-1]
+        future = executor.submit(_fetch, pid, func, for_ai, generation)
+        running.append((generation, future))
+    # 이미 완료된 Future면 콜백이 즉시 실행되므로 lock 밖에서 등록
+    future.add_done_callback(lambda f: _release(key, f))
+    return future
+
+
+def _release(key, future):
+    with _cache_lock:
+        running = _inflight.get(key)
+        if running:
+            running[:] = [item for item in running if item[1] is not future]
+            if not running:
+                del _inflight[key]
+
+
+def _log_refresh_error(pid, future):
+    if future.exception() is not None:
+        logger.warning(
+            f"[PluginRegistry] Background refresh failed for '{pid}': {future.exception()}"
+        )
+
 
+def _refresh_in_background(pid, func, for_ai):
+    future = _submit(pid, func, for_ai)
+    future.add_done_callback(lambda f: _log_refresh_error(pid, f))
+
+
+def get_plugin_context_data(
+    plugin_ids=None, for_ai=True, timeout=5, with_meta=False, budget=None
+):
+    """
+    플러그인 데이터 병렬 수집. for_ai=True 이면 AI 전용 프로세서가 있을 경우 이를 사용함.
+    [v4.3.0] freshness 정책이 있는 공급자는 캐시 우선 (만료 값은 즉시 반환 후 백그라운드 갱신)
+    [v4.3.0] timeout은 공급자별이 아닌 전체 수집 마감 (초)
+    with_meta=True면 (data, meta) 반환. meta: {plugin_id: {"age": 초, "state": fresh|stale|live|error}}
+    [v4.3.0] for_ai=True면 크기 예산 적용 (budget: resolve_budget() 결과, None이면 api.json context_budget)
+      - 예산 때문에 잘린 플러그인은 meta에 "trimmed": True 표시
+    반환되는 플러그인 값은 캐시 엔트리와 공유되므로 수정하지 말 것 (수정이 필요하면 복사본 사용)
+    """
     all_data = {}
+    meta = {}
+    sizes = {}
     target_items = []
 
+    # [v4.3.0] 지연 로딩 플러그인은 컨텍스트 요청 시점에 실제 모듈을 로드
+    ensure_plugins_loaded(plugin_ids)
+
     pids = plugin_ids if plugin_ids else list(_context_providers.keys())
+    now = time.monotonic()
 
     for pid in pids:
         if pid in _context_providers:
@@ -44,22 +201,69 @@ def get_plugin_context_data(plugin_ids=None, for_ai=True, timeout=5):
                 if (for_ai and pid in _ai_processors)
                 else _context_providers[pid]
             )
-            target_items.append((pid, func))
+            policy = _context_policies.get(pid)
+            # 정책이 없는 공급자의 캐시 값은 실패/마감 초과 시의 대체 값으로만 사용
+            entry = _context_cache.get((pid, for_ai))
+            if policy and entry is not None:
+                age = now - entry["fetched_at"]
+                if age <= policy["ttl"]:
+                    all_data[pid] = entry["value"]
+                    sizes[pid] = entry["size"]
+                    meta[pid] = {"age": round(age, 1), "state": "fresh"}
+                    continue
+                if (
+                    policy["refresh_in_background"]
+                    and age <= policy["ttl"] + policy["max_stale"]
+                ):
+                    all_data[pid] = entry["value"]
+                    sizes[pid] = entry["size"]
+                    meta[pid] = {"age": round(age, 1), "state": "stale"}
+                    _refresh_in_background(pid, func, for_ai)
+                    continue
+            target_items.append((pid, func, entry))
 
-    if not target_items:
-        return {}
+    if target_items:
+        # [v4.3.0] 공유 워커 풀 + 전체 마감(timeout) 1회 대기: 늦은 공급자는 버리고 호출자를 막지 않음
+        futures = {
+            _submit(pid, func, for_ai): (pid, entry) for pid, func, entry in target_items
+        }
+        done, _ = wait(futures, timeout=timeout)
 
-    with ThreadPoolExecutor(max_workers=len(target_items)) as executor:
-        future_to_id = {executor.submit(func): pid for pid, func in target_items}
-
-        for future, pid in future_to_id.items():
+        for future, (pid, entry) in futures.items():
             try:
-                raw_result = future.result(timeout=timeout)
-                all_data[pid] = _sanitize_data(raw_result)
+                if future not in done:
+                    raise TimeoutError(f"Context deadline exceeded ({timeout}s)")
+                live = future.result()
+                all_data[pid] = live["value"]
+                sizes[pid] = live["size"]
+                meta[pid] = {"age": 0.0, "state": "live"}
             except Exception as e:
                 print(f"[PluginRegistry] Timeout or Error in '{pid}': {e}")
-                all_data[pid] = {"status": "error", "message": str(e)}
+                if entry is not None:
+                    # 실시간 호출 실패 시 마지막으로 성공한 값으로 대체
+                    all_data[pid] = entry["value"]
+                    sizes[pid] = entry["size"]
+                    age = time.monotonic() - entry["fetched_at"]
+                    meta[pid] = {"age": round(age, 1), "state": "stale"}
+                else:
+                    all_data[pid] = {"status": "error", "message": str(e)}
+                    meta[pid] = {"age": None, "state": "error"}
+
+    # 요청한 플러그인 순서 유지
+    all_data = {pid: all_data[pid] for pid in pids if pid in all_data}
 
+    if for_ai:
+        # [v4.3.0] 프롬프트 크기 예산: 플러그인별 상한 + 요청 전체 예산을 우선순위 가중치로 배분
+        budget = budget or _load_budget()
+        if budget is not None:
+            all_data, trimmed = fit_to_budget(all_data, sizes, budget)
+            for pid in trimmed:
+                meta.setdefault(pid, {})["trimmed"] = True
+                logger.info(
+                    f"[PluginRegistry] Trimmed '{pid}' context to budget ({sizes[pid]} bytes before)"
+                )
+    if with_meta:
+        return all_data, meta
     return all_data
 
 
@@ -0,0 +1,108 @@
+import time
+import logging
+import threading
+from services.plugin_registry.globals import _context_aliases, _deferred_plugins
+
+logger = logging.getLogger(__name__)
+
+# 로드 실패 후 재시도 대기 (초): 실패할 때마다 2배, 최대 LOAD_RETRY_MAX
+LOAD_RETRY_BASE = 30.0
+LOAD_RETRY_MAX = 600.0
+
+_load_lock = threading.Lock()
+_plugin_locks = {}
+
+
+def register_deferred_plugin(plugin_id, loader, aliases=None, context_provider=True):
+    """
+    [v4.3.0] 지연 로딩(Lazy) 플러그인 등록.
+    loader: 실제 백엔드 모듈을 임포트하는 함수 (최초 접근 시 1회 실행)
+    aliases: 모듈 로드 전에도 라우팅이 가능하도록 manifest/i18n에서 수집한 알리아스
+    context_provider: 컨텍스트 공급자를 등록하는 플러그인인지 (False면 전체 컨텍스트 수집 시 로드하지 않음)
+    """
+    _deferred_plugins[plugin_id] = {
+        "loader": loader,
+        "loaded": False,
+        "result": None,
+        "error": None,
+        "failures": 0,
+        "retry_at": 0.0,
+        "context_provider": context_provider,
+    }
+
+    # 이미 로드된 플러그인의 알리아스는 덮어쓰지 않음
+    _context_aliases.setdefault(plugin_id, plugin_id)
+    for alias in aliases or []:
+        _context_aliases.setdefault(alias, plugin_id)
+
+
+def _get_plugin_lock(plugin_id):
+    with _load_lock:
+        if plugin_id not in _plugin_locks:
+            _plugin_locks[plugin_id] = threading.Lock()
+        return _plugin_locks[plugin_id]
+
+
+def ensure_plugin_loaded(plugin_id):
+    """
+    지연 플러그인이면 실제 모듈을 로드하고 loader 결과를 반환.
+    지연 대상이 아니거나 로드에 실패한 경우 None.
+    로드 실패 시 오류를 기록하고 retry_at 이후의 요청에서 다시 시도 (매 요청 재임포트 방지)
+    """
+    state = _deferred_plugins.get(plugin_id)
+    if state is None:
+        return None
+    if state["loaded"]:
+        return state["result"]
+    if time.monotonic() < state["retry_at"]:
+        return None
+
+    with _get_plugin_lock(plugin_id):
+        if not state["loaded"] and time.monotonic() >= state["retry_at"]:
+            print(f"[Plugin-X] Lazy loading plugin on first use: {plugin_id}")
+            try:
+                state["result"] = state["loader"]()
+                state["loaded"] = True
+                state["error"] = None
+                state["failures"] = 0
+            except Exception as e:
+                state["failures"] += 1
+                delay = min(LOAD_RETRY_BASE * 2 ** (state["failures"] - 1), LOAD_RETRY_MAX)
+                state["error"] = str(e)
+                state["retry_at"] = time.monotonic() + delay
+                logger.error(
+                    f"[Plugin-X] Lazy load failed for {plugin_id} (retry in {delay:.0f}s): {e}"
+                )
+    return state["result"]
+
+
+def ensure_plugins_loaded(plugin_ids=None):
+    """
+    plugin_ids 중 지연 플러그인을 로드.
+    None(전체 컨텍스트 수집)이면 컨텍스트 공급자를 등록하는 지연 플러그인만 로드
+    (라우트 전용 플러그인은 첫 HTTP 요청까지 지연 유지)
+    """
+    if plugin_ids is None:
+        targets = [
+            pid for pid, state in _deferred_plugins.items() if state["context_provider"]
+        ]
+    else:
+        targets = plugin_ids
+    for pid in targets:
+        if pid in _deferred_plugins:
+            ensure_plugin_loaded(pid)
+
+
+def get_deferred_plugins():
+    """지연 플러그인 상태 (loaded, error, 재시도까지 남은 초)"""
+    now = time.monotonic()
+    return {
+        pid: {
+            "loaded": state["loaded"],
+            "error": state["error"],
+            "retry_in": round(max(state["retry_at"] - now, 0.0), 1)
+            if state["error"]
+            else None,
+        }
+        for pid, state in _deferred_plugins.items()
+    }
@@ -2,9 +2,14 @@
 _context_providers = {}
 _ai_processors = {}
 _context_aliases = {}
+_context_policies = {}  # [v4.3.0] {plugin_id: {"ttl", "max_stale", "refresh_in_background"}}
+_context_concurrency = {}  # [v4.3.0] {plugin_id: 공급자 동시 호출 상한 (기본 1)}
+_context_cache = {}  # [v4.3.0] {(plugin_id, for_ai): {"value": ..., "fetched_at": monotonic}}
 _action_providers = {}  # {unique_key: handler_func}
 _action_prompts = {}  # {unique_key: prompt_instruction}
 _action_metadata = {}  # {unique_key: plugin_id}
 _deterministic_actions = {}  # {plugin_id: {command_keyword: action_id}}
 _action_help_data = {}  # {unique_key: {"desc": ..., "args": ...}}
 _action_view_handlers = {}  # {unique_key: view_func(result, platform)}
+_registry_versions = {"actions": 0}  # [v4.3.0] 액션 등록 시 증가 (프롬프트/액션 파서 캐시 무효화용)
+_deferred_plugins = {}  # {plugin_id: {"loader": func, "loaded": bool, "result": ..., "error": ...}}
@@ -4,7 +4,7 @@ from services.plugin_registry.globals import (
     _context_aliases,
 )
 from services.plugin_registry.context_manager import get_context_aliases
-from utils import get_i18n
+from services.i18n_catalog import get_i18n
 
 
 def get_unified_help_markdown(lang="ko", platform="web"):
@@ -1,39 +1,320 @@
-import json
+"""
+[v4.3.0] 플러그인 컨텍스트 위생 처리 + 크기 예산.
+- 재귀 없이 명시적 스택으로 순회 (깊이 제한/문자열/리스트 길이 제한은 기존 규칙 유지)
+- 변경이 없는 하위 트리는 복사하지 않고 원본 객체를 그대로 반환 (첫 변경 시점에만 복사)
+- 민감 키는 미리 계산한 키 집합으로 마스킹
+- 순회 중 JSON 크기(UTF-8 바이트) 추정치를 누적하여 max_bytes 예산을 넘는 부분은 문서 순서상 뒤쪽부터 생략
+- 요청 단위 예산은 플러그인 우선순위 가중치로 배분 (allocate_budget)
+"""
 
+from itertools import islice
 
-def _sanitize_data(data, max_depth=5, current_depth=0):
+MAX_STRING_LENGTH = 10000
+MAX_LIST_ITEMS = 200
+MASK = "***MASKED***"
+DEPTH_EXCEEDED = "<Depth Limit Exceeded>"
+TRUNCATED_SUFFIX = "... (Truncated)"
+# 남은 예산이 이보다 작으면 문자열을 잘라 넣지 않고 생략
+MIN_STRING_BYTES = 24
+# 열린 dict/list마다 생략 표시("_truncated" / "... (+N more)")용으로 미리 확보해 두는 바이트
+MARKER_RESERVE = 24
+# 토큰 예산 -> 바이트 환산 (한글 1자 = 3바이트 = 약 1토큰, 영문은 토큰당 약 4바이트이므로 보수적인 값)
+BYTES_PER_TOKEN = 3
+
+SECRET_KEYS = frozenset(
+    {
+        "api_key",
+        "apikey",
+        "password",
+        "passwd",
+        "token",
+        "access_token",
+        "refresh_token",
+        "secret",
+        "client_secret",
+        "authorization",
+        "cookie",
+    }
+)
+
+_SCALARS = (str, int, float, bool, type(None))
+_SEQUENCES = (list, tuple, set)
+_DROP = object()
+_END = object()
+
+
+def _is_secret(key):
+    return str(key).lower().replace("-", "_") in SECRET_KEYS
+
+
+def _scalar_size(value):
+    """JSON 직렬화 시 UTF-8 바이트 수 추정 (이스케이프 문자는 무시)"""
+    if isinstance(value, str):
+        return (len(value) if value.isascii() else len(value.encode("utf-8"))) + 2
+    if value is None or value is True:
+        return 4
+    if value is False:
+        return 5
+    return len(repr(value))
+
+
+def _truncate_utf8(text, max_bytes):
+    if text.isascii():
+        return text[:max_bytes]
+    return text.encode("utf-8")[:max_bytes].decode("utf-8", errors="ignore")
+
+
+class _Budget:
+    def __init__(self, limit):
+        self.limit = limit
+        self.used = 0
+        # 순회 중인 컨테이너들의 생략 표시 예약분 (표시를 붙여도 limit을 넘지 않도록)
+        self.reserved = 0
+        self.exhausted = False
+
+    def fits(self, size):
+        return self.limit is None or self.used + self.reserved + size <= self.limit
+
+    def charge(self, size):
+        self.used += size
+        if self.limit is not None and self.used + self.reserved >= self.limit:
+            self.exhausted = True
+
+    def reserve(self):
+        if self.limit is not None:
+            self.reserved += MARKER_RESERVE
+
+    def release(self):
+        if self.limit is not None:
+            self.reserved -= MARKER_RESERVE
+
+    def leaf(self, value):
+        """스칼라 값 정리 + 예산 차감. 예산 초과 시 잘라낸 문자열 또는 _DROP"""
+        if not isinstance(value, _SCALARS):
+            # 직렬화 불가능한 객체는 문자열로 변환
+            value = str(value)
+        if isinstance(value, str) and len(value) > MAX_STRING_LENGTH:
+            value = value[:MAX_STRING_LENGTH] + TRUNCATED_SUFFIX
+        size = _scalar_size(value)
+        if self.fits(size):
+            self.charge(size)
+            return value
+
+        room = self.limit - self.used - self.reserved
+        self.exhausted = True
+        if isinstance(value, str) and room >= MIN_STRING_BYTES:
+            value = _truncate_utf8(value, room - 2 - len(TRUNCATED_SUFFIX)) + TRUNCATED_SUFFIX
+            self.charge(_scalar_size(value))
+            return value
+        return _DROP
+
+
+class _Frame:
+    """순회 중인 dict/list 하나 (out은 첫 변경이 생길 때만 생성)"""
+
+    __slots__ = ("src", "depth", "key", "is_dict", "iterator", "total", "accepted", "out")
+
+    def __init__(self, src, depth, key):
+        self.src = src
+        self.depth = depth
+        self.key = key
+        self.is_dict = isinstance(src, dict)
+        self.accepted = 0
+        self.out = None
+        if self.is_dict:
+            self.iterator = iter(list(src.items()))
+            self.total = len(src)
+            if type(src) is not dict:
+                self.out = []
+        else:
+            self.iterator = islice(src, MAX_LIST_ITEMS)
+            # 생략 개수는 MAX_LIST_ITEMS 초과분까지 포함한 원본 길이 기준
+            self.total = len(src)
+            if type(src) is not list or len(src) > MAX_LIST_ITEMS:
+                self.out = []
+
+    def _materialize(self):
+        # 지금까지 받아들인 항목은 모두 원본과 동일하므로 원본에서 그대로 가져옴
+        if self.is_dict:
+            self.out = list(islice(self.src.items(), self.accepted))
+        else:
+            self.out = list(islice(self.src, self.accepted))
+
+    def accept(self, key, value, raw):
+        if self.out is None and (
+            value is not raw or (self.is_dict and not isinstance(key, str))
+        ):
+            self._materialize()
+        if self.out is not None:
+            self.out.append((str(key), value) if self.is_dict else value)
+        self.accepted += 1
+
+    def finish(self, budget):
+        budget.release()
+        # 생략 표시는 크기 예산이 있을 때만 (예산 없는 위젯 데이터는 기존처럼 표시 없이 200개로 자름)
+        dropped = self.total - self.accepted if budget.limit is not None else 0
+        if dropped and self.out is None:
+            self._materialize()
+        if self.out is None:
+            return self.src
+        if self.is_dict:
+            result = dict(self.out)
+            if dropped:
+                result["_truncated"] = dropped
+                budget.charge(16 + len(str(dropped)))
+            return result
+        if dropped:
+            marker = f"... (+{dropped} more)"
+            self.out.append(marker)
+            budget.charge(_scalar_size(marker) + 1)
+        return self.out
+
+
+def _visit(value, depth, max_depth, budget, key):
+    if depth > max_depth:
+        return budget.leaf(DEPTH_EXCEEDED)
+    if isinstance(value, dict) or isinstance(value, _SEQUENCES):
+        if not budget.fits(2 + (MARKER_RESERVE if budget.limit is not None else 0)):
+            budget.exhausted = True
+            return _DROP
+        budget.charge(2)
+        budget.reserve()
+        return _Frame(value, depth, key)
+    return budget.leaf(value)
+
+
+def sanitize_payload(data, max_depth=5, current_depth=0, max_bytes=None):
+    """
+    플러그인 반환 데이터 위생 처리. 반환: (정리된 값, JSON 크기 추정치(바이트))
+    - 깊이 제한, 문자열 10k/리스트 200개 제한, 민감 키 마스킹, 직렬화 불가 객체의 문자열 변환
+    - max_bytes: 크기 예산 (초과분은 문서 순서상 뒤쪽 항목부터 생략, 생략 개수 표시 포함 예산 이내)
+    - 변경이 없는 dict/list는 원본 객체 그대로 반환 (호출 측은 결과를 수정하지 말 것)
+    """
+    budget = _Budget(max_bytes)
+    root = _visit(data, current_depth, max_depth, budget, None)
+    if root is _DROP:
+        return TRUNCATED_SUFFIX, budget.used
+    if not isinstance(root, _Frame):
+        return root, budget.used
+
+    stack = [root]
+    while True:
+        frame = stack[-1]
+        item = _END if budget.exhausted else next(frame.iterator, _END)
+        if item is _END:
+            stack.pop()
+            value = frame.finish(budget)
+            if not stack:
+                return value, budget.used
+            stack[-1].accept(frame.key, value, frame.src)
+            continue
+
+        if frame.is_dict:
+            key, raw = item
+            if _is_secret(key):
+                budget.charge(_scalar_size(str(key)) + _scalar_size(MASK) + 2)
+                frame.accept(key, MASK, raw)
+                continue
+            budget.charge(_scalar_size(str(key)) + 2)
+        else:
+            key, raw = None, item
+            budget.charge(1)
+
+        child = _visit(raw, frame.depth + 1, max_depth, budget, key)
+        if child is _DROP:
+            continue
+        if isinstance(child, _Frame):
+            stack.append(child)
+        else:
+            frame.accept(key, child, raw)
+
+
+def _sanitize_data(data, max_depth=5, current_depth=0, max_bytes=None):
     """
     플러그인 반환 데이터의 위생 처리:
     - JSON 직렬화 가능 여부 확인
     - 순환 참조 방지 및 깊이 제한
     - 너무 큰 데이터(문자열/리스트) 생략 시도
+    - [v4.3.0] max_bytes 크기 예산
+    """
+    return sanitize_payload(data, max_depth, current_depth, max_bytes)[0]
+
+
+def resolve_budget(config):
+    """
+    api.json context_budget 섹션 -> 바이트 단위 예산 (비활성화/미설정이면 None)
+      - max_bytes / max_tokens: 요청(AI 질의 1회) 전체 예산 (max_tokens 지정 시 우선)
+      - plugin_max_bytes / plugin_max_tokens: 플러그인별 기본 상한
+      - plugin_limits: {plugin_id: 바이트} 플러그인별 상한 재정의
+      - priorities: {plugin_id: 가중치} 전체 예산 배분 비율 (기본 1)
     """
-    if current_depth > max_depth:
-        return "<Depth Limit Exceeded>"
-
-    if isinstance(data, (str, int, float, bool, type(None))):
-        if isinstance(data, str) and len(data) > 10000:
-            return str(data[:10000]) + "... (Truncated)"
-        return data
-
-    if isinstance(data, dict):
-        new_dict = {}
-        for k, v in data.items():
-            if k.lower() in ["api_key", "password", "token", "secret"]:
-                new_dict[k] = "***MASKED***"
-            else:
-                new_dict[str(k)] = _sanitize_data(v, max_depth, current_depth + 1)
-        return new_dict
-
-    if isinstance(data, (list, tuple, set)):
-        items = list(data)
-        if len(items) > 200:
-            items = [items[i] for i in range(200)]
-        return [_sanitize_data(item, max_depth, current_depth + 1) for item in items]
-
-    # 직렬화 불가능한 객체는 문자열로 변환 시도
-    try:
-        json.dumps(data)
-        return data
-    except Exception:
-        return str(data)
+    if not isinstance(config, dict) or not config.get("enabled", True):
+        return None
+
+    def to_bytes(bytes_key, tokens_key):
+        if config.get(tokens_key):
+            return int(config[tokens_key]) * BYTES_PER_TOKEN
+        return int(config[bytes_key]) if config.get(bytes_key) else None
+
+    budget = {
+        "total": to_bytes("max_bytes", "max_tokens"),
+        "plugin": to_bytes("plugin_max_bytes", "plugin_max_tokens"),
+        "plugin_limits": dict(config.get("plugin_limits") or {}),
+        "priorities": dict(config.get("priorities") or {}),
+    }
+    if budget["total"] is None and budget["plugin"] is None and not budget["plugin_limits"]:
+        return None
+    return budget
+
+
+def allocate_budget(sizes, total, priorities=None):
+    """
+    sizes: {plugin_id: 바이트}. total 예산을 우선순위 가중치에 비례하여 배분 (weighted max-min fair share)
+    - 자기 몫보다 작은 플러그인은 전부 허용하고 남는 몫은 나머지 플러그인에 재배분
+    반환: {plugin_id: 허용 바이트}
+    """
+    if total is None or sum(sizes.values()) <= total:
+        return dict(sizes)
+
+    priorities = priorities or {}
+    weights = {pid: max(float(priorities.get(pid, 1)), 0.01) for pid in sizes}
+    allowed = {}
+    pending = set(sizes)
+    remaining = float(total)
+    while pending:
+        weight_sum = sum(weights[pid] for pid in pending)
+        satisfied = [
+            pid for pid in pending if sizes[pid] <= remaining * weights[pid] / weight_sum
+        ]
+        if not satisfied:
+            for pid in pending:
+                allowed[pid] = int(remaining * weights[pid] / weight_sum)
+            break
+        for pid in satisfied:
+            allowed[pid] = sizes[pid]
+            remaining -= sizes[pid]
+            pending.discard(pid)
+    return allowed
+
+
+def fit_to_budget(data, sizes, budget):
+    """
+    플러그인별 상한 + 요청 전체 예산을 적용한 payload 반환 (예산 안에 드는 플러그인 값은 그대로 재사용)
+    반환: (data, trimmed plugin_id 집합)
+    """
+    caps = {}
+    for pid, size in sizes.items():
+        cap = budget["plugin_limits"].get(pid, budget["plugin"])
+        caps[pid] = size if cap is None else min(size, int(cap))
+
+    allowed = allocate_budget(caps, budget["total"], budget["priorities"])
+    fitted = {}
+    trimmed = set()
+    for pid, value in data.items():
+        limit = allowed.get(pid)
+        if limit is not None and sizes.get(pid, 0) > limit:
+            fitted[pid] = _sanitize_data(value, max_bytes=limit)
+            trimmed.add(pid)
+        else:
+            fitted[pid] = value
+    return fitted, trimmed
@@ -1,29 +1,12 @@
-import os
-import json
 import secrets
 from flask import request, abort
 from functools import wraps
-from routes.config import PLUGINS_DIR
-
-_manifest_cache = {}
+from services.manifest_index import manifest_index
 
 
 def load_plugin_manifest(plugin_id):
-    """플러그인 manifest.json 로드 (캐싱 적용)"""
-    if plugin_id in _manifest_cache:
-        return _manifest_cache[plugin_id]
-
-    manifest_path = os.path.join(PLUGINS_DIR, plugin_id, "manifest.json")
-    if not os.path.exists(manifest_path):
-        return None
-
-    try:
-        with open(manifest_path, "r", encoding="utf-8-sig") as f:
-            manifest = json.load(f)
-            _manifest_cache[plugin_id] = manifest
-            return manifest
-    except Exception:
-        return None
+    """플러그인 manifest.json 로드 (ManifestIndex 캐시, mtime 재검증)"""
+    return manifest_index.get_manifest(plugin_id)
 
 
 def get_plugin_id_from_request():
@@ -0,0 +1,204 @@
+"""
+AEGIS Plugin-X Asset Watcher
+플러그인 폴더의 변경을 감지하여 변경된 플러그인의 init_pack 세그먼트만 재빌드합니다.
+- Linux: inotify (libc, ctypes) 이벤트 기반
+- 그 외 환경 또는 inotify 초기화 실패 시: mtime 폴링
+"""
+
+import os
+import sys
+import ctypes
+import ctypes.util
+import select
+import struct
+import threading
+import logging
+from routes.config import PLUGINS_DIR
+from services.manifest_index import manifest_index
+from services.plugin_bundler import refresh_plugin_segments, get_plugin_asset_paths
+
+logger = logging.getLogger(__name__)
+
+# inotify 상수 (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = 0x00000800
+IN_CLOEXEC = 0x00080000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+DEFAULT_POLL_INTERVAL = 2.0
+DEBOUNCE_SECONDS = 0.3
+
+
+def _load_libc_inotify():
+    """inotify를 지원하는 libc 핸들 (미지원 환경이면 None)"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class PluginAssetWatcher:
+    """플러그인 자산 변경 감시 스레드 (inotify 우선, 폴링 폴백)"""
+
+    def __init__(self, plugins_dir=PLUGINS_DIR, poll_interval=DEFAULT_POLL_INTERVAL, mode="auto"):
+        self.plugins_dir = plugins_dir
+        self.poll_interval = poll_interval
+        self.mode = mode
+        self.backend = None
+        self._fd = None
+        self._libc = None
+        self._wd_map = {}  # wd -> plugin_id (None이면 PLUGINS_DIR 루트)
+        self._stop = threading.Event()
+        self._thread = None
+
+    # ------------------------------------------------------------------
+    # inotify
+    # ------------------------------------------------------------------
+    def _init_inotify(self):
+        libc = _load_libc_inotify()
+        if libc is None:
+            return False
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return False
+        self._libc, self._fd = libc, fd
+        self._add_watch(self.plugins_dir, None)
+        self._sync_watches()
+        return True
+
+    def _add_watch(self, path, plugin_id):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd >= 0:
+            self._wd_map[wd] = plugin_id
+
+    def _sync_watches(self):
+        """플러그인 폴더 및 자산 하위 폴더에 watch 등록 (이미 등록된 경로는 커널이 동일 wd 반환)"""
+        for entry in manifest_index.all():
+            dirs = {entry["path"]}
+            dirs.update(os.path.dirname(path) for _, path in get_plugin_asset_paths(entry))
+            for path in dirs:
+                if os.path.isdir(path):
+                    self._add_watch(path, entry["id"])
+
+    def _read_events(self):
+        """대기 중인 이벤트를 읽어 변경된 plugin_id 집합 반환 (None 포함 시 전체 재검사)"""
+        changed = set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size + name_len
+            if mask & IN_Q_OVERFLOW:
+                changed.add(None)
+            else:
+                changed.add(self._wd_map.get(wd))
+        return changed
+
+    def _run_inotify(self):
+        while not self._stop.is_set():
+            ready, _, _ = select.select([self._fd], [], [], 1.0)
+            if not ready:
+                continue
+            changed = self._read_events()
+            # 에디터 저장 등 연속 이벤트를 모아서 처리 (debounce)
+            while select.select([self._fd], [], [], DEBOUNCE_SECONDS)[0]:
+                changed |= self._read_events()
+            if changed:
+                self._apply(changed)
+
+    # ------------------------------------------------------------------
+    # 공통
+    # ------------------------------------------------------------------
+    def _apply(self, changed):
+        manifest_index.invalidate()
+        if None in changed:
+            # 루트 변경(플러그인 추가/삭제) 또는 이벤트 유실 -> 전체 시그니처 재검사
+            rebuilt = refresh_plugin_segments()
+            if self._fd is not None:
+                self._sync_watches()
+        else:
+            rebuilt = refresh_plugin_segments(changed)
+        if rebuilt:
+            logger.info(f"[PluginWatcher] Rebuilt segments: {', '.join(rebuilt)}")
+
+    def _run_polling(self):
+        while not self._stop.wait(self.poll_interval):
+            self._apply({None})
+
+    def _run(self):
+        try:
+            if self.backend == "inotify":
+                self._run_inotify()
+            else:
+                self._run_polling()
+        except Exception as e:
+            logger.error(f"[PluginWatcher] Watcher stopped: {e}")
+
+    def start(self):
+        if self._thread is not None:
+            return self
+        if self.mode != "poll" and self._init_inotify():
+            self.backend = "inotify"
+        else:
+            self.backend = "poll"
+        self._thread = threading.Thread(
+            target=self._run, name="plugin-asset-watcher", daemon=True
+        )
+        self._thread.start()
+        print(f"[PluginWatcher] Watching {self.plugins_dir} ({self.backend})")
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+_watcher = None
+
+
+def start_plugin_watcher(watch_config=None):
+    """
+    settings.json의 plugin_watch 섹션으로 감시 스레드 시작 (프로세스당 1회)
+      - enabled: 기본 True
+      - mode: "auto"(inotify 우선) | "poll"
+      - poll_interval: 폴링 주기 (초)
+    """
+    global _watcher
+    watch_config = watch_config if isinstance(watch_config, dict) else {}
+    if not watch_config.get("enabled", True):
+        return None
+    if _watcher is None:
+        _watcher = PluginAssetWatcher(
+            poll_interval=watch_config.get("poll_interval", DEFAULT_POLL_INTERVAL),
+            mode=watch_config.get("mode", "auto"),
+        ).start()
+    return _watcher
@@ -0,0 +1,222 @@
+"""
+AEGIS Prompt Compiler
+IntelligenceHub의 시스템 지침을 (언어, 타임존, 제한 플러그인, 추가 지침) 단위로 미리 조립해 두는 컴파일러입니다.
+- 정적 부분(페르소나, 시스템 컨텍스트, 언어 지침, 액션 지침, 응답 형식)은 1회만 조립
+- 무효화: 액션 레지스트리 버전 + 프롬프트 파일(mtime, size) 시그니처가 바뀔 때만
+- 호출마다 채우는 슬롯은 current_time 하나뿐
+- 섹션별 토큰 수 추정치 보고 (tiktoken 설치 시 정확한 값, 미설치 시 근사치)
+"""
+
+import os
+import hashlib
+import logging
+import threading
+from routes.config import BASE_DIR, PLUGINS_DIR
+
+try:
+    import tiktoken  # 선택 의존성
+
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:
+    _ENCODING = None
+
+logger = logging.getLogger(__name__)
+
+PROMPTS_DIR = os.path.join(BASE_DIR, "config", "prompts")
+
+_TIME_SLOT = "\x00current_time\x00"
+_TIME_SAMPLE = "0000-00-00 00:00:00"  # 토큰 추정 시 슬롯 자리에 넣는 값
+
+# 조합(언어/플러그인/추가 지침) 수 상한 - 초과 시 전체 재컴파일
+MAX_COMPILED = 64
+
+
+def estimate_tokens(text):
+    """토큰 수 추정 (tiktoken 미설치 시: ASCII 4자당 1토큰, 그 외 문자(한글 등) 1자당 1토큰)"""
+    if not text:
+        return 0
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text))
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def _file_signature(path):
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+def _read(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return ""
+
+
+class CompiledPrompt:
+    """current_time 슬롯만 남긴 조립 완료 시스템 지침"""
+
+    def __init__(self, template, sections, signature):
+        self._parts = template.split(_TIME_SLOT)
+        self.signature = signature
+        self.section_tokens = {
+            name: estimate_tokens(text.replace(_TIME_SLOT, _TIME_SAMPLE))
+            for name, text in sections
+        }
+        self.tokens = estimate_tokens(self.render(_TIME_SAMPLE))
+        self.chars = len(self.render(_TIME_SAMPLE))
+
+    def render(self, current_time):
+        return current_time.join(self._parts)
+
+    def report(self):
+        return {
+            "tokens": self.tokens,
+            "chars": self.chars,
+            "sections": dict(self.section_tokens),
+            "exact": _ENCODING is not None,
+        }
+
+
+class PromptCompiler:
+    """(lang, tz_name, restrict_to_plugin_id, extra_instruction, legacy prompts) -> CompiledPrompt 캐시"""
+
+    def __init__(self, prompts_dir=PROMPTS_DIR, plugins_dir=PLUGINS_DIR):
+        self.prompts_dir = prompts_dir
+        self.plugins_dir = plugins_dir
+        self._compiled = {}
+        self._lock = threading.Lock()
+        self.stats = {"compiled": 0, "reused": 0}
+
+    def _source_paths(self, restrict_to_plugin_id):
+        names = ("01_persona.md", "02_system_context.md", "04_response_format.md")
+        paths = [os.path.join(self.prompts_dir, name) for name in names]
+        if restrict_to_plugin_id:
+            paths.append(
+                os.path.join(self.plugins_dir, restrict_to_plugin_id, "ai_prompt.md")
+            )
+        return paths
+
+    def _signature(self, restrict_to_plugin_id):
+        from services.plugin_registry import get_action_registry_version
+
+        return (get_action_registry_version(),) + tuple(
+            _file_signature(p) for p in self._source_paths(restrict_to_plugin_id)
+        )
+
+    def compile(
+        self,
+        lang="ko",
+        tz_name="Asia/Seoul",
+        restrict_to_plugin_id=None,
+        extra_instruction="",
+        legacy_prompts=None,
+    ):
+        # [v3.7.5] legacy action_prompts는 플러그인 제한이 없을 때만 포함
+        legacy_items = ()
+        if not restrict_to_plugin_id:
+            legacy_items = tuple(sorted((legacy_prompts or {}).items()))
+        key = (
+            lang,
+            tz_name,
+            restrict_to_plugin_id,
+            hashlib.sha1((extra_instruction or "").encode("utf-8")).hexdigest(),
+            hash(legacy_items),
+        )
+        signature = self._signature(restrict_to_plugin_id)
+
+        compiled = self._compiled.get(key)
+        if compiled is not None and compiled.signature == signature:
+            self.stats["reused"] += 1
+            return compiled
+
+        compiled = self._build(
+            lang, tz_name, restrict_to_plugin_id, extra_instruction, legacy_items, signature
+        )
+        with self._lock:
+            if len(self._compiled) >= MAX_COMPILED:
+                self._compiled.clear()
+            self._compiled[key] = compiled
+            self.stats["compiled"] += 1
+        logger.info(
+            f"[PromptCompiler] Compiled instruction ({lang}, {restrict_to_plugin_id or '*'}): "
+            f"~{compiled.tokens} tokens {compiled.section_tokens}"
+        )
+        return compiled
+
+    def _build(
+        self, lang, tz_name, restrict_to_plugin_id, extra_instruction, legacy_items, signature
+    ):
+        from services.plugin_registry import get_all_actions
+
+        paths = self._source_paths(restrict_to_plugin_id)
+        persona_prompt = _read(paths[0])
+        system_context_template = _read(paths[1])
+        response_format = _read(paths[2])
+
+        # 하이브리드 모드 시 플러그인 전용 지침이 있으면 그것을 우선, 없으면 기본 extra_instruction 사용
+        plugin_specific_prompt = _read(paths[3]).strip() if restrict_to_plugin_id else ""
+        role_context = plugin_specific_prompt or extra_instruction or ""
+
+        system_prompt = system_context_template.format(
+            current_time=_TIME_SLOT, tz_name=tz_name, role_context=role_context
+        )
+
+        # [v3.8.1] 언어 설정 강제 (브리핑 언어 불일치 방지)
+        if lang == "ko":
+            language = "\nCRITICAL: 모든 응답([DISPLAY], [VOICE])은 반드시 **한국어**로 작성하십시오.\n"
+        else:
+            language = f"\nCRITICAL: YOU MUST RESPOND IN {lang.upper()}.\n"
+
+        # [v3.7.1] PluginRegistry에서 통합 시스템 액션 지침 수집 (필터링 지원)
+        _, reg_prompts = get_all_actions(plugin_id=restrict_to_plugin_id)
+        combined_prompts = dict(reg_prompts)
+        combined_prompts.update(dict(legacy_items))
+
+        actions = ""
+        if combined_prompts:
+            actions = "\n[AVAILABLE ACTIONS]\n"
+            if restrict_to_plugin_id:
+                actions += f"(Context: 이 사용자 요청은 오직 {restrict_to_plugin_id} 플러그인의 범위 내에서 처리되어야 합니다. 타 플러그인의 액션 태그를 절대 사용하지 마십시오.)\n"
+            for part in combined_prompts.values():
+                actions += f"{part}\n"
+
+        response_part = f"\n\n{response_format}\n" if response_format else ""
+
+        sections = [
+            ("persona", f"{persona_prompt}\n\n"),
+            ("system_context", f"{system_prompt}\n"),
+            ("language", language),
+            ("actions", actions),
+            ("response_format", response_part),
+        ]
+        template = "".join(text for _, text in sections)
+        return CompiledPrompt(template, sections, signature)
+
+    def report(self):
+        """컴파일된 지침별 토큰 사용량"""
+        return {
+            "stats": dict(self.stats),
+            "token_counter": "tiktoken" if _ENCODING is not None else "estimate",
+            "prompts": [
+                {
+                    "lang": key[0],
+                    "tz_name": key[1],
+                    "plugin_id": key[2],
+                    **compiled.report(),
+                }
+                for key, compiled in list(self._compiled.items())
+            ],
+        }
+
+    def invalidate(self):
+        with self._lock:
+            self._compiled.clear()
+
+
+# 전역 싱글톤 인스턴스
+prompt_compiler = PromptCompiler()
@@ -0,0 +1,180 @@
+"""
+AEGIS Prompt Encoder
+LLM 프롬프트에 넣는 플러그인 컨텍스트를 토큰 효율적인 텍스트로 직렬화하는 인코더입니다.
+- 같은 형태의 레코드 리스트(뉴스, 종목, 메일, 일정)는 표로 변환: 헤더 1회 + 행 ('|' 구분)
+- None/빈 문자열/빈 컬렉션 필드 제거, 실수는 float_precision 자리로 반올림
+- dict는 "key: value" 줄, 중첩은 2칸 들여쓰기
+- 플러그인별 선택: register_context_provider(..., ai_processor=compact_processor(공급자))
+- 프롬프트 삽입(render_context): 인코딩된 텍스트는 그대로, 그 외 값은 공백 없는 JSON
+"""
+
+import json
+
+DEFAULT_FLOAT_PRECISION = 2
+# 표로 변환할 최소 레코드 수 (1개짜리는 key: value가 더 짧음)
+MIN_TABLE_ROWS = 2
+CELL_SEPARATOR = "|"
+
+
+def _is_empty(value):
+    if isinstance(value, (list, tuple, dict, set)):
+        return not value
+    return value is None or value == ""
+
+
+def _scalar(value, float_precision):
+    """표 셀/값 하나를 한 줄 텍스트로 (구분자와 줄바꿈은 이스케이프)"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        value = round(value, float_precision)
+        # 정수로 떨어지는 실수는 소수점 생략 (21.0 -> 21)
+        return str(int(value)) if value.is_integer() else repr(value)
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(
+            _prune(value, float_precision),
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=str,
+        )
+    text = str(value)
+    if CELL_SEPARATOR in text or "\n" in text:
+        text = text.replace("\r", "").replace("\n", " / ").replace(CELL_SEPARATOR, "/")
+    return text
+
+
+def _prune(value, float_precision, drop_keys=()):
+    """빈 필드 제거 + 실수 반올림 (표 셀 안의 중첩 값용)"""
+    if isinstance(value, dict):
+        return {
+            str(k): _prune(v, float_precision, drop_keys)
+            for k, v in value.items()
+            if k not in drop_keys and not _is_empty(v)
+        }
+    if isinstance(value, (list, tuple)):
+        return [_prune(v, float_precision, drop_keys) for v in value if not _is_empty(v)]
+    if isinstance(value, float):
+        return round(value, float_precision)
+    return value
+
+
+def _table_columns(records, drop_keys):
+    """
+    모든 레코드가 dict이고 같은 형태면 컬럼 목록 (값이 처음 채워진 순서), 아니면 None
+    - 채워진 셀이 절반 이하인 표(서로 다른 형태의 dict 묶음)는 key: value 줄이 더 짧으므로 제외
+    """
+    if len(records) < MIN_TABLE_ROWS or not all(isinstance(r, dict) for r in records):
+        return None
+    columns = []
+    seen = set()
+    filled = 0
+    for record in records:
+        for key, value in record.items():
+            if key in drop_keys or _is_empty(value):
+                continue
+            filled += 1
+            if key not in seen:
+                seen.add(key)
+                columns.append(key)
+    if not columns or filled * 2 <= len(columns) * len(records):
+        return None
+    return columns
+
+
+def _encode_table(records, columns, float_precision, indent):
+    pad = "  " * indent
+    lines = [pad + CELL_SEPARATOR.join(str(c) for c in columns)]
+    for record in records:
+        cells = []
+        for column in columns:
+            value = record.get(column)
+            cells.append("" if _is_empty(value) else _scalar(value, float_precision))
+        lines.append(pad + CELL_SEPARATOR.join(cells))
+    return lines
+
+
+def _uniform_mapping(value, drop_keys):
+    """{name: {레코드}} 형태 (종목/지수 등) -> 이름을 첫 컬럼으로 하는 레코드 리스트"""
+    if _table_columns(list(value.values()), drop_keys) is None:
+        return None
+    return [{"name": k, **v} for k, v in value.items()]
+
+
+def encode_compact(value, float_precision=DEFAULT_FLOAT_PRECISION, drop_keys=()):
+    """컨텍스트 값 -> 표/들여쓰기 기반 텍스트 (drop_keys: AI에게 불필요한 필드 이름)"""
+    drop_keys = frozenset(drop_keys)
+    lines = []
+    # 명시적 스택: (값, 들여쓰기, 머리글) - 깊은 중첩에서도 재귀 한도와 무관
+    stack = [(value, 0, None)]
+    while stack:
+        node, indent, label = stack.pop()
+        pad = "  " * indent
+        if label is None:
+            prefix = None
+        else:
+            prefix = f"{pad}-" if label == "-" else f"{pad}{label}:"
+
+        if isinstance(node, dict):
+            records = _uniform_mapping(node, drop_keys)
+            if records is not None:
+                node = records
+            else:
+                if prefix:
+                    lines.append(prefix)
+                    indent += 1
+                children = [
+                    (v, indent, str(k))
+                    for k, v in node.items()
+                    if k not in drop_keys and not _is_empty(v)
+                ]
+                stack.extend(reversed(children))
+                continue
+
+        if isinstance(node, (list, tuple)):
+            items = [v for v in node if not _is_empty(v)]
+            columns = _table_columns(items, drop_keys)
+            if columns is not None:
+                if prefix:
+                    lines.append(f"{prefix} ({len(items)})")
+                    indent += 1
+                lines.extend(_encode_table(items, columns, float_precision, indent))
+                continue
+            if all(not isinstance(v, (dict, list, tuple)) for v in items):
+                text = ", ".join(_scalar(v, float_precision) for v in items)
+                lines.append(f"{prefix} {text}" if prefix else pad + text)
+                continue
+            if prefix:
+                lines.append(prefix)
+                indent += 1
+            stack.extend(reversed([(v, indent, "-") for v in items]))
+            continue
+
+        text = _scalar(node, float_precision)
+        lines.append(f"{prefix} {text}" if prefix else pad + text)
+    return "\n".join(lines)
+
+
+def compact_processor(provider_func, float_precision=DEFAULT_FLOAT_PRECISION, drop_keys=()):
+    """공급자 함수 -> ai_processor (AI 요청 시 encode_compact 텍스트 반환, 위젯용 데이터는 그대로)"""
+
+    def processor():
+        return encode_compact(provider_func(), float_precision, drop_keys)
+
+    processor.__name__ = f"compact_{getattr(provider_func, '__name__', 'provider')}"
+    return processor
+
+
+def render_value(value):
+    """프롬프트 삽입용 값 하나 (인코딩된 텍스트는 그대로, 그 외는 공백 없는 JSON)"""
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def render_context(context_data):
+    """플러그인별 섹션 ([plugin_id] + 값)으로 컨텍스트 전체 렌더링"""
+    if not isinstance(context_data, dict):
+        return render_value(context_data)
+    return "\n\n".join(
+        f"[{plugin_id}]\n{render_value(value)}" for plugin_id, value in context_data.items()
+    )
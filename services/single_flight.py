@@ -0,0 +1,77 @@
+"""
+AEGIS Single Flight
+같은 키로 동시에 들어온 작업을 하나로 합치는 중복 실행 방지기입니다.
+- 먼저 도착한 호출(leader)만 실제로 실행, 실행 중 도착한 같은 키의 호출(follower)은 leader의 Future를 대기
+- 결과/예외 모두 follower에게 그대로 전달, 완료 즉시 키 해제 (결과 캐시가 아님)
+- 적용: 브리핑 생성, 컨텍스트 수집, TTS 합성 (여러 탭/기기에서 동시에 여는 대시보드의 중복 LLM/edge-tts 호출 제거)
+"""
+
+import json
+import hashlib
+import logging
+import threading
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+# follower 대기 한도 (초) - leader가 비정상적으로 멈춘 경우의 안전장치
+DEFAULT_WAIT_TIMEOUT = 180
+
+
+def fingerprint(*parts):
+    """dict/list를 포함한 값들의 안정적인 키 (키 정렬 JSON의 sha1)"""
+    material = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(material.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """키 단위 in-flight 작업 병합기"""
+
+    def __init__(self, wait_timeout=DEFAULT_WAIT_TIMEOUT):
+        self.wait_timeout = wait_timeout
+        self._calls = {}  # key -> Future
+        self._lock = threading.Lock()
+        self.stats = {"leaders": 0, "shared": 0}
+
+    def do(self, key, fn, *args, **kwargs):
+        """key에 대한 fn(*args, **kwargs) 결과 반환 (실행 중인 같은 키가 있으면 그 결과를 공유)"""
+        return self.do_ex(key, fn, *args, **kwargs)[0]
+
+    def do_ex(self, key, fn, *args, **kwargs):
+        """do()와 같으며 (result, shared)를 반환. shared=True면 다른 호출의 결과를 받은 것"""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+                self.stats["leaders"] += 1
+            else:
+                self.stats["shared"] += 1
+
+        if not leader:
+            logger.debug(f"[SingleFlight] Joined in-flight call: {key}")
+            return future.result(timeout=self.wait_timeout), True
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
+
+    def get_stats(self):
+        return {**self.stats, "in_flight": self.in_flight()}
+
+
+# 전역 싱글톤 인스턴스
+single_flight = SingleFlight()
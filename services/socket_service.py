@@ -37,3 +37,49 @@ def handle_connect():
 @socketio.on("disconnect")
 def handle_disconnect():
     logger.info("A client disconnected from SocketIO")
+    from flask import request
+    from services.context_publisher import get_context_publisher
+
+    publisher = get_context_publisher()
+    if publisher is not None:
+        publisher.unsubscribe(request.sid)
+
+
+@socketio.on("context_subscribe")
+def handle_context_subscribe(data):
+    """[v4.3.0] 위젯 마운트 시 플러그인 컨텍스트 룸(plugin:<id>) 참여. 반환값은 클라이언트 ack"""
+    from flask import request, session
+    from flask_socketio import join_room, emit
+    from services.context_publisher import get_context_publisher, room_name, EVENT_NAME
+
+    plugin_id = (data or {}).get("plugin_id")
+    if "logged_in" not in session:
+        return {"status": "error", "message": "Unauthorized"}
+    if not plugin_id:
+        return {"status": "error", "message": "plugin_id is required"}
+
+    publisher = get_context_publisher()
+    if publisher is None:
+        # 푸시 비활성화: 위젯은 기존 폴링 유지
+        return {"status": "disabled"}
+
+    join_room(room_name(plugin_id))
+    latest = publisher.subscribe(request.sid, plugin_id)
+    if latest is not None:
+        emit(EVENT_NAME, latest)
+    logger.info(f"[SocketService] {request.sid} subscribed to {room_name(plugin_id)}")
+    return {"status": "success"}
+
+
+@socketio.on("context_unsubscribe")
+def handle_context_unsubscribe(data):
+    from flask import request
+    from flask_socketio import leave_room
+    from services.context_publisher import get_context_publisher, room_name
+
+    plugin_id = (data or {}).get("plugin_id")
+    publisher = get_context_publisher()
+    if plugin_id and publisher is not None:
+        leave_room(room_name(plugin_id))
+        publisher.unsubscribe(request.sid, plugin_id)
+    return {"status": "success"}
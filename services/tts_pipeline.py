@@ -0,0 +1,241 @@
+"""
+AEGIS TTS Pipeline
+스트리밍 중인 [VOICE] 텍스트를 문장 단위로 잘라 병렬 합성하고, 준비된 순서대로 재생 목록을 HUD에 전송합니다.
+- 체감 지연: "LLM 전체 시간 + 전체 TTS 시간" -> "첫 문장 생성 + 첫 클립 합성"
+- 문장별 합성은 voice_service.generate_cached_tts를 그대로 사용 (문장 단위 캐시 재사용)
+- 세그먼트는 합성 완료 순서와 무관하게 index 순서로만 발행 (ai_tts_segment)
+"""
+
+import re
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PIPELINE_WORKERS = 3
+
+# 최종 세그먼트 대기 한도 (초) - 개별 합성은 voice_service 내부에서 30초 제한
+SEGMENT_WAIT_TIMEOUT = 45
+
+_VOICE_RE = re.compile(r"\[VOICE\]", re.IGNORECASE)
+_ACTION_RE = re.compile(r"\[ACTION\]", re.IGNORECASE)
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?。！？…])\s+|\n+")
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            from services.config_cache import get_config
+            from services.voice_service import TTS_CONFIG_PATH
+
+            workers = get_config(TTS_CONFIG_PATH).get(
+                "pipeline_workers", DEFAULT_PIPELINE_WORKERS
+            )
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, int(workers)), thread_name_prefix="tts-pipeline"
+            )
+        return _executor
+
+
+def clean_voice_text(text):
+    """TTS용 정리 (마크다운 기호 및 다중 공백 제거, ai_service의 VOICE 생성 규칙과 동일)"""
+    text = re.sub(r"[#*`\-]", "", text or "")
+    return re.sub(r"\s+", " ", text).strip()
+
+
+class SentenceSplitter:
+    """증분 텍스트를 문장 경계에서 분리 (min_chars 미만의 짧은 조각은 다음 문장에 병합)"""
+
+    def __init__(self, min_chars=8):
+        self.min_chars = min_chars
+        self._buffer = ""
+
+    def feed(self, text):
+        self._buffer += text
+        parts = _SENTENCE_END_RE.split(self._buffer)
+        # 마지막 조각은 아직 경계가 오지 않은 미완성 문장
+        self._buffer = parts.pop()
+        sentences, carry = [], ""
+        for part in parts:
+            carry = f"{carry} {part}".strip() if carry else part.strip()
+            if len(carry) >= self.min_chars:
+                sentences.append(carry)
+                carry = ""
+        if carry:
+            self._buffer = f"{carry} {self._buffer}" if self._buffer else carry
+        return sentences
+
+    def flush(self):
+        rest, self._buffer = self._buffer.strip(), ""
+        return [rest] if rest else []
+
+
+def split_sentences(text, min_chars=8):
+    splitter = SentenceSplitter(min_chars=min_chars)
+    return splitter.feed(text) + splitter.flush()
+
+
+class TtsPipeline:
+    """
+    LLM 원문 청크 -> [VOICE] 문장 -> 병렬 TTS -> 순서 보장 세그먼트 발행.
+    emit(payload): {"stream_id", "index", "text", "audio_url", "final", "error"}
+    """
+
+    def __init__(self, emit, stream_id, synthesize=None, executor=None, prefix="tts"):
+        if synthesize is None:
+            from services.voice_service import generate_cached_tts
+
+            synthesize = generate_cached_tts
+        self.emit = emit
+        self.stream_id = stream_id
+        self.prefix = prefix
+        self._synthesize = synthesize
+        self._executor = executor
+        self._splitter = SentenceSplitter()
+        self._raw = []
+        self._consumed = 0
+        self._voice_closed = False
+        self._segments = []  # [{"text", "future", "audio_url", "done"}]
+        self._next_emit = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def _voice_body(self, final=False):
+        raw = "".join(self._raw)
+        match = _VOICE_RE.search(raw)
+        if not match:
+            return None
+        body = raw[match.end() :]
+        end = _ACTION_RE.search(body)
+        if end:
+            self._voice_closed = True
+            return body[: end.start()]
+        if not final:
+            # 꼬리의 미완성 태그("[ACT")는 다음 청크까지 보류
+            bracket = body.rfind("[")
+            if bracket != -1 and "]" not in body[bracket:] and len(body) - bracket <= len("[ACTION]"):
+                body = body[:bracket]
+        return body
+
+    def feed(self, chunk):
+        """LLM 원문 청크 입력 ([VOICE] 영역의 완성된 문장만 합성 시작)"""
+        if self._voice_closed:
+            return
+        self._raw.append(chunk)
+        body = self._voice_body()
+        if body is None:
+            return
+        fresh, self._consumed = body[self._consumed :], len(body)
+        for sentence in self._splitter.feed(fresh):
+            self._submit(sentence)
+
+    def _submit(self, sentence):
+        text = clean_voice_text(sentence)
+        if not text:
+            return
+        executor = self._executor or _get_executor()
+        segment = {"text": text, "audio_url": None, "done": False}
+        with self._lock:
+            self._segments.append(segment)
+        future = executor.submit(self._synthesize, text, prefix=self.prefix)
+        segment["future"] = future
+        future.add_done_callback(lambda f, seg=segment: self._on_ready(seg, f))
+
+    @staticmethod
+    def _resolve(segment, future):
+        if segment["done"]:
+            return
+        try:
+            segment["audio_url"] = future.result()
+        except Exception as e:
+            logger.error(f"[TtsPipeline] Segment synthesis failed: {e}")
+        segment["done"] = True
+
+    def _on_ready(self, segment, future):
+        with self._lock:
+            if self._closed:
+                # 대기 시간 초과 후 늦게 끝난 세그먼트는 이미 종료된 재생 목록에 추가하지 않음
+                return
+            self._resolve(segment, future)
+            self._emit_ready()
+
+    def _emit_ready(self):
+        # 발행 순서가 index 순서와 어긋나지 않도록 lock 안에서 전송
+        while self._next_emit < len(self._segments) and self._segments[self._next_emit]["done"]:
+            self._emit_segment(self._next_emit, self._segments[self._next_emit])
+            self._next_emit += 1
+
+    def _emit_segment(self, index, segment, final=False, error=False):
+        try:
+            self.emit(
+                {
+                    "stream_id": self.stream_id,
+                    "index": index,
+                    "text": segment["text"] if segment else "",
+                    "audio_url": segment["audio_url"] if segment else None,
+                    "final": final,
+                    "error": error,
+                }
+            )
+        except Exception as e:
+            logger.error(f"[TtsPipeline] Emit error: {e}")
+
+    def close(self, final_voice_text=""):
+        """
+        남은 문장을 합성하고 모든 세그먼트가 발행될 때까지 대기.
+        스트림에서 [VOICE]를 찾지 못했으면 최종 파싱된 음성 텍스트를 문장 단위로 합성합니다.
+        반환: 순서대로 정렬된 audio_url 목록 (실패한 세그먼트 제외)
+        """
+        if self._closed:
+            # cancel()로 이미 종료된 파이프라인
+            return []
+        body = None if self._voice_closed else self._voice_body(final=True)
+        if body is not None:
+            fresh, self._consumed = body[self._consumed :], len(body)
+            for sentence in self._splitter.feed(fresh):
+                self._submit(sentence)
+        for sentence in self._splitter.flush():
+            self._submit(sentence)
+        if not self._segments:
+            for sentence in split_sentences(final_voice_text):
+                self._submit(sentence)
+
+        futures = [seg["future"] for seg in self._segments if "future" in seg]
+        _done, pending = wait(futures, timeout=SEGMENT_WAIT_TIMEOUT)
+        if pending:
+            logger.warning(f"[TtsPipeline] {len(pending)} segment(s) timed out")
+
+        with self._lock:
+            # wait()는 완료 콜백 실행 전에 반환될 수 있으므로 완료된 결과를 직접 반영
+            for seg in self._segments:
+                if "future" in seg and seg["future"].done():
+                    self._resolve(seg, seg["future"])
+            self._emit_ready()
+            self._closed = True
+            playlist = [
+                seg["audio_url"]
+                for seg in self._segments[: self._next_emit]
+                if seg["audio_url"]
+            ]
+            self._emit_segment(len(self._segments), None, final=True)
+        return playlist
+
+    def cancel(self):
+        """
+        실패한 응답의 파이프라인 중단: 대기 중인 합성은 취소하고 아직 발행하지 않은 세그먼트는 버린 뒤
+        error=True인 final 마커만 발행 (이미 close()된 파이프라인이면 아무것도 하지 않음)
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            futures = [seg["future"] for seg in self._segments if "future" in seg]
+            self._emit_segment(self._next_emit, None, final=True, error=True)
+        # cancel()은 완료 콜백(_on_ready)을 즉시 실행하므로 lock 밖에서 호출
+        for future in futures:
+            future.cancel()
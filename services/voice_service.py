@@ -2,11 +2,11 @@ import os
 import asyncio
 import edge_tts
 import hashlib
-import json
 import logging
 import threading
 
-from utils import load_settings
+from services.config_cache import get_config, get_settings
+from services.single_flight import single_flight
 
 # Config Paths (Relative to project root)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -14,21 +14,22 @@ TTS_CONFIG_PATH = os.path.join(BASE_DIR, "config", "tts.json")
 
 logger = logging.getLogger(__name__)
 
+# [v4.3.0] 출력 파일별 기록 lock (내용이 다른 합성도 같은 파일에는 순서대로 기록)
+_path_locks = {}
+_path_locks_guard = threading.Lock()
 
-def load_json(path):
-    if os.path.exists(path):
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            pass
-    return {}
+
+def _path_lock(output_path):
+    key = os.path.abspath(output_path)
+    with _path_locks_guard:
+        return _path_locks.setdefault(key, threading.Lock())
 
 
 def get_tts_settings():
     """tts.json 및 settings.json에서 현재 언어에 맞는 설정을 로드합니다."""
-    tts_config = load_json(TTS_CONFIG_PATH)
-    settings = load_settings()
+    # [v4.3.0] TTS 호출마다 파일을 다시 읽지 않도록 캐시 스냅샷 사용
+    tts_config = get_config(TTS_CONFIG_PATH)
+    settings = get_settings()
 
     lang = settings.get("lang", "ko")
     voices = tts_config.get(
@@ -78,6 +79,21 @@ def generate_cached_tts(text, prefix="tts", voice=None):
     cache_dir = os.path.join(BASE_DIR, "static", "audio", "tts_cache")
     output_path = os.path.join(cache_dir, filename)
 
+    # [v4.3.0] 같은 파일을 동시에 요청하면 1회만 합성 (생성 중인 파일을 캐시 히트로 오인하지 않도록 존재 확인도 포함)
+    return single_flight.do(
+        ("cached_tts", output_path),
+        _ensure_cached_tts,
+        text,
+        current_voice,
+        output_path,
+        cache_dir,
+        settings,
+    )
+
+
+def _ensure_cached_tts(text, current_voice, output_path, cache_dir, settings):
+    filename = os.path.basename(output_path)
+
     # [v3.5.1] 파일이 없거나 크기가 0인 경우(생성 실패 흔적) 다시 생성 시도
     if not os.path.exists(output_path) or os.path.getsize(output_path) == 0:
         # [Security/Cleanup] Config에 설정된 cache_limit만큼 유지
@@ -118,6 +134,24 @@ def generate_edge_tts(
 
     current_voice = voice if voice else settings["voice"]
 
+    # [v4.3.0] 같은 파일에 같은 음성을 쓰는 동시 요청은 1회만 합성
+    # (내용이 다른 요청끼리의 동시 기록은 _generate_edge_tts의 파일별 lock + 임시 파일 교체로 방지)
+    key = (
+        "edge_tts",
+        os.path.abspath(output_path),
+        text,
+        current_voice,
+        settings["pitch"],
+        settings["rate"],
+        settings["volume"],
+    )
+    return single_flight.do(
+        key, _generate_edge_tts, text, current_voice, output_path, settings
+    )
+
+
+def _generate_edge_tts(text, current_voice, output_path, settings):
+
     # [IMPORTANT] Ensure output directory exists
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
@@ -125,6 +159,9 @@ def generate_edge_tts(
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
 
+        # [v4.3.0] 임시 파일에 기록 후 교체: 재생 중인 파일이 반쯤 쓰인 상태로 보이지 않음
+        temp_path = f"{output_path}.{threading.get_ident()}.tmp"
+
         async def _generate():
             try:
                 # SSL Verification 이슈 방지를 위해 가끔 필요한 경우가 있음 (현재는 기본값 사용)
@@ -135,16 +172,23 @@ def generate_edge_tts(
                     rate=settings["rate"],
                     volume=settings["volume"],
                 )
-                await communicate.save(output_path)
+                await communicate.save(temp_path)
+                os.replace(temp_path, output_path)
                 return True
             except Exception as e:
                 print(f"[VoiceService] ❌ Internal Edge TTS Error ({current_voice}): {e}")
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
                 return False
 
-        try:
-            return loop.run_until_complete(_generate())
-        finally:
-            loop.close()
+        # 호출 측이 시간 초과로 먼저 반환해도 기록이 끝날 때까지 같은 파일의 다음 합성은 대기
+        with _path_lock(output_path):
+            try:
+                return loop.run_until_complete(_generate())
+            finally:
+                loop.close()
 
     # 스레드 결과값을 받기 위해 Mutable한 객체 사용
     result_box = {"success": False}
@@ -157,9 +201,7 @@ def generate_edge_tts(
         thread.start()
         thread.join(timeout=30)
 
-        # 파일이 실제로 존재하고 크기가 0보다 큰지 확인
-        if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-            return True
+        # 이번 합성 결과로 판단 (이전에 기록된 파일이 남아 있어도 성공으로 보지 않음)
         return result_box["success"]
     except Exception as e:
         print(f"[VoiceService] 🛑 Thread execution error: {e}")
@@ -163,6 +163,20 @@ export const UiHandlers = {
         return { success: true, observed: data.type };
     },
 
+    // [v4.3.0] Server-pushed plugin context (one Socket.IO room per plugin, joined on widget mount)
+    'CONTEXT_SUBSCRIBE': async (data, source, requestId, broker) => {
+        if (!window.socketSync) return { success: false };
+        const ok = await window.socketSync.subscribeContext(source, source, (update) => {
+            broker.send(source, 'CONTEXT_UPDATE', update);
+        });
+        return { success: ok };
+    },
+
+    'CONTEXT_UNSUBSCRIBE': async (data, source) => {
+        if (window.socketSync) window.socketSync.unsubscribeContext(source, source);
+        return { success: true };
+    },
+
     'REG_SCHEDULE': async (data, source, requestId, broker) => {
         if (window.briefingScheduler) {
             console.log(`[UiHandlers] Registering schedule for ${source}: ${data.name} (${data.unit})`);
@@ -251,6 +251,33 @@ export const pluginContext = {
                 });
             },
 
+            // [v4.3.0] Server-pushed context: callback(data) runs whenever this plugin's context changes.
+            // Resolves to a disposer: call it from the widget's destroy() to remove the listener and leave
+            // the plugin room. disposer.active is false when push is unavailable (keep polling as fallback).
+            onContextUpdate: async (callback) => {
+                const listener = (e) => {
+                    if (e.data && e.data.type === 'CONTEXT_UPDATE' && e.data.data && e.data.data.plugin_id === manifest.id) {
+                        callback(e.data.data.data, e.data.data);
+                    }
+                };
+                window.addEventListener('message', listener);
+
+                let disposed = false;
+                const dispose = () => {
+                    if (disposed) return;
+                    disposed = true;
+                    window.removeEventListener('message', listener);
+                    broker.send('core', 'CONTEXT_UNSUBSCRIBE', {});
+                };
+                try {
+                    const res = await broker.request('core', 'CONTEXT_SUBSCRIBE', {});
+                    dispose.active = !!(res && res.success);
+                } catch (e) {
+                    dispose.active = false;
+                }
+                return dispose;
+            },
+
             registerSchedule: (name, unit, callback) => {
                 // [v4.0] All schedules are now bridged to Core for persistence
                 broker.send('core', 'REG_SCHEDULE', { name, unit });
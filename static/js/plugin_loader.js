@@ -32,8 +32,9 @@ export const PluginLoader = {
             let pack = null;
             let cacheHit = false;
 
+            let localData = null;
             try {
-                const localData = await axcCache.get('init_pack');
+                localData = await axcCache.get('init_pack');
                 if (localData && localData.version === serverVersion) {
                     pack = localData.content;
                     cacheHit = true;
@@ -42,8 +43,22 @@ export const PluginLoader = {
                 console.warn("[Plugin-X] Cache access error:", e);
             }
 
+            // [v4.3.0] 이전 버전 번들 보유 시 변경된 세그먼트만 받아 패치
+            if (!pack && localData && localData.content) {
+                try {
+                    pack = await this.patchFromDelta(localData, serverVersion);
+                    if (pack) {
+                        await axcCache.set('init_pack', { version: serverVersion, content: pack });
+                    }
+                } catch (e) {
+                    console.warn("[Plugin-X] Delta patch failed, falling back to full bundle:", e);
+                    pack = null;
+                }
+            }
+
             if (!pack) {
-                const res = await fetch(`/api/plugins/init_pack?t=${Date.now()}`);
+                // [v4.3.0] ETag 재검증(304) 및 사전 압축본 사용을 위해 캐시 버스터 대신 no-cache
+                const res = await fetch('/api/plugins/init_pack', { cache: 'no-cache' });
                 pack = await res.json();
                 await axcCache.set('init_pack', { version: serverVersion, content: pack });
             }
@@ -92,6 +107,38 @@ export const PluginLoader = {
         } catch (e) {
             console.error("[Plugin-X] Initialization failed:", e);
         }
+    },
+
+    /**
+     * [v4.3.0] Incremental Bundle Patch
+     * 보유 번들(localData.version) 이후 변경된 플러그인 세그먼트만 받아 적용합니다.
+     * 서버 이력에 없는 버전이면 null을 반환하여 전체 번들 다운로드로 폴백합니다.
+     */
+    patchFromDelta: async function (localData, serverVersion) {
+        const res = await fetch(`/api/plugins/init_pack/delta?since=${encodeURIComponent(localData.version)}`, { cache: 'no-store' });
+        if (!res.ok) return null;
+        const delta = await res.json();
+        if (delta.full || delta.version !== serverVersion) return null;
+
+        const plugins = (localData.content.plugins || []).filter(p =>
+            !(p.id in delta.changed) && !delta.removed.includes(p.id)
+        );
+        const bundle = { ...(localData.content.bundle || {}) };
+        delta.removed.forEach(id => delete bundle[id]);
+
+        for (const [id, segment] of Object.entries(delta.changed)) {
+            plugins.push(segment.manifest);
+            if (Object.keys(segment.bundle).length > 0) {
+                bundle[id] = segment.bundle;
+            } else {
+                delete bundle[id];
+            }
+        }
+
+        // 서버와 동일한 정렬 규칙 (priority, id)
+        plugins.sort((a, b) => ((a.priority ?? 100) - (b.priority ?? 100)) || a.id.localeCompare(b.id));
+        console.log(`[Plugin-X] Delta applied: ${Object.keys(delta.changed).length} changed, ${delta.removed.length} removed`);
+        return { plugins, bundle };
     }
 };
 
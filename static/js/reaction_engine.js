@@ -70,6 +70,12 @@ class AvatarCommander {
                         const vType = action.visualType || action.visual_type;
                         const visualType = vType ? evaluator.format(vType, data) : null;
 
+                        // [v4.3.0] 음성 없이 말풍선만 갱신 (이미 세그먼트로 재생된 AI 응답의 최종 텍스트)
+                        if (action.skip_tts && window.messageBroker) {
+                            window.messageBroker.broadcast('SPEAK', { text: message, visualType, skip_tts: true });
+                            break;
+                        }
+
                         // [v3.4.7] 음성 전용 텍스트가 있을 경우(briefing 등) 전달
                         const speechText = data.briefing || data.text || message;
                         window.speakTTS(message, audioUrl, visualType, speechText);
@@ -10,6 +10,12 @@ class SocketSyncClient {
         this.isConnected = false;
         this._retryCount = 0;
         this._maxRetries = 5;
+        this._streams = new Map(); // [v4.3.0] stream_id -> 누적 [DISPLAY] 텍스트
+        this._spokenStreams = new Set(); // [v4.3.0] 문장 단위 음성 세그먼트를 이미 재생한 stream_id
+        this._abortedStreams = new Set(); // [v4.3.0] 오류로 끝난 stream_id (이후 세그먼트는 재생하지 않음)
+        this._contextSubs = new Map(); // [v4.3.0] plugin_id -> Map(key -> callback) (서버 컨텍스트 푸시 구독)
+        this._linkedOnce = false;
+        this.ready = new Promise((resolve) => { this._resolveReady = resolve; });
 
         // [v3.5.3] 초기 로딩 시 서버/네트워크 안정화를 위해 1.5초 후 연결 시작
         setTimeout(() => this.init(), 1500);
@@ -22,6 +28,7 @@ class SocketSyncClient {
                 this._retryCount++;
                 if (this._retryCount > this._maxRetries) {
                     console.error("[SocketSync] 🛑 'io' library not available. Socket features disabled.");
+                    this._resolveReady(false);
                     return;
                 }
                 console.warn(`[SocketSync] 'io' library not ready, retrying (${this._retryCount}/${this._maxRetries})...`);
@@ -37,12 +44,19 @@ class SocketSyncClient {
                 reconnectionDelay: 1000,
                 timeout: 30000
             });
+            this._resolveReady(true);
 
             this.socket.on('connect', () => {
                 const transport = this.socket.io.engine.transport.name;
                 console.warn(`[SocketSync] 🛡️ AEGIS Tactical Link Established via [${transport}]`);
                 this.isConnected = true;
                 this._retryCount = 0;
+
+                // [v4.3.0] 재연결 시 서버 룸이 초기화되므로 컨텍스트 구독 복구 (최초 연결은 버퍼된 emit으로 전달됨)
+                if (this._linkedOnce) {
+                    this._contextSubs.forEach((_, pluginId) => this._emitContextSubscribe(pluginId));
+                }
+                this._linkedOnce = true;
             });
 
             this.socket.on('connect_error', (error) => {
@@ -62,10 +76,59 @@ class SocketSyncClient {
                 this.isConnected = false;
             });
 
+            // 0. [v4.3.0] AI 토큰 스트리밍 (요청한 클라이언트에만 전송되는 [DISPLAY] 증분)
+            this.socket.on('ai_chat_delta', (data) => {
+                if (!data || !data.stream_id) return;
+                const prev = this._streams.get(data.stream_id) || '';
+                const text = data.reset ? (data.delta || '') : prev + (data.delta || '');
+                this._streams.set(data.stream_id, text);
+
+                if (window.messageBroker) {
+                    window.messageBroker.broadcast('AI_CHAT_DELTA', { stream_id: data.stream_id, seq: data.seq, text });
+                }
+            });
+
+            // 0-1. [v4.3.0] 문장 단위 TTS 세그먼트 (서버가 index 순서대로 전송 -> 도착 순으로 큐잉)
+            this.socket.on('ai_tts_segment', (data) => {
+                if (!data || !data.stream_id) return;
+                if (data.final && data.error) {
+                    // 실패한 응답: 남은 세그먼트는 버리고 재생 기록 정리
+                    this._spokenStreams.delete(data.stream_id);
+                    this._abortedStreams.add(data.stream_id);
+                    return;
+                }
+                if (data.final || !data.audio_url || this._abortedStreams.has(data.stream_id)) return;
+                this._spokenStreams.add(data.stream_id);
+                this.triggerReaction([{
+                    type: 'TTS',
+                    template: data.text,
+                    audioUrl: data.audio_url,
+                    visualType: 'ai'
+                }], { audio_url: data.audio_url, visual_type: 'ai' });
+            });
+
+            // 0-2. [v4.3.0] 플러그인 컨텍스트 푸시 (구독한 플러그인 중 내용이 바뀐 것만 도착)
+            this.socket.on('context_update', (data) => {
+                if (!data || !data.plugin_id) return;
+                const callbacks = this._contextSubs.get(data.plugin_id);
+                if (!callbacks) return;
+                callbacks.forEach((cb) => {
+                    try { cb(data); } catch (e) { console.error("[SocketSync] context_update handler failed:", e); }
+                });
+            });
+
             // 1. AI 채팅 반응 (Discord NLP 대화 시)
             this.socket.on('ai_chat', (data) => {
                 console.log("[SocketSync] AI Interaction detected:", data);
 
+                // [v4.3.0] 스트리밍 종료: 최종 파싱 결과가 말풍선을 대체
+                let alreadySpoken = false;
+                if (data.stream_id) {
+                    this._streams.delete(data.stream_id);
+                    this._abortedStreams.delete(data.stream_id);
+                    alreadySpoken = this._spokenStreams.delete(data.stream_id);
+                }
+
                 // [v2.8.7] 듀얼 보이스 방지 및 실제 데이터 반영
                 const reactions = [];
 
@@ -74,8 +137,26 @@ class SocketSyncClient {
                     reactions.push({ type: 'MOTION', alias: data.motion });
                 }
 
-                // 2) 음성 및 텍스트 설정
-                if (data.briefing || data.response) {
+                // 2) 음성 및 텍스트 설정 (세그먼트로 이미 재생된 음성은 중복 재생하지 않고 최종 텍스트만 표시)
+                if (data.error) {
+                    // [v4.3.0] 스트리밍 중 실패: 미완성 말풍선을 오류 메시지로 교체 (음성 없음)
+                    reactions.push({
+                        type: 'TTS',
+                        template: data.response,
+                        visualType: data.visual_type || 'ai',
+                        skip_tts: true
+                    });
+                } else if (alreadySpoken) {
+                    console.log("[SocketSync] Voice already delivered as segments:", data.stream_id);
+                    if (data.response || data.briefing) {
+                        reactions.push({
+                            type: 'TTS',
+                            template: data.response || data.briefing,
+                            visualType: data.visual_type || 'ai',
+                            skip_tts: true
+                        });
+                    }
+                } else if (data.briefing || data.response) {
                     // 실제 결과값이 왔을 때 해당 내용 출력
                     reactions.push({
                         type: 'TTS',
@@ -158,6 +239,43 @@ class SocketSyncClient {
         }
     }
 
+    /**
+     * [v4.3.0] 플러그인 컨텍스트 푸시 구독. key가 같으면 콜백을 교체 (위젯 재마운트 시 중복 방지)
+     * @returns {Promise<boolean>} 서버 푸시 사용 가능 여부 (false면 호출 측이 폴링 유지)
+     */
+    async subscribeContext(pluginId, key, callback) {
+        if (!(await this.ready)) return false;
+        let callbacks = this._contextSubs.get(pluginId);
+        if (!callbacks) {
+            callbacks = new Map();
+            this._contextSubs.set(pluginId, callbacks);
+        }
+        callbacks.set(key, callback);
+        return this._emitContextSubscribe(pluginId);
+    }
+
+    unsubscribeContext(pluginId, key) {
+        const callbacks = this._contextSubs.get(pluginId);
+        if (!callbacks) return;
+        callbacks.delete(key);
+        if (callbacks.size === 0) {
+            this._contextSubs.delete(pluginId);
+            if (this.socket) this.socket.emit('context_unsubscribe', { plugin_id: pluginId });
+        }
+    }
+
+    _emitContextSubscribe(pluginId) {
+        return new Promise((resolve) => {
+            const timer = setTimeout(() => resolve(false), 8000);
+            this.socket.emit('context_subscribe', { plugin_id: pluginId }, (ack) => {
+                clearTimeout(timer);
+                const ok = !!ack && ack.status === 'success';
+                if (!ok) console.warn(`[SocketSync] Context push unavailable for ${pluginId}:`, ack);
+                resolve(ok);
+            });
+        });
+    }
+
     /**
      * ReactionEngine을 통해 실제 아바타 동작 실행
      */
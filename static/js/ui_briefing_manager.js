@@ -88,6 +88,22 @@ window.BriefingService = {
                 feedbackEl.classList.remove('loading-pulse');
             }
         }
+    },
+
+    /**
+     * [v4.3.0] 여러 위젯 요약을 한 번의 요청(LLM 1회 호출)으로 가져옵니다.
+     * @param {string[]} types 위젯(플러그인) ID 목록
+     * @returns {Promise<object>} { briefings: { [type]: { display, briefing, sentiment, audio_url } }, missing: [] }
+     */
+    async fetchWidgetBriefings(types = []) {
+        const res = await fetch('/api/plugins/proactive-agent/briefing/widgets', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ types })
+        });
+        const data = await res.json();
+        if (!res.ok) throw new Error(data.message || `HTTP ${res.status}`);
+        return data;
     }
 };
 
@@ -0,0 +1,110 @@
+import os
+import sys
+import time
+import threading
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.plugin_registry import (
+    ActionTokenizer,
+    add_invalidation_listener,
+    dispatch_actions,
+    get_action_tokenizer,
+    register_plugin_action,
+)
+
+
+def test_tokenizer_extracts_all_invocations_in_one_pass():
+    tokenizer = ActionTokenizer(["TODO_ADD", "ALARM_SET", "PROACTIVE-AGENT_BRIEF"])
+    response = (
+        "[DISPLAY] 처리했습니다.\n"
+        "[ACTION] TODO_ADD: 집 청소하기\n"
+        "[action] todoadd: 장보기\n"
+        "[ACTION] UNKNOWN_KEY: 무시\n"
+        "[ACTION] ALARM_SET: 07:00 | 기상\n"
+        "[ACTION] ALARM_SET:\n  06:30 | 운동\n"
+        "[ACTION] PROACTIVE-AGENT_BRIEF:\n"
+        "[VOICE] 완료했습니다."
+    )
+    assert tokenizer.extract(response) == [
+        ("TODO_ADD", "집 청소하기"),
+        ("TODO_ADD", "장보기"),
+        ("ALARM_SET", "07:00 | 기상"),
+        ("ALARM_SET", "06:30 | 운동"),  # 콜론 다음 줄의 인자
+        ("PROACTIVE-AGENT_BRIEF", ""),  # 다음 줄이 태그면 빈 인자
+    ]
+
+    handlers = {"TODO_ADD": None, "ALARM_SET": None}
+    assert get_action_tokenizer(handlers) is get_action_tokenizer(dict(handlers))
+
+
+def test_dispatch_runs_plugins_concurrently_and_keeps_order():
+    calls = []
+    # parser-a의 두 번째 액션과 parser-b 액션이 동시에 실행 중이어야 통과
+    barrier = threading.Barrier(2, timeout=2)
+
+    def a_one(action_data, target_id=None):
+        time.sleep(0.05)
+        calls.append("a1")
+        return "a1"
+
+    def a_two(action_data, target_id=None):
+        barrier.wait()
+        calls.append("a2")
+        return "a2"
+
+    def b_three(action_data, target_id=None):
+        barrier.wait()
+        calls.append("b")
+        return target_id
+
+    for plugin_id, action_id in (("parser-a", "one"), ("parser-a", "two"), ("parser-b", "three")):
+        register_plugin_action(plugin_id, action_id, lambda: None, action_id)
+    handlers = {
+        "PARSER-A_ONE": a_one,
+        "PARSER-A_TWO": a_two,
+        "PARSER-B_THREE": b_three,
+        "LEGACY_KEY": lambda data, target_id=None: 1 / 0,
+    }
+    invocations = [
+        ("PARSER-A_ONE", "x"),
+        ("PARSER-A_TWO", "y"),
+        ("PARSER-B_THREE", "z"),
+        ("LEGACY_KEY", ""),
+    ]
+
+    results = dispatch_actions(invocations, handlers, target_id="HUD")
+
+    assert [r[0] for r in results] == [key for key, _ in invocations]
+    assert [r[1] for r in results[:3]] == ["a1", "a2", "HUD"]
+    assert all(r[2] is None for r in results[:3])
+    assert isinstance(results[3][2], ZeroDivisionError)
+    assert calls.index("a1") < calls.index("a2")
+
+
+def test_failed_action_does_not_stop_its_group_or_invalidate_context():
+    register_plugin_action("parser-todo", "add", lambda: None, "add")
+    register_plugin_action("parser-todo", "done", lambda: None, "done")
+    invalidated = []
+    add_invalidation_listener(invalidated.append)
+
+    def add(action_data, target_id=None):
+        if not action_data:
+            raise ValueError("empty task")
+        return action_data
+
+    handlers = {"PARSER-TODO_ADD": add, "PARSER-TODO_DONE": lambda data, target_id=None: data}
+    invocations = [("PARSER-TODO_ADD", ""), ("PARSER-TODO_DONE", "1"), ("PARSER-TODO_ADD", "빨래")]
+
+    # 같은 플러그인 그룹 안에서 앞 액션이 실패해도 뒤 액션은 계속 실행
+    results = dispatch_actions(invocations, handlers)
+    assert [(key, result) for key, result, _ in results] == [
+        ("PARSER-TODO_ADD", None),
+        ("PARSER-TODO_DONE", "1"),
+        ("PARSER-TODO_ADD", "빨래"),
+    ]
+    assert isinstance(results[0][2], ValueError)
+
+    # 컨텍스트 캐시는 성공한 액션에 대해서만 폐기
+    assert [pid for pid in invalidated if pid == "parser-todo"] == ["parser-todo"] * 2
@@ -0,0 +1,60 @@
+import os
+import sys
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.ai_response_cache import AIResponseCache, make_cache_key
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_key_normalizes_context_and_timestamps():
+    a = make_cache_key(
+        "grok", "grok-4", "현재 시각: 2026-10-18 09:15:07", "뉴스 요약",
+        {"news": ["a"], "updated": "2026-10-18T09:15:07.123"},
+    )
+    b = make_cache_key(
+        "grok", "grok-4", "현재 시각: 2026-10-18 09:15:59", "뉴스 요약",
+        {"updated": "2026-10-18T09:15:42", "news": ["a"]},
+    )
+    c = make_cache_key("grok", "grok-4", "현재 시각: 2026-10-18 09:16:00", "뉴스 요약", {"news": ["a"]})
+
+    assert a == b
+    assert a != c
+    assert a != make_cache_key("ollama", "grok-4", "현재 시각: 2026-10-18 09:15:07", "뉴스 요약")
+
+
+def test_cache_ttl_lru_search_bypass_and_sqlite_tier(tmp_path):
+    clock = _Clock()
+    db_path = str(tmp_path / "ai_cache.db")
+    cache = AIResponseCache(
+        {"ttl": 60, "max_entries": 2, "sqlite_path": db_path}, clock=clock
+    )
+
+    assert not cache.should_use(with_search=True)
+    assert cache.should_use(with_search=True, use_cache=True)
+    assert not cache.should_use(with_search=False, use_cache=False)
+
+    cache.put("k1", {"display": "1"})
+    cache.put("k2", {"display": "2"})
+    assert cache.get("k1") == {"display": "1"}
+    cache.put("k3", {"display": "3"})  # LRU: k2 제거 (메모리)
+    assert cache.get_stats()["entries"] == 2
+
+    # 메모리에서 밀려난 항목은 디스크 계층에서 복구, 재시작 후에도 유지
+    restarted = AIResponseCache({"ttl": 60, "sqlite_path": db_path}, clock=clock)
+    assert restarted.get("k2") == {"display": "2"}
+    assert restarted.stats["disk_hits"] == 1
+
+    clock.now += 61
+    assert cache.get("k1") is None
+    assert restarted.get("k3") is None
+    stats = cache.get_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["bypassed"] == 1
@@ -0,0 +1,137 @@
+import os
+import sys
+import time
+import threading
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.ai_router import AIRouter
+
+SOURCES = {
+    "general": {"active": True},
+    "grok": {"active": True},
+    "ollama": {"active": True},
+    "chatgpt": {"active": False},
+}
+
+
+def test_failover_on_error_and_timeout_with_latency_stats():
+    router = AIRouter(
+        {
+            "min_samples": 2,
+            "policies": {
+                "terminal": {
+                    "fallbacks": ["chatgpt", "grok", "general"],
+                    "attempt_timeout": 0.2,
+                }
+            },
+        }
+    )
+    release = threading.Event()
+    calls = []
+
+    def attempt(source, on_delta):
+        calls.append(source)
+        if source == "ollama":
+            return {"status": "error", "message": "AI Engine Error: 503"}
+        if source == "grok":
+            release.wait(2)  # 멈춘 소스 (attempt_timeout 초과)
+            return {"status": "success", "display": "late"}
+        return {"status": "success", "display": "ok"}
+
+    result = router.route("terminal", "ollama", attempt, SOURCES)
+    release.set()
+
+    # 비활성 chatgpt는 건너뛰고 ollama(오류) -> grok(시간 초과) -> general 순으로 전환
+    assert calls == ["ollama", "grok", "general"]
+    assert result["display"] == "ok" and result["source"] == "general"
+    assert router.stats["failovers"] == 2 and router.stats["timeouts"] == 1
+    assert router.tracker.snapshot("ollama")["error_rate"] == 1.0
+    assert router.tracker.snapshot("grok")["count"] == 1  # 늦은 완료는 중복 집계하지 않음
+
+    # 오류율이 높은 소스는 후보 순서의 뒤로 이동
+    router.tracker.record("ollama", 0.1, False)
+    assert router.candidates("terminal", "ollama", SOURCES) == ["grok", "general", "ollama"]
+
+    # 정책이 없는 호출 지점은 기존과 같이 단일 소스만 사용
+    assert router.candidates("briefing", "ollama", SOURCES) == ["ollama"]
+
+
+def test_hedges_after_p95_and_streams_only_winner():
+    router = AIRouter(
+        {
+            "min_samples": 3,
+            "policies": {"proactive_alert": {"fallbacks": ["grok"], "hedge_after": "p95"}},
+        }
+    )
+    for latency in (0.05, 0.05, 0.08):
+        router.tracker.record("general", latency, True)
+    assert router.tracker.snapshot("general")["p95"] == 0.08
+
+    def attempt(source, on_delta):
+        time.sleep(1.0 if source == "general" else 0.01)
+        return {"status": "success", "display": source}
+
+    started = time.monotonic()
+    result = router.route("proactive_alert", "general", attempt, SOURCES)
+    assert result["source"] == "grok"
+    assert time.monotonic() - started < 0.8
+    assert router.stats["hedges"] == 1 and router.stats["hedge_wins"] == 1
+
+    # 스트리밍 요청은 헤징하지 않고, 첫 청크를 보낸 소스의 청크만 전달
+    chunks = []
+
+    def streaming_attempt(source, on_delta):
+        on_delta(f"{source}-1")
+        on_delta(f"{source}-2")
+        return {"status": "success", "display": source}
+
+    result = router.route(
+        "proactive_alert", "general", streaming_attempt, SOURCES, on_delta=chunks.append
+    )
+    assert result["source"] == "general"
+    assert chunks == ["general-1", "general-2"]
+
+
+def test_stream_attempt_timeout_revokes_stalled_source():
+    router = AIRouter(
+        {"policies": {"chat": {"fallbacks": ["grok", "general"], "attempt_timeout": 0.2}}}
+    )
+    release = threading.Event()
+    late = threading.Event()
+
+    def attempt(source, on_delta):
+        if source == "ollama":
+            # 첫 청크 전에 멈춘 소스: 시간 초과 후 뒤늦게 보낸 청크는 버려야 함
+            release.wait(2)
+            on_delta("ollama-late")
+            late.set()
+            return {"status": "success", "display": "late"}
+        if source == "grok":
+            # 첫 청크를 보낸 뒤에는 attempt_timeout보다 오래 걸려도 끊지 않음
+            on_delta("grok-1")
+            time.sleep(0.4)
+            on_delta("grok-2")
+            return {"status": "success", "display": "grok"}
+        raise AssertionError("general should not be called")
+
+    chunks = []
+    result = router.route("chat", "ollama", attempt, SOURCES, on_delta=chunks.append)
+    release.set()
+    assert late.wait(2)
+    assert result["source"] == "grok"
+    assert chunks == ["grok-1", "grok-2"]
+    assert router.stats["timeouts"] == 1
+
+    # 일부가 이미 표시된 스트림이 실패하면 다른 소스로 이어 붙이지 않고 오류 반환
+    def broken_stream(source, on_delta):
+        if source != "ollama":
+            raise AssertionError("fallback must not start after the first chunk")
+        on_delta("partial")
+        raise RuntimeError("connection reset")
+
+    chunks = []
+    result = router.route("chat", "ollama", broken_stream, SOURCES, on_delta=chunks.append)
+    assert result == {"status": "error", "message": "connection reset"}
+    assert chunks == ["partial"]
@@ -0,0 +1,103 @@
+import os
+import sys
+import json
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.ai_stream import (
+    DisplayStream,
+    collect_chunks,
+    iter_ollama_chunks,
+    iter_openai_chunks,
+)
+
+
+class _LineResponse:
+    def __init__(self, lines):
+        self._lines = [line.encode("utf-8") for line in lines]
+
+    def iter_lines(self):
+        return iter(self._lines)
+
+
+def _replay(events):
+    text = ""
+    for event in events:
+        text = event["delta"] if event["reset"] else text + event["delta"]
+    return text
+
+
+def test_display_stream_emits_only_display_part():
+    events = []
+    stream = DisplayStream(events.append, min_interval=0)
+    chunks = ["**[DIS", "PLAY]**\n오늘 ", "일정은 ", "두 건입니다.\n[VO", "ICE] 일정 두 건", "\n[ACTION] TODO_ADD: x"]
+
+    raw = collect_chunks(chunks, stream.feed)
+    stream.close()
+
+    assert raw == "".join(chunks)
+    assert _replay(events) == "오늘 일정은 두 건입니다."
+    assert [e["seq"] for e in events] == list(range(len(events)))
+    assert len({e["stream_id"] for e in events}) == 1
+
+
+def test_display_stream_resets_when_tag_arrives_late_and_parses_engines():
+    events = []
+    stream = DisplayStream(events.append, min_interval=0)
+    for chunk in ["Sure, here it is. ", "[DISPLAY] 맑음", " 22도"]:
+        stream.feed(chunk)
+    stream.close()
+    assert any(e["reset"] for e in events)
+    assert _replay(events) == "맑음 22도"
+
+    ollama = _LineResponse(
+        [json.dumps({"response": "안녕"}), json.dumps({"response": "하세요", "done": True})]
+    )
+    assert list(iter_ollama_chunks(ollama)) == ["안녕", "하세요"]
+
+    sse = _LineResponse(
+        [
+            ": keep-alive",
+            "data: " + json.dumps({"choices": [{"delta": {"role": "assistant"}}]}),
+            "data: " + json.dumps({"choices": [{"delta": {"content": "Hi"}}]}),
+            "data: [DONE]",
+        ]
+    )
+    assert list(iter_openai_chunks(sse)) == ["Hi"]
+
+
+def test_failed_streamed_query_ends_bubble_with_error_chat(monkeypatch):
+    from types import SimpleNamespace
+    from services import bot_intelligence
+
+    events = []
+    hub = bot_intelligence.IntelligenceHub(
+        broadcast_callback=lambda event, payload, sid=None: events.append((event, payload))
+    )
+    monkeypatch.setattr(
+        bot_intelligence,
+        "get_settings",
+        lambda: {"ai_stream": {"min_interval": 0, "tts_pipeline": False}},
+    )
+    monkeypatch.setattr(
+        bot_intelligence,
+        "prompt_compiler",
+        SimpleNamespace(compile=lambda **kw: SimpleNamespace(render=lambda now: "", tokens=0)),
+    )
+
+    def failing_query(prompt, on_delta=None, **kwargs):
+        on_delta("[DISPLAY] 절반만 ")
+        raise RuntimeError("engine down")
+
+    monkeypatch.setattr(bot_intelligence.ai_service, "query_ai", failing_query)
+
+    result = hub.fallback_to_ai("질문", sid="client-1")
+
+    assert "engine down" in result["text"]
+    deltas = [p for e, p in events if e == "ai_chat_delta"]
+    assert _replay(deltas).strip() == "절반만"
+    # 스트리밍 말풍선은 같은 stream_id의 오류 ai_chat으로 종료
+    event, final = events[-1]
+    assert event == "ai_chat" and final["error"] and final["stream_id"] == deltas[0]["stream_id"]
+    assert "engine down" in final["response"]
@@ -0,0 +1,81 @@
+import os
+import sys
+import json
+import time
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.config_cache import ConfigCache, thaw
+
+
+def _counting_loader(calls):
+    def loader(path):
+        calls.append(path)
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    return loader
+
+
+def test_config_cache_returns_immutable_snapshot(tmp_path):
+    path = tmp_path / "api.json"
+    path.write_text(json.dumps({"sources": {"ollama": {"tags": ["a"]}}}), encoding="utf-8")
+    calls = []
+    cache = ConfigCache(check_interval=60)
+    loader = _counting_loader(calls)
+
+    snapshot = cache.get(str(path), loader=loader)
+    assert cache.get(str(path), loader=loader) is snapshot
+    assert len(calls) == 1
+
+    with pytest.raises(TypeError):
+        snapshot["default_source"] = "gemini"
+    assert snapshot["sources"]["ollama"]["tags"] == ("a",)
+    assert json.loads(json.dumps(snapshot)) == {"sources": {"ollama": {"tags": ["a"]}}}
+
+    mutable = thaw(snapshot)
+    mutable["sources"]["ollama"]["tags"].append("b")
+    assert snapshot["sources"]["ollama"]["tags"] == ("a",)
+
+
+def test_config_cache_stat_and_invalidate(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps({"lang": "ko"}), encoding="utf-8")
+    calls = []
+    cache = ConfigCache(check_interval=0)
+    loader = _counting_loader(calls)
+
+    assert cache.get(str(path), loader=loader)["lang"] == "ko"
+    assert cache.get(str(path), loader=loader)["lang"] == "ko"
+    assert len(calls) == 1  # stat 시그니처 동일 -> 재파싱 없음
+
+    path.write_text(json.dumps({"lang": "en"}), encoding="utf-8")
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 10**9))
+    assert cache.get(str(path), loader=loader)["lang"] == "en"
+
+    slow_cache = ConfigCache(check_interval=60)
+    slow_cache.get(str(path), loader=loader)
+    path.write_text(json.dumps({"lang": "ja"}), encoding="utf-8")
+    slow_cache.invalidate(str(path))
+    assert slow_cache.get(str(path), loader=loader)["lang"] == "ja"
+
+
+def test_partial_settings_save_keeps_other_keys(tmp_path, monkeypatch):
+    from services import config_cache
+
+    path = tmp_path / "settings.json"
+    path.write_text(
+        json.dumps({"lang": "ko", "network": {"use_proxy": True}, "zoom": 1.0}), encoding="utf-8"
+    )
+    monkeypatch.setattr(config_cache, "SETTINGS_PATH", str(path))
+
+    # 위젯 배치/모델 전환 등은 일부 키만 보내므로 나머지 설정은 유지되어야 함
+    assert config_cache.save_settings({"zoom": 1.2, "last_model": "gemini"}, wait=True) is True
+    assert json.loads(path.read_text(encoding="utf-8")) == {
+        "lang": "ko",
+        "network": {"use_proxy": True},
+        "zoom": 1.2,
+        "last_model": "gemini",
+    }
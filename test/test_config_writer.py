@@ -0,0 +1,71 @@
+import os
+import sys
+import json
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.config_cache import get_config
+from services.config_writer import ConfigWriter
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_config_writer_coalesces_and_merges(tmp_path):
+    path = str(tmp_path / "config.json")
+    writer = ConfigWriter(coalesce_window=60)
+
+    writer.write(path, {"a": 1}, merge=False)
+    writer.write(path, {"b": 2})
+    writer.write(path, {"a": 3})
+
+    # 기록 전에도 캐시는 최신 내용을 반환
+    assert get_config(path) == {"a": 3, "b": 2}
+    assert not os.path.exists(path)
+
+    writer.flush()
+    assert _read(path) == {"a": 3, "b": 2}
+    assert writer.stats["written"] == 1
+    assert writer.stats["coalesced"] == 2
+    assert not [f for f in os.listdir(tmp_path) if f.endswith(".tmp")]
+
+
+def test_config_writer_bounded_backups(tmp_path):
+    path = str(tmp_path / "schedule.json")
+    writer = ConfigWriter(coalesce_window=0, backup_limit=2)
+
+    for version in range(4):
+        writer.write(path, {"version": version}, merge=False, backup=True)
+        writer.flush()
+
+    assert _read(path) == {"version": 3}
+    assert _read(path + ".bak") == {"version": 2}
+    assert _read(path + ".bak.1") == {"version": 1}
+    assert not os.path.exists(path + ".bak.2")
+
+
+def test_config_writer_surfaces_failed_writes(tmp_path):
+    path = str(tmp_path / "settings.json")
+    writer = ConfigWriter(coalesce_window=60)
+    writer.write(path, {"lang": "ko"}, merge=False, wait=True)
+
+    # 병합된 저장은 같은 Future를 공유하고, 직렬화 실패는 Future 예외로 전달
+    first = writer.write(path, {"lang": "en"})
+    second = writer.write(path, {"broken": object()})
+    assert first is second and not first.done()
+    writer.flush()
+    assert isinstance(first.exception(), TypeError)
+
+    # 실패 후 캐시는 디스크의 실제 내용으로 복귀, 상태 보고에 실패 기록
+    assert get_config(path) == {"lang": "ko"}
+    assert path in writer.report()["failures"]
+
+    # wait=True는 실제 기록 결과를 반환하고, 성공하면 실패 기록 제거
+    assert writer.write(path, {"broken": object()}, wait=True) is False
+    assert writer.write(path, {"lang": "en"}, merge=False, wait=True) is True
+    assert _read(path) == {"lang": "en"}
+    report = writer.report()
+    assert report["failures"] == {} and report["pending"] == 0
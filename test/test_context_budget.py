@@ -0,0 +1,114 @@
+import os
+import sys
+import json
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.plugin_registry.sanitizer import (
+    sanitize_payload,
+    _sanitize_data,
+    allocate_budget,
+    resolve_budget,
+)
+from services.plugin_registry import register_context_provider, get_plugin_context_data
+
+
+def _json_bytes(value):
+    return len(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def test_sanitizer_reuses_clean_subtrees_and_enforces_byte_budget():
+    clean = {"events": [{"title": "회의", "start": "09:00"}], "count": 1}
+    value, size = sanitize_payload(clean)
+    assert value is clean  # 변경이 없으면 복사하지 않음
+    assert abs(size - _json_bytes(clean)) <= 4
+
+    # 변경된 가지만 복사되고 형제 하위 트리는 원본 재사용
+    dirty = {"profile": {"name": "a"}, "auth": {"Access-Token": "x", "user": "u"}}
+    value = _sanitize_data(dirty)
+    assert value["auth"] == {"Access-Token": "***MASKED***", "user": "u"}
+    assert value["profile"] is dirty["profile"] and dirty["auth"]["Access-Token"] == "x"
+
+    # 기존 규칙 유지: 깊이 제한, 리스트 200개, 직렬화 불가 객체
+    deep = {"a": {"b": {"c": {"d": {"e": {"f": {"g": 1}}}}}}}
+    assert _sanitize_data(deep)["a"]["b"]["c"]["d"]["e"]["f"] == "<Depth Limit Exceeded>"
+    assert len(_sanitize_data(list(range(500)))) == 200
+    records = _sanitize_data([{"id": i} for i in range(500)])
+    assert len(records) == 200 and records[-1] == {"id": 199}
+
+    # 예산 적용 시 생략 개수는 200개 상한을 넘는 항목까지 포함
+    value, _ = sanitize_payload(list(range(500)), max_bytes=100000)
+    assert len(value) == 201 and value[-1] == "... (+300 more)"
+    value, _ = sanitize_payload([{"id": i} for i in range(500)], max_bytes=300)
+    assert value[-1] == f"... (+{500 - (len(value) - 1)} more)"
+    assert _sanitize_data({"when": object()})["when"].startswith("<object")
+
+    # 깊은 중첩도 재귀 한도와 무관하게 처리
+    nested = []
+    for _ in range(5000):
+        nested = [nested]
+    assert _sanitize_data(nested, max_depth=10000) is nested
+
+    inbox = {"mails": [{"subject": "메일 %d" % i, "body": "본문" * 200} for i in range(100)]}
+    value, size = sanitize_payload(inbox, max_bytes=4000)
+    assert _json_bytes(value) <= 4000 + 64
+    assert value["mails"][0] == inbox["mails"][0]
+    assert value["mails"][-1].startswith("... (+")
+
+
+def test_request_budget_is_shared_by_priority():
+    assert allocate_budget({"a": 100, "b": 100}, 1000) == {"a": 100, "b": 100}
+    # 작은 플러그인은 전부 허용, 남는 몫은 가중치 비율로 배분
+    assert allocate_budget({"s": 500, "hi": 9000, "lo": 9000}, 6500, {"hi": 3}) == {
+        "s": 500,
+        "hi": 4500,
+        "lo": 1500,
+    }
+
+    rows = [{"title": "row %d" % i, "note": "x" * 80} for i in range(200)]
+    register_context_provider("test_budget_calendar", lambda: {"events": rows})
+    register_context_provider("test_budget_news", lambda: {"items": rows})
+    register_context_provider("test_budget_clock", lambda: {"time": "09:00"})
+
+    budget = resolve_budget(
+        {"max_tokens": 3000, "plugin_max_bytes": 6000, "priorities": {"test_budget_calendar": 2}}
+    )
+    assert budget["total"] == 9000
+    ids = ["test_budget_calendar", "test_budget_news", "test_budget_clock"]
+    data, meta = get_plugin_context_data(ids, with_meta=True, budget=budget)
+
+    assert list(data) == ids
+    assert data["test_budget_clock"] == {"time": "09:00"} and "trimmed" not in meta["test_budget_clock"]
+    calendar = _json_bytes(data["test_budget_calendar"])
+    news = _json_bytes(data["test_budget_news"])
+    assert meta["test_budget_calendar"]["trimmed"] and meta["test_budget_news"]["trimmed"]
+    assert calendar <= 6000 + 64 and news < calendar
+    assert calendar + news <= 9000 + 128
+
+    # 위젯용(for_ai=False) 데이터에는 예산을 적용하지 않음
+    full = get_plugin_context_data(["test_budget_news"], for_ai=False, budget=budget)
+    assert len(full["test_budget_news"]["items"]) == 200
+
+
+def test_budget_markers_fit_and_cache_is_isolated_from_provider_state():
+    # 생략 표시까지 포함해서 예산 이내
+    inbox = {"mails": [{"subject": "메일 %d" % i, "body": "본문" * 200} for i in range(100)]}
+    for max_bytes in (120, 500, 2000):
+        value, _ = sanitize_payload(inbox, max_bytes=max_bytes)
+        assert _json_bytes(value) <= max_bytes
+    rows = {"row%d" % i: "x" * 40 for i in range(50)}
+    value, _ = sanitize_payload(rows, max_bytes=300)
+    assert _json_bytes(value) <= 300 and value["_truncated"] > 0
+
+    # 모듈 상태를 그대로 반환하는 공급자: 이후 상태 변경이 캐시된 fresh 값에 새어 들어가지 않음
+    state = {"tasks": ["milk"]}
+    register_context_provider("test_budget_state", lambda: state, freshness={"ttl": 60})
+    ids = ["test_budget_state"]
+    first = get_plugin_context_data(ids, for_ai=False)["test_budget_state"]
+    assert first == {"tasks": ["milk"]} and first is not state
+
+    state["tasks"].append("eggs")
+    data, meta = get_plugin_context_data(ids, for_ai=False, with_meta=True)
+    assert meta["test_budget_state"]["state"] == "fresh"
+    assert data["test_budget_state"] == {"tasks": ["milk"]}
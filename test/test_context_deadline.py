@@ -0,0 +1,171 @@
+import os
+import sys
+import time
+import threading
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.plugin_registry import register_context_provider, get_plugin_context_data
+
+
+def test_global_deadline_abandons_late_provider_and_late_result_fills_cache():
+    release = threading.Event()
+    calls = []
+
+    def slow_provider():
+        calls.append("slow")
+        release.wait(5)
+        return {"quotes": [1, 2, 3]}
+
+    register_context_provider("test_dl_fast_a", lambda: {"a": 1})
+    register_context_provider("test_dl_fast_b", lambda: (time.sleep(0.2), {"b": 2})[1])
+    register_context_provider(
+        "test_dl_slow", slow_provider, freshness={"ttl": 60, "max_stale": 0}
+    )
+
+    started = time.monotonic()
+    data, meta = get_plugin_context_data(
+        ["test_dl_fast_a", "test_dl_fast_b", "test_dl_slow"], timeout=0.4, with_meta=True
+    )
+    elapsed = time.monotonic() - started
+
+    # 마감은 공급자별이 아닌 전체 1회, 늦은 공급자를 기다리지 않고 반환
+    assert 0.3 <= elapsed < 1.0
+    assert data["test_dl_fast_a"] == {"a": 1} and data["test_dl_fast_b"] == {"b": 2}
+    assert data["test_dl_slow"]["status"] == "error" and meta["test_dl_slow"]["state"] == "error"
+
+    # 버려진 호출이 늦게 끝나도 결과는 캐시에 반영되어 다음 요청에서 재호출 없이 사용
+    release.set()
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        data, meta = get_plugin_context_data(["test_dl_slow"], timeout=0.1, with_meta=True)
+        if meta["test_dl_slow"]["state"] == "fresh":
+            break
+        time.sleep(0.05)
+    assert data["test_dl_slow"] == {"quotes": [1, 2, 3]}
+    assert calls == ["slow"]
+
+
+def test_concurrent_requests_share_one_provider_call():
+    release = threading.Event()
+    calls = []
+
+    def provider():
+        calls.append(threading.current_thread().name)
+        release.wait(5)
+        return {"inbox": 3}
+
+    register_context_provider("test_dl_shared", provider)
+    results = []
+
+    def worker():
+        results.append(get_plugin_context_data(["test_dl_shared"], timeout=5))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    time.sleep(0.2)
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert len(calls) == 1
+    assert calls[0].startswith("context-provider")
+    assert results == [{"test_dl_shared": {"inbox": 3}}] * 4
+
+
+def test_invalidation_does_not_share_calls_started_before_it():
+    from services.plugin_registry import invalidate_context_cache
+
+    release = threading.Event()
+    state = {"v": 0}
+    calls = []
+
+    def hanging_provider():
+        value = dict(state)
+        calls.append(value["v"])
+        if len(calls) == 1:
+            release.wait(5)
+        return value
+
+    register_context_provider("test_dl_hang", hanging_provider)
+    ids = ["test_dl_hang"]
+    _, meta = get_plugin_context_data(ids, timeout=0.1, with_meta=True)
+    assert meta["test_dl_hang"]["state"] == "error"
+
+    # 데이터 변경 + 무효화 후의 요청은 진행 중인 이전 세대 호출을 공유하지 않고 새로 호출
+    state["v"] = 1
+    invalidate_context_cache("test_dl_hang")
+    data, meta = get_plugin_context_data(ids, timeout=1, with_meta=True)
+    assert meta["test_dl_hang"]["state"] == "live" and data["test_dl_hang"] == {"v": 1}
+    assert calls == [0, 1]
+
+    # 무효화 이전에 시작된 호출의 늦은 결과는 캐시에 저장되지 않음
+    release.set()
+    time.sleep(0.1)
+    data, meta = get_plugin_context_data(ids, timeout=1, with_meta=True)
+    assert data["test_dl_hang"] == {"v": 1}
+    assert calls == [0, 1, 1]
+
+
+def test_deadline_miss_falls_back_to_last_good_value():
+    release = threading.Event()
+    state = {"hang": False, "calls": 0}
+
+    def provider():
+        state["calls"] += 1
+        if state["hang"]:
+            release.wait(5)
+        return {"unread": state["calls"]}
+
+    # 정책이 없는 공급자도 마지막 성공 값은 마감 초과/실패 시의 대체 값으로 사용
+    register_context_provider("test_dl_inbox", provider)
+    ids = ["test_dl_inbox"]
+    assert get_plugin_context_data(ids, timeout=1) == {"test_dl_inbox": {"unread": 1}}
+
+    state["hang"] = True
+    started = time.monotonic()
+    data, meta = get_plugin_context_data(ids, timeout=0.1, with_meta=True)
+    assert time.monotonic() - started < 0.5
+    assert data["test_dl_inbox"] == {"unread": 1} and meta["test_dl_inbox"]["state"] == "stale"
+
+    # 버려진 호출이 끝나기 전의 요청은 새 호출 없이 같은 대체 값, 끝난 뒤에는 새 결과
+    _, meta = get_plugin_context_data(ids, timeout=0.1, with_meta=True)
+    assert meta["test_dl_inbox"]["state"] == "stale" and state["calls"] == 2
+    state["hang"] = False
+    release.set()
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        data, meta = get_plugin_context_data(ids, timeout=1, with_meta=True)
+        if meta["test_dl_inbox"]["state"] == "live":
+            break
+        time.sleep(0.05)
+    assert data["test_dl_inbox"]["unread"] >= 2
+
+
+def test_max_concurrency_caps_parallel_calls_per_provider():
+    release = threading.Event()
+    calls = []
+
+    def provider():
+        calls.append(len(calls))
+        release.wait(5)
+        return {"n": len(calls)}
+
+    # 요청별 결과가 독립적인 공급자는 동시 호출 상한을 올려 병렬 호출 허용
+    register_context_provider("test_dl_capped", provider, max_concurrency=2)
+    results = []
+
+    def worker():
+        results.append(get_plugin_context_data(["test_dl_capped"], timeout=5))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    time.sleep(0.2)
+    assert calls == [0, 1]  # 상한을 넘는 요청은 진행 중인 호출의 결과를 공유
+    release.set()
+    for t in threads:
+        t.join(5)
+    assert len(results) == 4 and all(r["test_dl_capped"]["n"] == 2 for r in results)
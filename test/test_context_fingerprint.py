@@ -0,0 +1,52 @@
+import os
+import sys
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.context_fingerprint import context_fingerprint, normalize_context
+
+
+def _context(**overrides):
+    context = {
+        "weather": {"temp": 21.04, "status": "맑음", "fetched_at": "2026-10-18 09:00:01"},
+        "system-stats": {"cpu": 12.5, "uptime": "01:02:03"},
+        "news": [{"title": "헤드라인", "timestamp": 1760745600.0}],
+        "calendar": [{"summary": "회의", "start": "2026-10-18T10:00:00+09:00"}],
+    }
+    context.update(overrides)
+    return context
+
+
+def test_volatile_fields_and_float_noise_do_not_change_fingerprint():
+    base = context_fingerprint(_context())
+    noisy = _context(
+        weather={"temp": 21.01, "status": "맑음", "fetched_at": "2026-10-18 09:04:59"},
+        **{"system-stats": {"cpu": 12.52, "uptime": "01:06:41"}},
+        news=[{"title": "헤드라인", "timestamp": 1760745900.0}],
+    )
+    assert context_fingerprint(noisy) == base
+    assert normalize_context({"Updated_At": 1, "UPTIME_SEC": 2, "temp": 3.14159}) == {"temp": 3.1}
+
+
+def test_material_changes_and_custom_volatile_keys():
+    base = context_fingerprint(_context())
+    # 일정 시작 시각처럼 내용에 해당하는 시간 값은 지문에 포함
+    moved = _context(calendar=[{"summary": "회의", "start": "2026-10-18T11:00:00+09:00"}])
+    assert context_fingerprint(moved) != base
+    assert context_fingerprint(_context(weather={"temp": 25.0, "status": "비"})) != base
+    # *_at 형태라도 수집 기록용 키가 아니면 내용 (변경된 마감/수신 시각은 새 브리핑 대상)
+    for key in ("start_at", "due_at", "received_at"):
+        task = [{"title": "보고서", key: "2026-10-18T10:00"}]
+        rescheduled = [{"title": "보고서", key: "2026-10-19T10:00"}]
+        assert context_fingerprint(_context(todo=task)) != context_fingerprint(
+            _context(todo=rescheduled)
+        )
+
+    # 설정으로 휘발성 필드를 추가/교체 가능 (예: 계속 변하는 CPU 사용률 무시)
+    busy = _context(**{"system-stats": {"cpu": 80.0, "uptime": "01:02:03"}})
+    assert context_fingerprint(busy) != base
+    keys = ["uptime*", "fetched*", "*timestamp*", "cpu"]
+    assert context_fingerprint(busy, volatile_keys=keys) == context_fingerprint(
+        _context(), volatile_keys=keys
+    )
@@ -0,0 +1,126 @@
+import os
+import sys
+import time
+import threading
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.plugin_registry import (
+    register_context_provider,
+    get_plugin_context_data,
+    invalidate_context_cache,
+)
+from services.plugin_registry.globals import _context_cache
+
+
+def _age_cache(plugin_id, seconds):
+    for key, entry in _context_cache.items():
+        if key[0] == plugin_id:
+            entry["fetched_at"] -= seconds
+
+
+def test_serves_cached_then_stale_while_refreshing_in_background():
+    calls = []
+    refreshed = threading.Event()
+
+    def provider():
+        calls.append(time.monotonic())
+        if len(calls) > 1:
+            refreshed.set()
+        return {"price": len(calls)}
+
+    register_context_provider(
+        "test_swr_quotes", provider, freshness={"ttl": 60, "max_stale": 600}
+    )
+
+    data, meta = get_plugin_context_data(["test_swr_quotes"], with_meta=True)
+    assert data == {"test_swr_quotes": {"price": 1}} and meta["test_swr_quotes"]["state"] == "live"
+
+    data, meta = get_plugin_context_data(["test_swr_quotes"], with_meta=True)
+    assert data["test_swr_quotes"] == {"price": 1} and meta["test_swr_quotes"]["state"] == "fresh"
+    assert len(calls) == 1
+
+    # ttl 초과: 이전 값을 즉시 반환하고 갱신은 백그라운드에서
+    _age_cache("test_swr_quotes", 120)
+    data, meta = get_plugin_context_data(["test_swr_quotes"], with_meta=True)
+    assert data["test_swr_quotes"] == {"price": 1}
+    assert meta["test_swr_quotes"]["state"] == "stale" and meta["test_swr_quotes"]["age"] >= 120
+    assert refreshed.wait(5)
+    time.sleep(0.05)
+    assert get_plugin_context_data(["test_swr_quotes"]) == {"test_swr_quotes": {"price": 2}}
+
+    # 액션 등으로 데이터가 바뀌면 무효화 후 실시간 호출
+    invalidate_context_cache("test_swr_quotes")
+    assert get_plugin_context_data(["test_swr_quotes"]) == {"test_swr_quotes": {"price": 3}}
+
+
+def test_expired_value_refetched_live_and_used_as_fallback_on_error():
+    state = {"fail": False, "calls": 0}
+
+    def provider():
+        state["calls"] += 1
+        if state["fail"]:
+            raise RuntimeError("upstream down")
+        return {"headline": state["calls"]}
+
+    register_context_provider(
+        "test_swr_news", provider, freshness={"ttl": 10, "max_stale": 20}
+    )
+    register_context_provider("test_live_only", lambda: {"n": time.monotonic()})
+
+    assert get_plugin_context_data(["test_swr_news"]) == {"test_swr_news": {"headline": 1}}
+
+    # ttl + max_stale 초과: 실시간 호출, 실패하면 마지막 성공 값으로 대체
+    _age_cache("test_swr_news", 60)
+    state["fail"] = True
+    data, meta = get_plugin_context_data(["test_swr_news", "test_live_only"], with_meta=True)
+    assert data["test_swr_news"] == {"headline": 1}
+    assert meta["test_swr_news"]["state"] == "stale" and state["calls"] == 2
+    assert list(data) == ["test_swr_news", "test_live_only"]
+
+    # 정책이 없는 공급자는 기존처럼 매번 실시간 호출
+    first = get_plugin_context_data(["test_live_only"])["test_live_only"]["n"]
+    assert get_plugin_context_data(["test_live_only"])["test_live_only"]["n"] != first
+
+
+def test_failed_background_refresh_keeps_stale_value_and_retries():
+    state = {"fail": True, "calls": 0}
+    attempted = threading.Event()
+
+    def provider():
+        state["calls"] += 1
+        if state["calls"] == 1:
+            raise RuntimeError("cold start failed")
+        if state["fail"] and state["calls"] > 2:
+            attempted.set()
+            raise RuntimeError("upstream down")
+        return {"rate": state["calls"]}
+
+    register_context_provider(
+        "test_swr_rates", provider, freshness={"ttl": 30, "max_stale": 300}
+    )
+
+    # 캐시가 없을 때의 실패는 오류 결과로 반환하고 캐시하지 않음
+    data, meta = get_plugin_context_data(["test_swr_rates"], with_meta=True)
+    assert data["test_swr_rates"]["status"] == "error"
+    assert meta["test_swr_rates"]["state"] == "error"
+    assert get_plugin_context_data(["test_swr_rates"]) == {"test_swr_rates": {"rate": 2}}
+
+    # 백그라운드 갱신 실패: 호출자에게 예외를 전파하지 않고 만료 값을 유지
+    _age_cache("test_swr_rates", 60)
+    data, meta = get_plugin_context_data(["test_swr_rates"], with_meta=True)
+    assert data["test_swr_rates"] == {"rate": 2} and meta["test_swr_rates"]["state"] == "stale"
+    assert attempted.wait(5)
+    time.sleep(0.05)
+    data, meta = get_plugin_context_data(["test_swr_rates"], with_meta=True)
+    assert data["test_swr_rates"] == {"rate": 2} and meta["test_swr_rates"]["age"] >= 60
+
+    # 실패한 갱신은 캐시를 바꾸지 않으므로 다음 요청에서 다시 갱신 시도
+    state["fail"] = False
+    time.sleep(0.05)
+    deadline = time.monotonic() + 5
+    while get_plugin_context_data(["test_swr_rates"])["test_swr_rates"] == {"rate": 2}:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert get_plugin_context_data(["test_swr_rates"])["test_swr_rates"]["rate"] > 3
@@ -0,0 +1,143 @@
+import os
+import sys
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.context_publisher import ContextPublisher, room_name
+from services.plugin_registry import (
+    register_context_provider,
+    invalidate_context_cache,
+    add_invalidation_listener,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _publisher(values, clock, collected, emitted):
+    def collect(plugin_ids, timeout):
+        collected.append(list(plugin_ids))
+        data = {pid: values[pid] for pid in plugin_ids if pid in values}
+        return data, {pid: {"age": 0.0, "state": "live"} for pid in data}
+
+    def emit(event, data, room):
+        emitted.append((event, room, data["data"]))
+
+    config = {"tick": 5, "default_interval": 60, "intervals": {"test_push_alarm": 30}}
+    return ContextPublisher(config, collect=collect, emit=emit, clock=clock)
+
+
+def test_publishes_only_changed_plugins_on_their_own_schedule():
+    clock, collected, emitted = FakeClock(), [], []
+    values = {"test_push_alarm": {"active_alarms": []}, "test_push_news": {"items": ["a"]}}
+    publisher = _publisher(values, clock, collected, emitted)
+
+    # 여러 클라이언트가 구독해도 수집은 플러그인당 1회
+    for sid in ("sid-1", "sid-2", "sid-3"):
+        publisher.subscribe(sid, "test_push_alarm")
+        publisher.subscribe(sid, "test_push_news")
+    assert publisher.poll_once() == ["test_push_alarm", "test_push_news"]
+    assert collected == [["test_push_alarm", "test_push_news"]]
+    assert [room for _, room, _ in emitted] == [
+        room_name("test_push_alarm"),
+        room_name("test_push_news"),
+    ]
+
+    # 주기 전에는 수집하지 않음, 알람(30초)만 먼저 재수집되고 내용이 같으면 발행하지 않음
+    clock.now += 10
+    assert publisher.poll_once() == []
+    clock.now += 25
+    assert publisher.poll_once() == []
+    assert collected[-1] == ["test_push_alarm"]
+    assert publisher.stats["unchanged"] == 1
+
+    # 휘발성 필드만 바뀐 경우는 변경으로 보지 않음, 실제 변경은 해당 플러그인 룸에만 발행
+    values["test_push_alarm"] = {"active_alarms": [{"time": "07:00"}], "fetched_at": 1}
+    values["test_push_news"] = {"items": ["a"], "last_updated": "now"}
+    clock.now += 60
+    assert publisher.poll_once() == ["test_push_alarm"]
+    assert emitted[-1] == (
+        "context_update",
+        room_name("test_push_alarm"),
+        values["test_push_alarm"],
+    )
+
+    # 구독자가 모두 떠난 플러그인은 더 이상 수집하지 않음
+    for sid in ("sid-1", "sid-2", "sid-3"):
+        publisher.unsubscribe(sid)
+    clock.now += 120
+    assert publisher.poll_once() == []
+    assert publisher.subscriptions() == {}
+
+
+def test_invalidation_republishes_immediately_and_new_subscriber_gets_latest():
+    clock, collected, emitted = FakeClock(), [], []
+    values = {"test_push_todo": {"tasks": ["milk"]}}
+    publisher = _publisher(values, clock, collected, emitted)
+    register_context_provider(
+        "test_push_todo", lambda: values["test_push_todo"], freshness={"ttl": 30, "max_stale": 300}
+    )
+    # start()가 등록하는 리스너만 연결 (스레드 없이 poll_once() 직접 호출)
+    add_invalidation_listener(publisher.request_refresh)
+
+    assert publisher.subscribe("sid-1", "test_push_todo") is None
+    publisher.poll_once()
+    assert publisher.interval("test_push_todo") == 30  # freshness ttl을 갱신 주기로 사용
+
+    # 늦게 마운트된 위젯은 마지막 발행 이벤트를 즉시 받음
+    latest = publisher.subscribe("sid-2", "test_push_todo")
+    assert latest["plugin_id"] == "test_push_todo" and latest["data"] == {"tasks": ["milk"]}
+
+    # 액션 실행 등으로 캐시가 무효화되면 주기를 기다리지 않고 재발행
+    values["test_push_todo"] = {"tasks": ["milk", "eggs"]}
+    clock.now += 1
+    assert publisher.poll_once() == []
+    invalidate_context_cache("test_push_todo")
+    assert publisher.poll_once() == ["test_push_todo"]
+    assert emitted[-1][2] == {"tasks": ["milk", "eggs"]}
+    assert len(collected) == 2
+
+
+def test_failed_collect_and_emit_are_retried():
+    clock, collected, emitted = FakeClock(), [], []
+    values = {"test_push_mail": {"unread": 1}}
+    publisher = _publisher(values, clock, collected, emitted)
+    publisher.subscribe("sid-1", "test_push_mail")
+
+    # 수집 실패는 오류로 집계하고 정상 주기에 다시 수집
+    failing = {"collect": True, "emit": True}
+    collect, emit = publisher._collect, publisher._emit
+
+    def flaky_collect(plugin_ids, timeout):
+        if failing["collect"]:
+            raise TimeoutError("collect timed out")
+        return collect(plugin_ids, timeout)
+
+    def flaky_emit(event, data, room):
+        if failing["emit"]:
+            raise ConnectionError("socket closed")
+        emit(event, data, room)
+
+    publisher._collect, publisher._emit = flaky_collect, flaky_emit
+    assert publisher.poll_once() == []
+    assert publisher.stats["errors"] == 1
+    assert publisher.subscribe("sid-2", "test_push_mail") is None
+    clock.now += 5
+    assert publisher.poll_once() == []  # 기본 주기(60초) 전
+
+    # 전송 실패한 변경은 내용이 같아도 다음 tick에 재발행 (unchanged로 삼키지 않음)
+    failing["collect"] = False
+    clock.now += 60
+    assert publisher.poll_once() == ["test_push_mail"]
+    assert emitted == [] and publisher.stats["errors"] == 2
+    failing["emit"] = False
+    clock.now += 5
+    assert publisher.poll_once() == ["test_push_mail"]
+    assert emitted == [("context_update", room_name("test_push_mail"), {"unread": 1})]
+    assert publisher.stats["published"] == 1 and publisher.stats["unchanged"] == 0
@@ -0,0 +1,54 @@
+import os
+import sys
+import json
+import time
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import csp_policy
+from services.csp_policy import CompiledCSP, compile_csp
+
+
+def test_compile_csp_merges_in_stable_order():
+    header = compile_csp(
+        {"img-src": ["https://user.example", "'self'"], "worker-src": ["blob:"]},
+        {"img-src": ["https://plugin.example", "https://user.example"]},
+    )
+    directives = dict(part.split(" ", 1) for part in header.split("; "))
+
+    assert directives["img-src"] == (
+        "'self' data: blob: https://user.example https://plugin.example"
+    )
+    assert directives["worker-src"] == "blob:"
+    assert header == compile_csp(
+        {"img-src": ["https://user.example", "'self'"], "worker-src": ["blob:"]},
+        {"img-src": ["https://plugin.example", "https://user.example"]},
+    )
+
+
+def test_compiled_csp_recompiles_on_settings_change(tmp_path, monkeypatch):
+    class FakeIndex:
+        version = 1
+
+        def current_version(self):
+            return self.version
+
+        def get_csp_domains(self):
+            return {"connect-src": ["https://api.example"]}
+
+    monkeypatch.setattr(csp_policy, "manifest_index", FakeIndex())
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(json.dumps({"network": {}}), encoding="utf-8")
+
+    compiled = CompiledCSP(str(settings_path), check_interval=0)
+    first = compiled.header()
+    assert "https://api.example" in first
+    assert compiled.header() is first
+
+    settings_path.write_text(
+        json.dumps({"network": {"csp_allow_list": {"img-src": ["https://cdn.example"]}}}),
+        encoding="utf-8",
+    )
+    os.utime(settings_path, ns=(time.time_ns(), time.time_ns() + 10**9))
+    assert "https://cdn.example" in compiled.header()
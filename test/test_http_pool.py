@@ -0,0 +1,73 @@
+import os
+import sys
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.http_pool import HttpPool, resolve_http_config
+
+
+class _EngineHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    statuses = []
+    peers = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        _EngineHandler.peers.append(self.client_address)
+        status = _EngineHandler.statuses.pop(0) if _EngineHandler.statuses else 200
+        body = json.dumps({"response": "ok"}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EngineHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/api/generate"
+
+
+def test_resolve_http_config_layers():
+    api_config = {
+        "http": {"read_timeout": 30, "retries": 1, "unknown": True},
+        "sources": {"ollama": {"http": {"read_timeout": 180}}, "grok": {}},
+    }
+    ollama = resolve_http_config(api_config, "ollama")
+    grok = resolve_http_config(api_config, "grok")
+
+    assert ollama["read_timeout"] == 180 and ollama["retries"] == 1
+    assert grok["read_timeout"] == 30
+    assert "unknown" not in grok
+    assert resolve_http_config({}, "missing")["connect_timeout"] == 5.0
+
+
+def test_http_pool_reuses_connection_and_retries():
+    server, url = _serve()
+    _EngineHandler.peers = []
+    _EngineHandler.statuses = [503]
+    delays = []
+    pool = HttpPool(sleep=delays.append)
+    config = resolve_http_config({"http": {"retries": 2}}, "ollama")
+    try:
+        first = pool.post("ollama", config, url, json={"prompt": "a"})
+        second = pool.post("ollama", config, url, json={"prompt": "b"})
+    finally:
+        pool.close()
+        server.shutdown()
+
+    assert first.status_code == 200 and second.json() == {"response": "ok"}
+    assert pool.stats["retries"] == 1 and len(delays) == 1
+    assert 0 <= delays[0] <= config["backoff_base"]
+    # 503 재시도와 이후 요청 모두 같은 keep-alive 연결(클라이언트 포트) 사용
+    assert len(_EngineHandler.peers) == 3
+    assert len(set(_EngineHandler.peers)) == 1
+    assert pool.stats["sessions"] == 1
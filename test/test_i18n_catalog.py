@@ -0,0 +1,84 @@
+import os
+import sys
+import json
+import time
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.i18n_catalog import I18nCatalog
+
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def test_i18n_catalog_merge_and_lookup(tmp_path):
+    i18n_dir = str(tmp_path / "i18n")
+    plugins_dir = str(tmp_path / "plugins")
+    _write_json(os.path.join(i18n_dir, "ko.json"), {"bot": {"hello": "안녕"}})
+    _write_json(
+        os.path.join(plugins_dir, "todo", "i18n.json"),
+        {"ko": {"views": {"empty": "비어 있음"}}, "en": {"views": {"empty": "Empty"}}},
+    )
+
+    catalog = I18nCatalog(i18n_dir=i18n_dir, plugins_dir=plugins_dir, check_interval=0)
+    pack = catalog.get_pack("ko")
+
+    assert pack["data"] == {"bot": {"hello": "안녕"}, "views": {"empty": "비어 있음"}}
+    assert json.loads(pack["json"]) == pack["data"]
+    assert catalog.lookup("bot.hello", "ko") == "안녕"
+    assert catalog.lookup("bot.missing", "ko") == "bot.missing"
+    assert catalog.lookup_plugin("todo", "views.empty", "en") == "Empty"
+    assert catalog.lookup_plugin("todo", "views", "ko") == {"empty": "비어 있음"}
+
+    # 동일 상태에서는 캐시 재사용
+    assert catalog.get_pack("ko") is pack
+
+
+def test_i18n_catalog_mtime_invalidation(tmp_path):
+    i18n_dir = str(tmp_path / "i18n")
+    plugins_dir = str(tmp_path / "plugins")
+    _write_json(os.path.join(i18n_dir, "en.json"), {"title": "Old"})
+
+    catalog = I18nCatalog(i18n_dir=i18n_dir, plugins_dir=plugins_dir, check_interval=0)
+    old_etag = catalog.get_pack("en")["etag"]
+
+    pack_path = os.path.join(i18n_dir, "en.json")
+    _write_json(pack_path, {"title": "New"})
+    os.utime(pack_path, ns=(time.time_ns(), time.time_ns() + 10**9))
+
+    assert catalog.lookup("title", "en") == "New"
+    assert catalog.get_pack("en")["etag"] != old_etag
+
+
+def test_plugin_lookup_falls_back_to_global_pack_and_bounds_langs(tmp_path):
+    i18n_dir = str(tmp_path / "i18n")
+    plugins_dir = str(tmp_path / "plugins")
+    _write_json(
+        os.path.join(i18n_dir, "ko.json"), {"common": {"cancel": "취소"}, "views": {"empty": "없음"}}
+    )
+    _write_json(os.path.join(i18n_dir, "en.json"), {"common": {"cancel": "Cancel"}})
+    _write_json(
+        os.path.join(plugins_dir, "todo", "i18n.json"), {"ko": {"views": {"empty": "할 일 없음"}}}
+    )
+
+    catalog = I18nCatalog(i18n_dir=i18n_dir, plugins_dir=plugins_dir, check_interval=0)
+    # 플러그인 키가 우선, 플러그인에 없는 공용 키는 전역 언어팩에서 조회
+    assert catalog.lookup_plugin("todo", "views.empty", "ko") == "할 일 없음"
+    assert catalog.lookup_plugin("todo", "common.cancel", "ko") == "취소"
+    assert catalog.lookup_plugin("todo", "common.cancel", "en") == "Cancel"
+    assert catalog.lookup_plugin("todo", "common.missing", "en") == "common.missing"
+
+    # 언어팩 파일이 없는 언어 코드는 기본 언어로 처리 (캐시 엔트리가 늘어나지 않음)
+    for lang in ("xx", "../ko", "fr-FR", None):
+        assert catalog.lookup("common.cancel", lang) == "취소"
+    assert sorted(catalog._packs) == ["en", "ko"]
+
+    # 알 수 없는 언어 코드도 재검증 주기 안에서는 플러그인 디렉토리를 다시 훑지 않음
+    cached = I18nCatalog(i18n_dir=i18n_dir, plugins_dir=plugins_dir, check_interval=60)
+    ko_pack = cached.get_pack("ko")
+    cached._plugin_i18n_paths = None  # 재스캔하면 TypeError
+    assert cached.get_pack("xx") is ko_pack
@@ -0,0 +1,139 @@
+import os
+import sys
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.plugin_registry import globals as registry_globals
+from services.plugin_registry import deferred_manager
+from services.plugin_registry.deferred_manager import (
+    register_deferred_plugin,
+    ensure_plugin_loaded,
+    ensure_plugins_loaded,
+    get_deferred_plugins,
+)
+from services.log_sink import log_sink
+
+
+@pytest.fixture(autouse=True)
+def debug_log_lines(monkeypatch):
+    """plugin_discovery의 web_debug.log 기록을 저장소 루트 파일 대신 메모리에 수집"""
+    lines = []
+    monkeypatch.setattr(log_sink, "log", lambda msg, level=None, source=None: lines.append(msg))
+    return lines
+
+
+def test_deferred_plugin_loads_once_on_first_use():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return "dispatcher"
+
+    register_deferred_plugin("lazy-demo", loader, aliases=["지연데모"])
+    assert registry_globals._context_aliases["지연데모"] == "lazy-demo"
+    assert get_deferred_plugins()["lazy-demo"]["loaded"] is False
+
+    assert ensure_plugin_loaded("lazy-demo") == "dispatcher"
+    ensure_plugins_loaded(["lazy-demo"])
+    assert len(calls) == 1
+    assert get_deferred_plugins()["lazy-demo"]["loaded"] is True
+
+    # 지연 대상이 아닌 플러그인은 무시
+    assert ensure_plugin_loaded("not-deferred") is None
+
+
+def test_deferred_plugin_failure_is_retried_after_backoff(monkeypatch):
+    calls = []
+    now = [1000.0]
+    monkeypatch.setattr(deferred_manager.time, "monotonic", lambda: now[0])
+
+    def loader():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ImportError("missing dependency")
+        return "dispatcher"
+
+    register_deferred_plugin("lazy-broken", loader)
+    assert ensure_plugin_loaded("lazy-broken") is None
+    state = get_deferred_plugins()["lazy-broken"]
+    assert state["loaded"] is False
+    assert "missing dependency" in state["error"]
+    assert state["retry_in"] == deferred_manager.LOAD_RETRY_BASE
+
+    # 대기 시간 안에는 재임포트하지 않음, 이후 재시도 (실패할 때마다 대기 2배)
+    assert ensure_plugin_loaded("lazy-broken") is None and len(calls) == 1
+    now[0] += deferred_manager.LOAD_RETRY_BASE
+    assert ensure_plugin_loaded("lazy-broken") is None and len(calls) == 2
+    retry_in = get_deferred_plugins()["lazy-broken"]["retry_in"]
+    assert retry_in == deferred_manager.LOAD_RETRY_BASE * 2
+    now[0] += deferred_manager.LOAD_RETRY_BASE * 2
+    assert ensure_plugin_loaded("lazy-broken") == "dispatcher"
+    assert get_deferred_plugins()["lazy-broken"] == {
+        "loaded": True,
+        "error": None,
+        "retry_in": None,
+    }
+
+
+def test_full_context_collection_loads_only_context_providers():
+    loaded = []
+    register_deferred_plugin(
+        "lazy-routes", lambda: loaded.append("routes"), context_provider=False
+    )
+    register_deferred_plugin("lazy-provider", lambda: loaded.append("provider"))
+
+    ensure_plugins_loaded(None)
+    assert loaded == ["provider"]
+    assert get_deferred_plugins()["lazy-routes"]["loaded"] is False
+
+    # 명시적으로 요청하면 공급자 여부와 무관하게 로드
+    ensure_plugins_loaded(["lazy-routes"])
+    assert loaded == ["provider", "routes"]
+
+
+ROUTER_SRC = """from flask import Blueprint, jsonify, request
+
+demo_bp = Blueprint("lazy_demo_router", __name__, url_prefix="/api/plugins/lazy-demo")
+
+
+@demo_bp.route("/items/<int:item_id>", methods=["GET", "POST"])
+def item(item_id):
+    return jsonify({"id": item_id, "method": request.method, "q": request.args.get("q")})
+"""
+
+
+def test_lazy_dispatcher_routes_requests_through_shadow_url_map(tmp_path):
+    import json
+    from flask import Flask
+    from services import plugin_discovery
+    from services.manifest_index import ManifestIndex
+
+    plugin_path = tmp_path / "lazy-http"
+    plugin_path.mkdir()
+    manifest = {
+        "id": "lazy-http",
+        "entry": {"backend": "router.py", "url_prefix": "/api/plugins/lazy-demo"},
+    }
+    (plugin_path / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    (plugin_path / "router.py").write_text(ROUTER_SRC, encoding="utf-8")
+    entry = ManifestIndex(plugins_dir=str(tmp_path), check_interval=0).get("lazy-http")
+    assert entry["context_provider"] is False
+
+    app = Flask(__name__)
+    app.register_blueprint(
+        plugin_discovery._make_lazy_blueprint(entry, "/api/plugins/lazy-demo")
+    )
+    client = app.test_client()
+    assert get_deferred_plugins()["lazy-http"]["loaded"] is False
+
+    # 첫 요청에서 모듈을 로드하고 실제 뷰 함수로 전달 (URL 변환기, 메서드, 쿼리 유지)
+    res = client.post("/api/plugins/lazy-demo/items/7?q=abc")
+    assert res.status_code == 200
+    assert res.get_json() == {"id": 7, "method": "POST", "q": "abc"}
+    assert get_deferred_plugins()["lazy-http"]["loaded"] is True
+
+    # 섀도 url_map에 없는 경로/메서드는 메인 앱의 404/405로 전파
+    assert client.get("/api/plugins/lazy-demo/unknown").status_code == 404
+    assert client.delete("/api/plugins/lazy-demo/items/7").status_code == 405
@@ -0,0 +1,47 @@
+import os
+import sys
+import json
+import logging
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.log_sink import DebugLogSink, client_log_level
+
+
+def test_log_sink_batches_and_flushes_on_stop(tmp_path):
+    log_path = str(tmp_path / "debug.log")
+    sink = DebugLogSink()
+    sink.configure({"path": log_path, "batch_size": 1000, "flush_interval": 60})
+
+    for i in range(5):
+        sink.log(f"line {i}", source="Test")
+    sink.stop()
+
+    with open(log_path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 5
+    assert lines[0].endswith("[INFO] [Test] line 0")
+
+
+def test_log_sink_json_lines_and_rotation(tmp_path):
+    log_path = str(tmp_path / "debug.jsonl")
+    sink = DebugLogSink()
+    sink.configure(
+        {"path": log_path, "json_lines": True, "max_bytes": 200, "backup_count": 2}
+    )
+
+    for i in range(20):
+        sink.log(f"message {i}", level=client_log_level("warn"), source="Client")
+    sink.stop()
+
+    assert os.path.exists(log_path + ".1")
+    with open(log_path, encoding="utf-8") as f:
+        last = json.loads(f.read().splitlines()[-1])
+    assert last == {
+        "ts": last["ts"],
+        "level": "WARNING",
+        "source": "Client",
+        "message": "message 19",
+    }
+    assert client_log_level("unknown") == logging.INFO
@@ -0,0 +1,91 @@
+import os
+import sys
+import json
+import time
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.manifest_index import ManifestIndex
+
+
+def _write_manifest(plugins_dir, plugin_id, manifest):
+    plugin_path = os.path.join(plugins_dir, plugin_id)
+    os.makedirs(plugin_path, exist_ok=True)
+    with open(os.path.join(plugin_path, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    return plugin_path
+
+
+def test_manifest_index_derived_data(tmp_path):
+    plugins_dir = str(tmp_path)
+    weather_path = _write_manifest(
+        plugins_dir,
+        "weather",
+        {
+            "id": "weather",
+            "permissions": ["api.ai_gateway"],
+            "csp_domains": {"img-src": ["https://b.example", "https://a.example"]},
+            "exports": {"sensors": [{"id": "temp", "name": "Temp"}]},
+            "aliases": ["날씨"],
+        },
+    )
+    open(os.path.join(weather_path, "config.json"), "w").close()
+    open(os.path.join(weather_path, "ai_prompt.md"), "w").close()
+    _write_manifest(plugins_dir, "system-stats", {"id": "system-stats"})
+
+    index = ManifestIndex(plugins_dir=plugins_dir, check_interval=0)
+
+    assert index.ids() == ["system-stats", "weather"]
+    assert index.has_permission("weather", "api.ai_gateway")
+    assert not index.has_permission("system-stats", "api.ai_gateway")
+    assert index.get_csp_domains()["img-src"] == [
+        "https://a.example",
+        "https://b.example",
+    ]
+    assert index.get_exports()["sensors"][0]["plugin_id"] == "weather"
+    assert index.get_aliases() == {"날씨": "weather"}
+    assert index.get_plugin_aliases("weather") == ["날씨"]
+    assert index.get_plugin_aliases("missing") == []
+    assert index.get("weather")["has_ai_prompt"] is True
+    assert index.find_config_path("weather").endswith("config.json")
+    assert index.find_config_path("system") is None
+
+
+def test_manifest_index_mtime_invalidation(tmp_path):
+    plugins_dir = str(tmp_path)
+    _write_manifest(plugins_dir, "todo", {"id": "todo", "permissions": []})
+
+    index = ManifestIndex(plugins_dir=plugins_dir, check_interval=0)
+    v1 = index.current_version()
+    assert not index.has_permission("todo", "api.io_control")
+
+    # 동일 상태 재검증 시 버전 유지
+    assert index.current_version() == v1
+
+    time.sleep(0.01)
+    _write_manifest(plugins_dir, "todo", {"id": "todo", "permissions": ["api.io_control"]})
+    manifest_path = os.path.join(plugins_dir, "todo", "manifest.json")
+    os.utime(manifest_path, ns=(time.time_ns(), time.time_ns() + 10**9))
+
+    assert index.has_permission("todo", "api.io_control")
+    assert index.current_version() > v1
+
+    # 플러그인 추가 감지
+    _write_manifest(plugins_dir, "alarm", {"id": "alarm"})
+    os.utime(plugins_dir, ns=(time.time_ns(), time.time_ns() + 2 * 10**9))
+    assert "alarm" in index.ids()
+
+
+def test_manifest_index_ignores_non_plugin_dirs(tmp_path):
+    plugins_dir = str(tmp_path)
+    _write_manifest(plugins_dir, "todo", {"id": "todo"})
+    os.makedirs(os.path.join(plugins_dir, "__pycache__"))
+
+    index = ManifestIndex(plugins_dir=plugins_dir, check_interval=0)
+    v1 = index.current_version()
+
+    # 매니페스트 없는 디렉토리가 있어도 변경 없는 트리는 버전 유지
+    assert index.current_version() == v1
+    assert index.current_version() == v1
+    assert index.ids() == ["todo"]
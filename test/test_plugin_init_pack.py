@@ -0,0 +1,105 @@
+import os
+import sys
+import gzip
+import json
+from collections import OrderedDict
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.plugin_bundler import get_plugin_init_pack_data, get_plugin_cache
+
+
+def test_init_pack_precompressed_variants():
+    get_plugin_init_pack_data(rebuild=True)
+    cache = get_plugin_cache()
+
+    assert len(cache["hash"]) == 64
+    assert gzip.decompress(cache["gzip"]).decode("utf-8") == cache["json"]
+    if cache["br"] is not None:
+        import brotli
+
+        assert brotli.decompress(cache["br"]).decode("utf-8") == cache["json"]
+    assert "plugins" in json.loads(cache["json"])
+
+
+def test_init_pack_delta_rebuilds_only_changed_segment(tmp_path, monkeypatch):
+    from services import plugin_bundler
+    from services.manifest_index import ManifestIndex
+
+    for plugin_id in ["alpha", "beta"]:
+        plugin_path = tmp_path / plugin_id
+        plugin_path.mkdir()
+        (plugin_path / "manifest.json").write_text(
+            json.dumps({"id": plugin_id, "entry": {"js": "widget.js"}}), encoding="utf-8"
+        )
+        (plugin_path / "widget.js").write_text(f"// {plugin_id}", encoding="utf-8")
+
+    monkeypatch.setattr(
+        plugin_bundler,
+        "manifest_index",
+        ManifestIndex(plugins_dir=str(tmp_path), check_interval=0),
+    )
+    monkeypatch.setattr(plugin_bundler, "_PLUGIN_SEGMENTS", {})
+    monkeypatch.setattr(plugin_bundler, "_PACK_HISTORY", OrderedDict())
+    monkeypatch.setattr(
+        plugin_bundler, "_PLUGIN_PACK_CACHE", dict.fromkeys(get_plugin_cache())
+    )
+
+    get_plugin_init_pack_data(rebuild=True)
+    old_hash = get_plugin_cache()["hash"]
+    assert plugin_bundler.refresh_plugin_segments() == []
+
+    widget = tmp_path / "beta" / "widget.js"
+    widget.write_text("// beta v2", encoding="utf-8")
+    stat = widget.stat()
+    os.utime(widget, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert plugin_bundler.refresh_plugin_segments() == ["beta"]
+    delta = plugin_bundler.get_plugin_pack_delta(old_hash)
+    assert delta["full"] is False
+    assert list(delta["changed"]) == ["beta"]
+    assert delta["changed"]["beta"]["bundle"]["js"] == "// beta v2"
+    assert delta["version"] == get_plugin_cache()["hash"] != old_hash
+
+    assert plugin_bundler.get_plugin_pack_delta("unknown")["full"] is True
+
+
+def test_rebuild_swaps_snapshot_instead_of_mutating_it(tmp_path, monkeypatch):
+    from services import plugin_bundler
+    from services.manifest_index import ManifestIndex
+
+    plugin_path = tmp_path / "alpha"
+    plugin_path.mkdir()
+    (plugin_path / "manifest.json").write_text(
+        json.dumps({"id": "alpha", "entry": {"js": "widget.js"}}), encoding="utf-8"
+    )
+    widget = plugin_path / "widget.js"
+    widget.write_text("// v1", encoding="utf-8")
+
+    monkeypatch.setattr(
+        plugin_bundler,
+        "manifest_index",
+        ManifestIndex(plugins_dir=str(tmp_path), check_interval=0),
+    )
+    monkeypatch.setattr(plugin_bundler, "_PLUGIN_SEGMENTS", {})
+    monkeypatch.setattr(plugin_bundler, "_PACK_HISTORY", OrderedDict())
+    monkeypatch.setattr(
+        plugin_bundler, "_PLUGIN_PACK_CACHE", dict.fromkeys(get_plugin_cache())
+    )
+
+    get_plugin_init_pack_data(rebuild=True)
+    served = get_plugin_cache()
+    old = dict(served)
+
+    # 요청이 스냅샷을 잡고 있는 동안 감시 스레드가 재빌드해도 ETag/본문 쌍은 그대로
+    widget.write_text("// v2", encoding="utf-8")
+    stat = widget.stat()
+    os.utime(widget, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert plugin_bundler.refresh_plugin_segments() == ["alpha"]
+
+    assert served == old
+    assert gzip.decompress(served["gzip"]).decode("utf-8") == served["json"]
+    current = get_plugin_cache()
+    assert current is not served and current["hash"] != served["hash"]
+    assert "// v2" in current["json"] and "// v2" not in served["json"]
@@ -0,0 +1,61 @@
+import os
+import sys
+import json
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import plugin_discovery
+from services.manifest_index import ManifestIndex
+from services.log_sink import log_sink
+
+ROUTER_SRC = """from flask import Blueprint
+{name}_bp = Blueprint("{name}_test_bp", __name__)
+"""
+
+
+@pytest.fixture(autouse=True)
+def debug_log_lines(monkeypatch):
+    """plugin_discovery의 web_debug.log 기록을 저장소 루트 파일 대신 메모리에 수집"""
+    lines = []
+    monkeypatch.setattr(log_sink, "log", lambda msg, level=None, source=None: lines.append(msg))
+    return lines
+
+
+def _make_plugin(plugins_dir, plugin_id, priority, source):
+    plugin_path = os.path.join(plugins_dir, plugin_id)
+    os.makedirs(plugin_path)
+    manifest = {"id": plugin_id, "priority": priority, "entry": {"backend": "router.py"}}
+    with open(os.path.join(plugin_path, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    with open(os.path.join(plugin_path, "router.py"), "w", encoding="utf-8") as f:
+        f.write(source)
+
+
+def test_parallel_discovery_keeps_priority_order(tmp_path, monkeypatch, debug_log_lines):
+    plugins_dir = str(tmp_path / "plugins")
+    os.makedirs(plugins_dir)
+    _make_plugin(plugins_dir, "zeta", 10, ROUTER_SRC.format(name="zeta"))
+    _make_plugin(plugins_dir, "alpha", 50, ROUTER_SRC.format(name="alpha"))
+    _make_plugin(plugins_dir, "broken", 20, "raise RuntimeError('boom')\n")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(plugin_discovery, "PLUGINS_DIR", plugins_dir)
+    monkeypatch.setattr(
+        plugin_discovery,
+        "manifest_index",
+        ManifestIndex(plugins_dir=plugins_dir, check_interval=0),
+    )
+
+    blueprints = plugin_discovery.discover_plugin_blueprints({"import_workers": 3})
+    assert [bp.name for bp in blueprints] == ["zeta_test_bp", "alpha_test_bp"]
+
+    report = plugin_discovery.get_startup_report()
+    assert report["loaded"] == ["zeta", "alpha"]
+    assert report["failed"] == ["broken"]
+    assert any("broken" in line for line in debug_log_lines)
+    assert [p["id"] for p in report["plugins"]] == ["zeta", "broken", "alpha"]
+    for profile in report["plugins"]:
+        assert profile["wall_ms"] >= 0
+        assert "import_ms" in profile and "rss_delta_kb" in profile
@@ -0,0 +1,56 @@
+import os
+import sys
+import time
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.prompt_compiler import PromptCompiler, estimate_tokens
+from services.plugin_registry import register_plugin_action
+
+
+def _write_prompts(prompts_dir):
+    prompts_dir.mkdir()
+    (prompts_dir / "01_persona.md").write_text("[PERSONA]\n당신은 AEGIS입니다.", encoding="utf-8")
+    (prompts_dir / "02_system_context.md").write_text(
+        "[SYSTEM CONTEXT]\n현재 시스템 시각: {current_time} ({tz_name})\n{role_context}",
+        encoding="utf-8",
+    )
+    (prompts_dir / "04_response_format.md").write_text("[RESPONSE FORMAT]", encoding="utf-8")
+
+
+def test_prompt_compiler_reuses_static_parts(tmp_path):
+    _write_prompts(tmp_path / "prompts")
+    compiler = PromptCompiler(str(tmp_path / "prompts"), str(tmp_path / "plugins"))
+
+    first = compiler.compile(lang="ko", tz_name="Asia/Seoul", extra_instruction="역할 A")
+    second = compiler.compile(lang="ko", tz_name="Asia/Seoul", extra_instruction="역할 A")
+    assert second is first
+    assert compiler.stats == {"compiled": 1, "reused": 1}
+
+    rendered = first.render("2026-10-18 09:15:07")
+    assert "현재 시스템 시각: 2026-10-18 09:15:07 (Asia/Seoul)" in rendered
+    assert "역할 A" in rendered and "한국어" in rendered
+    assert rendered.endswith("[RESPONSE FORMAT]\n")
+    assert first.tokens > 0 and set(first.section_tokens) >= {"persona", "actions"}
+
+    english = compiler.compile(lang="en", tz_name="Asia/Seoul", extra_instruction="역할 A")
+    assert english is not first and "RESPOND IN EN" in english.render("t")
+
+
+def test_prompt_compiler_invalidates_on_registry_and_file_change(tmp_path):
+    prompts_dir = tmp_path / "prompts"
+    _write_prompts(prompts_dir)
+    compiler = PromptCompiler(str(prompts_dir), str(tmp_path / "plugins"))
+    before = compiler.compile(lang="ko")
+
+    register_plugin_action("compiler-test", "ping", lambda: "pong", "핑 테스트")
+    after_action = compiler.compile(lang="ko")
+    assert after_action is not before
+    assert "[ACTION] COMPILER-TEST_PING" in after_action.render("t")
+
+    persona = prompts_dir / "01_persona.md"
+    persona.write_text("[PERSONA]\n새 페르소나", encoding="utf-8")
+    os.utime(persona, ns=(time.time_ns(), time.time_ns() + 10**9))
+    assert "새 페르소나" in compiler.compile(lang="ko").render("t")
+    assert estimate_tokens("hello world") < estimate_tokens("안녕하세요 세계")
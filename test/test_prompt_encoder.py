@@ -0,0 +1,172 @@
+import os
+import sys
+import json
+from datetime import datetime
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.prompt_encoder import (
+    encode_compact,
+    compact_processor,
+    render_context,
+    render_value,
+)
+from services.prompt_compiler import estimate_tokens
+from services.plugin_registry import register_context_provider, get_plugin_context_data
+
+FIXTURE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "fixtures", "prompt_context.json"
+)
+
+# 플러그인 router.py의 ai_processor 등록과 같은 설정 (weather는 압축 미적용 비교군)
+ENCODERS = {
+    "news": {"drop_keys": ("link", "timestamp")},
+    "gmail": {},
+    "calendar": {},
+    "stock": {"drop_keys": ("symbol", "raw_price", "raw_change", "direction")},
+    "finance": {"drop_keys": ("change_pct_raw", "direction")},
+}
+
+
+def _load_fixture():
+    with open(FIXTURE_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _measure(fixture):
+    """플러그인별 (기존 들여쓰기 JSON 토큰, 압축 인코딩 토큰)"""
+    report = {}
+    for plugin_id, value in fixture.items():
+        before = estimate_tokens(json.dumps(value, ensure_ascii=False, indent=2))
+        if plugin_id in ENCODERS:
+            encoded = encode_compact(value, **ENCODERS[plugin_id])
+        else:
+            encoded = value
+        report[plugin_id] = (before, estimate_tokens(render_value(encoded)))
+    return report
+
+
+def test_records_become_tables_without_empty_fields():
+    news = [
+        {"title": "금리 동결", "summary": "", "link": "https://a", "score": 0.12345},
+        {"title": "A|B 합병", "summary": "줄1\n줄2", "link": None, "score": 2.0},
+    ]
+    assert encode_compact(news, drop_keys=("link",)) == (
+        # 컬럼 순서는 값이 처음 채워진 순서 (빈 summary는 둘째 레코드에서 등장)
+        "title|score|summary\n금리 동결|0.12|\nA/B 합병|2|줄1 / 줄2"
+    )
+
+    # {이름: 레코드} 매핑은 이름 컬럼을 앞에 둔 표, 나머지는 key: value 줄
+    context = {
+        "indices": {"KOSPI": {"price": "2,611.30"}, "KOSDAQ": {"price": "742.18"}},
+        "alarm": {"next": "07:00", "snooze": None, "days": ["mon", "tue"], "tags": []},
+    }
+    assert encode_compact(context) == (
+        "indices: (2)\n  name|price\n  KOSPI|2,611.30\n  KOSDAQ|742.18\n"
+        "alarm:\n  next: 07:00\n  days: mon, tue"
+    )
+
+    # 압축 미적용 값은 공백 없는 JSON, 인코딩된 텍스트는 그대로 플러그인 섹션에 삽입
+    rendered = render_context({"weather": {"temp": "17°C"}, "stock": "name|price\nAAPL|231"})
+    assert rendered == '[weather]\n{"temp":"17°C"}\n\n[stock]\nname|price\nAAPL|231'
+
+
+def test_fixture_token_savings_and_ai_processor():
+    fixture = _load_fixture()
+    report = _measure(fixture)
+    before = sum(b for b, _ in report.values())
+    after = sum(a for _, a in report.values())
+    assert after < before * 0.7
+    for plugin_id in ENCODERS:
+        assert report[plugin_id][1] < report[plugin_id][0]
+
+    # 위젯(for_ai=False)은 원본 데이터, AI 질의는 압축 텍스트
+    def provider():
+        return fixture["stock"]
+
+    register_context_provider(
+        "test_encoder_stock",
+        provider,
+        ai_processor=compact_processor(provider, **ENCODERS["stock"]),
+    )
+    ids = ["test_encoder_stock"]
+    assert get_plugin_context_data(ids, for_ai=False)["test_encoder_stock"] == fixture["stock"]
+    encoded = get_plugin_context_data(ids, for_ai=True)["test_encoder_stock"]
+    assert encoded.splitlines()[:2] == [
+        "name|price|change|change_pct",
+        "005930.KS|72,400.00|+900.00|1.26",
+    ]
+
+
+def test_unserializable_cells_and_failing_providers():
+    # 표 셀 안의 중첩 값에 JSON 비호환 값(datetime 등)이 있어도 인코딩 실패로 컨텍스트를 잃지 않음
+    events = [
+        {"summary": "회의", "meta": {"at": datetime(2026, 10, 18, 9, 30)}},
+        {"summary": "점심", "meta": {"at": datetime(2026, 10, 18, 12, 0)}},
+    ]
+    assert encode_compact(events).splitlines() == [
+        "summary|meta",
+        '회의|{"at":"2026-10-18 09:30:00"}',
+        '점심|{"at":"2026-10-18 12:00:00"}',
+    ]
+
+    # 공급자가 실패하면 해당 플러그인만 오류 결과, 공급자의 오류 응답은 그대로 인코딩
+    def failing():
+        raise RuntimeError("quota exceeded")
+
+    def error_reply():
+        return {"status": "error", "message": "로그인 필요", "items": []}
+
+    register_context_provider(
+        "test_encoder_failing", failing, ai_processor=compact_processor(failing)
+    )
+    register_context_provider(
+        "test_encoder_error", error_reply, ai_processor=compact_processor(error_reply)
+    )
+    data = get_plugin_context_data(["test_encoder_failing", "test_encoder_error"], for_ai=True)
+    assert data["test_encoder_failing"] == {"status": "error", "message": "quota exceeded"}
+    assert data["test_encoder_error"] == "status: error\nmessage: 로그인 필요"
+    assert render_context(data).startswith(
+        '[test_encoder_failing]\n{"status":"error","message":"quota exceeded"}'
+    )
+
+
+def test_proactive_check_uses_raw_data_of_compact_providers():
+    from services.briefing_manager import BriefingManager
+    from services.data_service import DataService
+
+    fixture = _load_fixture()
+    provider = lambda: fixture["finance"]  # noqa: E731
+    register_context_provider(
+        "test_encoder_finance",
+        provider,
+        ai_processor=compact_processor(provider, **ENCODERS["finance"]),
+    )
+    collector = DataService()
+    for_ai = collector.collect_all_context(["test_encoder_finance"])
+    raw = collector.collect_all_context(["test_encoder_finance"], for_ai=False)
+    assert isinstance(for_ai["test_encoder_finance"], str)
+
+    manager = BriefingManager(None, None, None)
+    manager._generate_alert = lambda triggers: {"triggered": True, "triggers": triggers}
+    config = {"thresholds": {"finance_change_abs": 0.4}}
+
+    # AI용 압축 표가 전달돼도 점검이 실패하지 않음
+    assert manager.check_proactive(
+        {"finance": for_ai["test_encoder_finance"], "calendar": "summary | start"}, config
+    ) == {"triggered": False}
+    # 원본 데이터로는 임계값 알림이 발생
+    result = manager.check_proactive({"finance": raw["test_encoder_finance"]}, config)
+    assert result["triggered"] and any("KOSPI" in t for t in result["triggers"])
+
+
+if __name__ == "__main__":
+    # 토큰 절감 벤치마크: python test/test_prompt_encoder.py
+    report = _measure(_load_fixture())
+    print(f"{'plugin':<10}{'json':>8}{'compact':>9}{'saved':>8}")
+    for plugin_id, (before, after) in report.items():
+        print(f"{plugin_id:<10}{before:>8}{after:>9}{1 - after / before:>8.0%}")
+    before = sum(b for b, _ in report.values())
+    after = sum(a for _, a in report.values())
+    print(f"{'total':<10}{before:>8}{after:>9}{1 - after / before:>8.0%}")
@@ -0,0 +1,155 @@
+import os
+import sys
+import threading
+import pytest
+from concurrent.futures import TimeoutError as FutureTimeout
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.single_flight import SingleFlight, fingerprint
+
+
+def test_concurrent_calls_share_leader_result():
+    flight = SingleFlight(wait_timeout=5)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def generate(topic):
+        calls.append(topic)
+        started.set()
+        release.wait(5)
+        return {"briefing": f"{topic} 요약"}
+
+    results = [None] * 4
+
+    def worker(i):
+        results[i] = flight.do_ex(("briefing", "tactical"), generate, "tactical")
+
+    leader = threading.Thread(target=worker, args=(0,))
+    leader.start()
+    assert started.wait(5)
+    followers = [threading.Thread(target=worker, args=(i,)) for i in range(1, 4)]
+    for t in followers:
+        t.start()
+    # follower가 모두 in-flight 호출에 합류한 뒤 leader 완료
+    while flight.get_stats()["shared"] < 3:
+        threading.Event().wait(0.01)
+    release.set()
+    for t in [leader] + followers:
+        t.join(5)
+
+    assert calls == ["tactical"]
+    assert [shared for _, shared in results] == [False, True, True, True]
+    assert all(result is results[0][0] for result, _ in results)
+    assert flight.get_stats() == {"leaders": 1, "shared": 3, "in_flight": 0}
+
+    # 완료 후의 호출은 새로 실행 (결과 캐시가 아님)
+    assert flight.do(("briefing", "tactical"), lambda: "fresh") == "fresh"
+    assert fingerprint({"b": 1, "a": [1, 2]}) == fingerprint({"a": [1, 2], "b": 1})
+
+
+def test_leader_exception_propagates_and_releases_key():
+    flight = SingleFlight(wait_timeout=5)
+    started = threading.Event()
+    release = threading.Event()
+    errors = []
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise RuntimeError("tts failed")
+
+    def worker():
+        try:
+            flight.do("last_briefing.mp3", failing)
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=worker)
+    leader.start()
+    assert started.wait(5)
+    follower = threading.Thread(target=worker)
+    follower.start()
+    while flight.get_stats()["shared"] < 1:
+        threading.Event().wait(0.01)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert errors == ["tts failed", "tts failed"]
+    assert flight.in_flight() == 0
+    assert flight.do("last_briefing.mp3", lambda: True) is True
+
+
+def test_follower_gives_up_after_wait_timeout_without_stealing_key():
+    flight = SingleFlight(wait_timeout=0.1)
+    started = threading.Event()
+    release = threading.Event()
+    results = []
+
+    def stuck():
+        started.set()
+        release.wait(5)
+        return "late"
+
+    leader = threading.Thread(target=lambda: results.append(flight.do("context", stuck)))
+    leader.start()
+    assert started.wait(5)
+
+    # 멈춘 leader를 기다리던 follower는 wait_timeout 후 예외, 직접 재실행하지 않음
+    calls = []
+    with pytest.raises(FutureTimeout):
+        flight.do("context", lambda: calls.append("follower"))
+    assert calls == [] and flight.in_flight() == 1
+
+    # leader 완료 후 키가 해제되어 다음 호출은 새로 실행
+    release.set()
+    leader.join(5)
+    assert results == ["late"]
+    assert flight.do("context", lambda: "fresh") == "fresh"
+    assert flight.get_stats() == {"leaders": 2, "shared": 1, "in_flight": 0}
+
+
+def test_different_tts_requests_write_the_same_file_one_at_a_time(tmp_path, monkeypatch):
+    import time
+    from types import SimpleNamespace
+    from services import voice_service
+
+    writers = {"active": 0, "max": 0}
+
+    class FakeCommunicate:
+        def __init__(self, text, voice, **kwargs):
+            self.text = text
+
+        async def save(self, path):
+            writers["active"] += 1
+            writers["max"] = max(writers["max"], writers["active"])
+            with open(path, "w", encoding="utf-8") as f:
+                for char in self.text:
+                    f.write(char)
+                    time.sleep(0.002)
+            writers["active"] -= 1
+
+    monkeypatch.setattr(voice_service, "edge_tts", SimpleNamespace(Communicate=FakeCommunicate))
+    settings = {"voice": "v", "pitch": "+0Hz", "rate": "+0%", "volume": "+0%"}
+    output_path = str(tmp_path / "last_briefing.mp3")
+    texts = ["briefing " * 10, "alert " * 10]
+
+    # 브리핑과 선제 알림처럼 내용이 다른 합성도 같은 파일에는 순서대로 완성본만 기록
+    threads = [
+        threading.Thread(
+            target=voice_service.generate_edge_tts, args=(text, None, output_path, settings)
+        )
+        for text in texts
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+
+    assert writers["max"] == 1
+    with open(output_path, encoding="utf-8") as f:
+        assert f.read() in texts
+    assert os.listdir(tmp_path) == ["last_briefing.mp3"]
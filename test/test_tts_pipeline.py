@@ -0,0 +1,95 @@
+import os
+import sys
+import time
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.tts_pipeline import TtsPipeline, split_sentences
+
+
+def _fake_tts(text, prefix="tts"):
+    # 완료 순서를 뒤섞어도 발행 순서가 유지되는지 확인
+    time.sleep(random.uniform(0, 0.02))
+    return f"/static/audio/tts_cache/{prefix}_{len(text)}.mp3"
+
+
+def test_split_sentences_merges_short_fragments():
+    text = "네. 오늘 서울은 맑습니다! 최고 기온은 22도입니다.\n우산은 필요 없어요"
+    assert split_sentences(text) == [
+        "네. 오늘 서울은 맑습니다!",
+        "최고 기온은 22도입니다.",
+        "우산은 필요 없어요",
+    ]
+
+
+def test_tts_pipeline_emits_ordered_segments_while_streaming():
+    events = []
+    pipeline = TtsPipeline(
+        events.append,
+        stream_id="s1",
+        synthesize=_fake_tts,
+        executor=ThreadPoolExecutor(max_workers=4),
+    )
+    chunks = [
+        "[DISPLAY] **맑음**\n",
+        "[VOICE] 오늘 서울은 맑습니다. 최고 기온은",
+        " 22도입니다. 외출하기 좋은 날이에요! 즐거운",
+        " 하루 보내세요\n[ACT",
+        "ION] WEATHER_SHOW: 서울",
+    ]
+    for chunk in chunks[:3]:
+        pipeline.feed(chunk)
+    # 스트림이 끝나기 전에 이미 문장 합성이 시작됨
+    assert len(pipeline._segments) == 3
+
+    for chunk in chunks[3:]:
+        pipeline.feed(chunk)
+    playlist = pipeline.close("무시되는 최종 텍스트")
+
+    segments = [e for e in events if not e["final"]]
+    assert [e["index"] for e in segments] == [0, 1, 2, 3]
+    assert segments[-1]["text"] == "즐거운 하루 보내세요"
+    assert events[-1]["final"] and events[-1]["index"] == 4
+    assert playlist == [e["audio_url"] for e in segments]
+
+    # [VOICE] 태그 없이 끝난 응답은 최종 파싱된 음성 텍스트로 합성
+    fallback = TtsPipeline(
+        events.append,
+        stream_id="s2",
+        synthesize=_fake_tts,
+        executor=ThreadPoolExecutor(max_workers=2),
+    )
+    fallback.feed("[VOICE 태그 없는 응답")
+    assert len(fallback.close("첫 문장입니다. 두 번째 문장입니다.")) == 2
+
+
+def test_cancelled_pipeline_drops_pending_segments_and_marks_error():
+    import threading
+
+    release = threading.Event()
+    events = []
+
+    def slow_tts(text, prefix="tts"):
+        release.wait(5)
+        return f"/static/audio/tts_cache/{prefix}_{len(text)}.mp3"
+
+    pipeline = TtsPipeline(
+        events.append,
+        stream_id="s3",
+        synthesize=slow_tts,
+        executor=ThreadPoolExecutor(max_workers=1),
+    )
+    pipeline.feed("[VOICE] 첫 번째 문장입니다. 두 번째 문장입니다. 세 번째")
+    pipeline.cancel()
+    release.set()
+    time.sleep(0.05)
+
+    # 실패한 응답의 세그먼트는 발행하지 않고 error 표시가 붙은 종료 마커만 전송
+    assert events == [
+        {"stream_id": "s3", "index": 0, "text": "", "audio_url": None, "final": True, "error": True}
+    ]
+    pipeline.cancel()
+    assert pipeline.close() == [] and len(events) == 1
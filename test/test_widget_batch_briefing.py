@@ -0,0 +1,106 @@
+import os
+import sys
+import json
+from types import SimpleNamespace
+
+# 프로젝트 루트를 path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import gemini_service
+from services.ai_response_cache import AIResponseCache
+
+
+class FakeModels:
+    """generate_content 호출을 기록하고 스키마별 응답을 돌려주는 가짜 Gemini 모델"""
+
+    def __init__(self, batch_widgets):
+        self.batch_widgets = batch_widgets
+        self.calls = []
+
+    def generate_content(self, model, contents, config):
+        self.calls.append((contents, config["response_schema"]))
+        if config["response_schema"] is gemini_service.WIDGET_BATCH_SCHEMA:
+            items = [
+                {"widget": w, "briefing": f"{w} 요약", "voice": f"{w} 음성", "sentiment": "neutral"}
+                for w in self.batch_widgets
+            ]
+            parsed = {"widgets": items}
+        else:
+            parsed = {"briefing": "단건 요약", "voice": "단건 음성", "sentiment": "happy"}
+        return SimpleNamespace(parsed=parsed, text=json.dumps(parsed))
+
+
+def _setup(monkeypatch, batch_widgets):
+    models = FakeModels(batch_widgets)
+    cache = AIResponseCache()
+    monkeypatch.setattr(gemini_service.ai_base, "client", SimpleNamespace(models=models))
+    monkeypatch.setattr(
+        gemini_service, "types", SimpleNamespace(GenerateContentConfig=lambda **kw: kw)
+    )
+    monkeypatch.setattr(gemini_service, "_get_lang", lambda: "ko")
+    monkeypatch.setattr(gemini_service, "_load_plugin_prompt", lambda pid, task: None)
+    monkeypatch.setattr(gemini_service, "get_response_cache", lambda: cache)
+    return models
+
+
+def test_batch_uses_single_request_and_splits_per_widget(monkeypatch):
+    models = _setup(monkeypatch, ["weather", "finance", "news"])
+    items = [
+        ("weather", {"temp": 21}),
+        ("finance", {"KOSPI": {"change_percent": 0.4}}),
+        ("news", [{"title": "헤드라인"}]),
+    ]
+
+    results = gemini_service.get_widget_briefings("key", items)
+
+    assert len(models.calls) == 1
+    prompt = models.calls[0][0]
+    assert all(f"[WIDGET: {w}]" in prompt for w, _ in items)
+    assert list(results) == ["weather", "finance", "news"]
+    assert results["finance"] == {"display": "finance 요약", "voice": "finance 음성", "sentiment": "neutral"}
+
+    # 위젯별 결과는 단건 요청과 캐시를 공유
+    assert gemini_service.get_widget_briefing("key", "news", [{"title": "헤드라인"}])["voice"] == "news 음성"
+    assert len(models.calls) == 1
+
+
+def test_missing_batch_entries_fall_back_to_single_requests(monkeypatch):
+    models = _setup(monkeypatch, ["weather"])
+    results = gemini_service.get_widget_briefings(
+        "key", [("weather", {"temp": 21}), ("gmail", {"unread": 3})]
+    )
+
+    schemas = [schema for _, schema in models.calls]
+    assert schemas == [gemini_service.WIDGET_BATCH_SCHEMA, gemini_service.BRIEFING_SCHEMA]
+    assert results["weather"]["voice"] == "weather 음성"
+    assert results["gmail"] == {"display": "단건 요약", "voice": "단건 음성", "sentiment": "happy"}
+
+
+def test_batch_failure_falls_back_and_does_not_cache_errors(monkeypatch):
+    models = _setup(monkeypatch, ["weather", "gmail"])
+    real_generate = models.generate_content
+    failures = {"batch": 1, "single": 1}
+
+    def flaky_generate(model, contents, config):
+        batch = config["response_schema"] is gemini_service.WIDGET_BATCH_SCHEMA
+        kind = "batch" if batch else "single"
+        if failures[kind]:
+            failures[kind] -= 1
+            models.calls.append((contents, config["response_schema"]))
+            raise RuntimeError("503 UNAVAILABLE")
+        return real_generate(model, contents, config)
+
+    monkeypatch.setattr(models, "generate_content", flaky_generate)
+    items = [("weather", {"temp": 21}), ("gmail", {"unread": 3})]
+
+    # 배치 요청 자체가 실패하면 모든 위젯을 단건 요청으로 보완 (단건 실패는 오류 결과)
+    results = gemini_service.get_widget_briefings("key", items)
+    schemas = [schema for _, schema in models.calls]
+    assert schemas == [gemini_service.WIDGET_BATCH_SCHEMA] + [gemini_service.BRIEFING_SCHEMA] * 2
+    assert results["weather"]["display"] == "Error"
+    assert results["gmail"]["display"] == "단건 요약"
+
+    # 오류 결과는 캐시하지 않으므로 다음 호출에서 실패한 위젯만 다시 요청
+    results = gemini_service.get_widget_briefings("key", items)
+    assert len(models.calls) == 4 and models.calls[-1][1] is gemini_service.BRIEFING_SCHEMA
+    assert results["weather"]["display"] == "단건 요약"